@@ -0,0 +1,296 @@
+"""
+Benchmark harness for the recommendation engine.
+Generates seeded synthetic event datasets (1k to 1M rows) in the scraped CSV schema, times
+loading, preparation, each filter, scoring and the full flexible ranking over a preference
+matrix, and writes JSON results that can be compared between commits.
+
+    python benchmark_recommend.py --rows 1000 10000 100000 --output before.json
+    python benchmark_recommend.py --rows 1000 10000 100000 --compare before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+from config import DATA_DIR
+from event_store import HAS_PYARROW, build_typed_frame, read_event_store
+from main import _ensure_schema
+from recommend import (
+    UserPreferences,
+    _prepare_candidates,
+    build_event_index,
+    filter_by_event_date,
+    filter_by_price,
+    filter_by_time_period,
+    score_candidates,
+    select_ranked_candidates_with_flexible_filters,
+)
+from utils import current_git_commit
+
+DEFAULT_ROWS = [1_000, 10_000, 100_000]
+DEFAULT_OUTPUT = DATA_DIR / "benchmarks" / "recommend.json"
+# A stage is reported as a regression when its median is this many times the baseline's.
+DEFAULT_REGRESSION_THRESHOLD = 1.25
+
+SYNTHETIC_START_DATE = pd.Timestamp("2026-03-01")
+SYNTHETIC_DAYS = 30
+# Share of rows that repeat an earlier listing (exact or case-variant), as with overlapping scrapes.
+SYNTHETIC_DUPLICATE_RATE = 0.08
+
+_NAME_WORDS = [
+    "Jazz", "Trivia", "Open Mic", "Comedy", "Yoga", "Art Walk", "Brunch", "Karaoke",
+    "Drag Show", "Book Club", "Film Night", "Craft Fair", "DJ Set", "Salsa", "Run Club",
+]
+_NAME_SUFFIXES = ["Night", "Session", "Showcase", "Live", "Social", "Meetup", "Party", "Tour"]
+_VENUES = [
+    "Club Cafe", "Stage AE", "Mr. Smalls Theatre", "Thunderbird Cafe", "The Government Center",
+    "Jergel's Rhythm Grille", "Crafthouse Stage & Grill", "Moondogs", "Spirit", "Bottlerocket",
+    "City Winery", "Roxian Theatre", "Carnegie Library", "Point State Park", "The Andy Warhol Museum",
+]
+_SOURCES = ["pgh.events", "Eventbrite"]
+
+PREFERENCE_MATRIX = {
+    "budget": [0.0, 25.0, 75.0],
+    "preferred_period": ["any", "evening"],
+    "event_date": [None, "2026-03-10"],
+    "allow_flexible_dates": [False, True],
+    "max_results": [3, 50],
+}
+
+
+def _price_strings(rng: np.random.Generator, rows: int) -> tuple[list[str], list[str]]:
+    low = np.round(rng.gamma(2.0, 12.0, rows) + 5, 2)
+    high = np.round(low + rng.gamma(1.5, 10.0, rows), 2)
+    kinds = rng.choice(["free", "na", "single", "range", "whole"], rows, p=[0.15, 0.25, 0.3, 0.22, 0.08])
+    prices: list[str] = []
+    max_prices: list[str] = []
+    for kind, low_price, high_price in zip(kinds.tolist(), low.tolist(), high.tolist()):
+        if kind == "free":
+            prices.append("Free")
+            max_prices.append("Free")
+        elif kind == "na":
+            prices.append("N/A")
+            max_prices.append("N/A")
+        elif kind == "range":
+            prices.append(f"${low_price:.2f} - ${high_price:.2f}")
+            max_prices.append(f"{high_price:.2f}")
+        elif kind == "whole":
+            prices.append(f"${int(low_price)}")
+            max_prices.append(f"{int(low_price)}")
+        else:
+            prices.append(f"${low_price:.2f}")
+            max_prices.append(f"{low_price:.2f}")
+    return prices, max_prices
+
+
+def _time_strings(rng: np.random.Generator, rows: int) -> list[str]:
+    hours = rng.integers(7, 23, rows).tolist()
+    minutes = rng.choice([0, 0, 0, 30, 15, 45], rows).tolist()
+    missing = rng.choice(["", "N/A", "ok"], rows, p=[0.02, 0.05, 0.93]).tolist()
+    return [
+        f"{(hour - 1) % 12 + 1:02d}:{minute:02d} {'AM' if hour < 12 else 'PM'}" if flag == "ok" else flag
+        for hour, minute, flag in zip(hours, minutes, missing)
+    ]
+
+
+def generate_events(rows: int, seed: int = 7) -> pd.DataFrame:
+    """Synthetic events in the scraped CSV schema (same columns as data/pittsburgh_events.csv)."""
+    rng = np.random.default_rng(seed)
+    unique_rows = max(1, int(round(rows / (1 + SYNTHETIC_DUPLICATE_RATE))))
+
+    words = rng.choice(_NAME_WORDS, unique_rows).tolist()
+    suffixes = rng.choice(_NAME_SUFFIXES, unique_rows).tolist()
+    numbers = rng.integers(1, 500, unique_rows).tolist()
+    names = [f"{word} {suffix} #{number}" for word, suffix, number in zip(words, suffixes, numbers)]
+
+    days = SYNTHETIC_START_DATE + pd.to_timedelta(rng.integers(0, SYNTHETIC_DAYS, unique_rows), unit="D")
+    dates = np.where(rng.random(unique_rows) < 0.02, "", days.strftime("%Y-%m-%d").to_numpy(dtype=str))
+    prices, max_prices = _price_strings(rng, unique_rows)
+    sources = rng.choice(_SOURCES, unique_rows, p=[0.6, 0.4])
+
+    df = pd.DataFrame(
+        {
+            "event_name": names,
+            "date": dates,
+            "time": _time_strings(rng, unique_rows),
+            "location": rng.choice(_VENUES, unique_rows),
+            "price": prices,
+            "source": sources,
+            "url": [f"https://example.com/events/{number}" for number in range(unique_rows)],
+            "max_price": max_prices,
+        }
+    )
+
+    duplicates = df.iloc[rng.integers(0, unique_rows, rows - unique_rows)].copy()
+    # Half of the repeats differ only in case, which the recommendation dedupe key folds together.
+    case_variant = rng.random(len(duplicates)) < 0.5
+    duplicates.loc[case_variant, "event_name"] = duplicates.loc[case_variant, "event_name"].str.lower()
+    combined = pd.concat([df, duplicates], ignore_index=True)
+    return combined.iloc[rng.permutation(len(combined))].reset_index(drop=True)
+
+
+def _time_call(function: Callable[[], Any], repeat: int) -> dict[str, float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - started)
+    return {
+        "min_seconds": round(min(samples), 6),
+        "median_seconds": round(statistics.median(samples), 6),
+        "repeat": repeat,
+    }
+
+
+def _preference_grid() -> list[UserPreferences]:
+    keys = list(PREFERENCE_MATRIX)
+    return [
+        UserPreferences(**dict(zip(keys, values)))
+        for values in itertools.product(*(PREFERENCE_MATRIX[key] for key in keys))
+    ]
+
+
+def _preference_label(prefs: UserPreferences) -> str:
+    return (
+        f"budget={prefs.budget:g},period={prefs.preferred_period},date={prefs.event_date or 'any'},"
+        f"flexible={int(prefs.allow_flexible_dates)},max_results={prefs.max_results}"
+    )
+
+
+def benchmark_rows(rows: int, seed: int, repeat: int, workdir: Path) -> list[dict[str, Any]]:
+    results: list[dict[str, Any]] = []
+
+    def record(stage: str, function: Callable[[], Any], prefs: str = "", times: int = repeat) -> None:
+        results.append({"rows": rows, "stage": stage, "preferences": prefs, **_time_call(function, times)})
+
+    raw = generate_events(rows, seed)
+    csv_path = workdir / f"events_{rows}.csv"
+    raw.to_csv(csv_path, index=False)
+
+    record("load_csv", lambda: _ensure_schema(pd.read_csv(csv_path)))
+    df = _ensure_schema(pd.read_csv(csv_path))
+    if HAS_PYARROW:
+        store_path = workdir / f"events_{rows}.parquet"
+        record("build_store", lambda: build_typed_frame(csv_path).to_parquet(store_path, index=False), times=1)
+        record("load_store", lambda: _ensure_schema(read_event_store(store_path)))
+
+    record("prepare_candidates", lambda: _prepare_candidates(df))
+    record("build_event_index", lambda: build_event_index(df))
+    prepared = _prepare_candidates(df)
+    index = build_event_index(df)
+
+    record("filter_by_price", lambda: filter_by_price(prepared, min_price=0.0, max_price=25.0))
+    record("filter_by_time_period", lambda: filter_by_time_period(prepared, "evening"))
+    record("filter_by_event_date", lambda: filter_by_event_date(prepared, "2026-03-10"))
+    record("filter_by_event_date_indexed", lambda: filter_by_event_date(index, "2026-03-10"))
+
+    for prefs in _preference_grid():
+        label = _preference_label(prefs)
+        record("score_candidates", lambda: score_candidates(index, prefs), label)
+        record("flexible_ranking", lambda: select_ranked_candidates_with_flexible_filters(index, prefs), label)
+    return results
+
+
+def run_benchmarks(rows: list[int], seed: int, repeat: int) -> dict[str, Any]:
+    results: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="event-bench-") as tmp:
+        for row_count in rows:
+            print(f"Benchmarking {row_count} rows...")
+            results.extend(benchmark_rows(row_count, seed, repeat, Path(tmp)))
+    return {
+        "meta": {
+            "commit": current_git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "seed": seed,
+            "repeat": repeat,
+            "rows": rows,
+        },
+        "results": results,
+    }
+
+
+def _result_key(result: dict[str, Any]) -> tuple[int, str, str]:
+    return result["rows"], result["stage"], result["preferences"]
+
+
+def compare_results(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> list[dict[str, Any]]:
+    """Stages whose median time grew by more than `threshold`x against the baseline run."""
+    baseline_by_key = {_result_key(result): result for result in baseline.get("results", [])}
+    regressions = []
+    for result in current["results"]:
+        previous = baseline_by_key.get(_result_key(result))
+        if previous is None or previous["median_seconds"] <= 0:
+            continue
+        ratio = result["median_seconds"] / previous["median_seconds"]
+        if ratio > threshold:
+            regressions.append({**result, "baseline_median_seconds": previous["median_seconds"], "ratio": round(ratio, 3)})
+    return regressions
+
+
+def _print_summary(report: dict[str, Any]) -> None:
+    # Ranking/scoring rows collapse to their median across the preference matrix.
+    grouped: dict[tuple[int, str], list[float]] = {}
+    for result in report["results"]:
+        grouped.setdefault((result["rows"], result["stage"]), []).append(result["median_seconds"])
+    print(f"\n{'rows':>9}  {'stage':<30} {'median ms':>10}")
+    for (rows, stage), medians in grouped.items():
+        print(f"{rows:>9}  {stage:<30} {statistics.median(medians) * 1000:>10.3f}")
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the recommendation engine on synthetic data.")
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS, help="Dataset sizes (e.g. 1000 1000000).")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per stage (min and median are kept).")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Where to write the JSON results.")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON from an earlier run to check for regressions.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    report = run_benchmarks(args.rows, args.seed, max(1, args.repeat))
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    _print_summary(report)
+    print(f"\nWrote {len(report['results'])} results to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare_results(report, baseline, args.threshold)
+        for regression in regressions:
+            print(
+                f"REGRESSION rows={regression['rows']} {regression['stage']} {regression['preferences']}: "
+                f"{regression['baseline_median_seconds'] * 1000:.3f} ms -> "
+                f"{regression['median_seconds'] * 1000:.3f} ms (x{regression['ratio']})"
+            )
+        print(f"{len(regressions)} regression(s) against {args.compare} (threshold x{args.threshold}).")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,321 @@
+"""
+Offline benchmark for the scraper parsers.
+Replays recorded listing/detail HTML from a fixtures directory through the real parsing
+code in data_collection.py (no network) and reports per-page parse time, time per
+BeautifulSoup selector and events per second.
+
+Fixture layout (one HTML file per page; a minimal set is committed under fixtures/html and
+every kind must have at least one page):
+    <fixtures>/pgh_listing/*.html         pgh.events listing pages
+    <fixtures>/pgh_detail/*.html          pgh.events event pages (price lookup)
+    <fixtures>/eventbrite_listing/*.html  Eventbrite search result pages
+    <fixtures>/eventbrite_detail/*.html   Eventbrite event pages
+
+    python benchmark_scrape.py --export-cache          # fixtures from data/http_cache
+    python benchmark_scrape.py --parser lxml --compare before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator
+from urllib.parse import urlsplit
+
+import bs4
+from bs4.element import Tag
+
+import data_collection
+from config import DATA_DIR, HTTP_CACHE_DIR, PROJECT_ROOT
+from utils import current_git_commit
+
+DEFAULT_FIXTURES_DIR = PROJECT_ROOT / "fixtures" / "html"
+DEFAULT_OUTPUT = DATA_DIR / "benchmarks" / "scrape.json"
+DEFAULT_REGRESSION_THRESHOLD = 1.25
+
+
+def _pgh_listing(html: str, path: Path) -> int:
+    return len(data_collection.parse_pgh_listing(html)[1])
+
+
+def _pgh_detail(html: str, path: Path) -> int:
+    data_collection.parse_pgh_event_price(html)
+    return 1
+
+
+def _eventbrite_listing(html: str, path: Path) -> int:
+    return len(data_collection.parse_eventbrite_listing(html))
+
+
+def _eventbrite_detail(html: str, path: Path) -> int:
+    data_collection.parse_eventbrite_detail(html, f"https://www.eventbrite.com/e/{path.stem}")
+    return 1
+
+
+# Fixture kind -> parser; each returns how many events (or event URLs) the page yielded.
+FIXTURE_PARSERS: dict[str, Callable[[str, Path], int]] = {
+    "pgh_listing": _pgh_listing,
+    "pgh_detail": _pgh_detail,
+    "eventbrite_listing": _eventbrite_listing,
+    "eventbrite_detail": _eventbrite_detail,
+}
+
+# Eventbrite field extractors timed on their own, on an already-parsed detail page.
+FIELD_PARSERS: dict[str, Callable[[Any, str], Any]] = {
+    "parse_eventbrite_datetime": data_collection.parse_eventbrite_datetime,
+    "parse_eventbrite_location": lambda soup, html: data_collection.parse_eventbrite_location(soup),
+    "parse_eventbrite_price": data_collection.parse_eventbrite_price,
+}
+
+
+class SelectorTimer:
+    """Accumulates wall time per CSS selector across Tag.select/select_one calls."""
+
+    def __init__(self) -> None:
+        self.totals: dict[str, list[float]] = {}
+        self._local = threading.local()
+
+    def _wrap(self, method: Callable[..., Any]) -> Callable[..., Any]:
+        timer = self
+
+        def timed(tag: Tag, selector: str, *args: Any, **kwargs: Any) -> Any:
+            # Only the outermost call is timed, so nested selects are not double counted.
+            if getattr(timer._local, "active", False):
+                return method(tag, selector, *args, **kwargs)
+            timer._local.active = True
+            started = time.perf_counter()
+            try:
+                return method(tag, selector, *args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                timer._local.active = False
+                entry = timer.totals.setdefault(selector, [0, 0.0])
+                entry[0] += 1
+                entry[1] += elapsed
+
+        return timed
+
+    @contextmanager
+    def installed(self) -> Iterator["SelectorTimer"]:
+        original_select, original_select_one = Tag.select, Tag.select_one
+        Tag.select = self._wrap(original_select)
+        Tag.select_one = self._wrap(original_select_one)
+        try:
+            yield self
+        finally:
+            Tag.select, Tag.select_one = original_select, original_select_one
+
+    def report(self) -> list[dict[str, Any]]:
+        rows = [
+            {
+                "selector": selector,
+                "calls": calls,
+                "total_seconds": round(total, 6),
+                "mean_microseconds": round(total / calls * 1e6, 2),
+            }
+            for selector, (calls, total) in self.totals.items()
+        ]
+        return sorted(rows, key=lambda row: row["total_seconds"], reverse=True)
+
+
+def _timed(function: Callable[[], Any], repeat: int) -> tuple[Any, list[float]]:
+    samples = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        samples.append(time.perf_counter() - started)
+    return result, samples
+
+
+def _fixture_files(fixtures_dir: Path) -> dict[str, list[Path]]:
+    return {
+        kind: sorted((fixtures_dir / kind).glob("*.html"))
+        for kind in FIXTURE_PARSERS
+        if (fixtures_dir / kind).is_dir()
+    }
+
+
+def run_benchmark(fixtures_dir: Path, repeat: int) -> dict[str, Any]:
+    pages: list[dict[str, Any]] = []
+    fields: dict[str, list[float]] = {name: [] for name in FIELD_PARSERS}
+    selectors = SelectorTimer()
+    files = _fixture_files(fixtures_dir)
+
+    for kind, paths in files.items():
+        parse = FIXTURE_PARSERS[kind]
+        for path in paths:
+            html = path.read_text(encoding="utf-8", errors="replace")
+            # Page timings exclude the selector hooks; a separate single pass collects selector times.
+            events, samples = _timed(lambda: parse(html, path), repeat)
+            with selectors.installed():
+                parse(html, path)
+            pages.append(
+                {
+                    "kind": kind,
+                    "file": path.name,
+                    "bytes": len(html.encode("utf-8")),
+                    "events": events,
+                    "min_seconds": round(min(samples), 6),
+                    "median_seconds": round(statistics.median(samples), 6),
+                }
+            )
+            if kind == "eventbrite_detail":
+                soup = data_collection.make_soup(html)
+                for name, field_parser in FIELD_PARSERS.items():
+                    _, field_samples = _timed(lambda: field_parser(soup, html), repeat)
+                    fields[name].append(statistics.median(field_samples))
+
+    kinds = {}
+    for kind in files:
+        kind_pages = [page for page in pages if page["kind"] == kind]
+        seconds = sum(page["median_seconds"] for page in kind_pages)
+        events = sum(page["events"] for page in kind_pages)
+        kinds[kind] = {
+            "pages": len(kind_pages),
+            "events": events,
+            "parse_seconds": round(seconds, 6),
+            "events_per_second": round(events / seconds, 1) if seconds else None,
+        }
+
+    return {
+        "meta": {
+            "commit": current_git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "beautifulsoup": bs4.__version__,
+            "parser": data_collection.HTML_PARSER,
+            "fixtures_dir": str(fixtures_dir),
+            "repeat": repeat,
+        },
+        "kinds": kinds,
+        "pages": pages,
+        "field_parsers": {
+            name: {"pages": len(samples), "median_seconds": round(statistics.median(samples), 6)}
+            for name, samples in fields.items()
+            if samples
+        },
+        "selectors": selectors.report(),
+    }
+
+
+def _classify_cached_url(url: str) -> str:
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if host.endswith("eventbrite.com"):
+        return "eventbrite_detail" if "/e/" in parts.path else "eventbrite_listing"
+    if host == "pgh.events" and parts.path in {"", "/"}:
+        return "pgh_listing"
+    # pgh.events cards link to venue/event pages on many hosts; those are the price lookups.
+    return "pgh_detail"
+
+
+def export_cache_fixtures(cache_dir: Path, fixtures_dir: Path) -> int:
+    """Copy recorded response bodies from the scraper HTTP cache into the fixture layout."""
+    exported = 0
+    for entry_path in sorted(cache_dir.glob("*.json")):
+        try:
+            entry = json.loads(entry_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if not entry.get("url") or not entry.get("body"):
+            continue
+        target_dir = fixtures_dir / _classify_cached_url(entry["url"])
+        target_dir.mkdir(parents=True, exist_ok=True)
+        (target_dir / f"{entry_path.stem[:16]}.html").write_text(entry["body"], encoding="utf-8")
+        exported += 1
+    return exported
+
+
+def compare_results(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> list[dict[str, Any]]:
+    """Pages whose median parse time grew by more than `threshold`x against the baseline run."""
+    baseline_pages = {(page["kind"], page["file"]): page for page in baseline.get("pages", [])}
+    regressions = []
+    for page in current["pages"]:
+        previous = baseline_pages.get((page["kind"], page["file"]))
+        if previous is None or previous["median_seconds"] <= 0:
+            continue
+        ratio = page["median_seconds"] / previous["median_seconds"]
+        if ratio > threshold:
+            regressions.append({**page, "baseline_median_seconds": previous["median_seconds"], "ratio": round(ratio, 3)})
+    return regressions
+
+
+def _print_summary(report: dict[str, Any], top_selectors: int = 10) -> None:
+    print(f"\n{'kind':<20} {'pages':>6} {'events':>7} {'parse ms':>10} {'events/s':>10}")
+    for kind, summary in report["kinds"].items():
+        rate = summary["events_per_second"]
+        print(
+            f"{kind:<20} {summary['pages']:>6} {summary['events']:>7} "
+            f"{summary['parse_seconds'] * 1000:>10.2f} {rate if rate is not None else '-':>10}"
+        )
+    for name, summary in report["field_parsers"].items():
+        print(f"{name:<30} median {summary['median_seconds'] * 1e6:>9.1f} us/page")
+    print(f"\n{'selector':<45} {'calls':>7} {'total ms':>10}")
+    for row in report["selectors"][:top_selectors]:
+        print(f"{row['selector'][:45]:<45} {row['calls']:>7} {row['total_seconds'] * 1000:>10.2f}")
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark scraper parsing on recorded HTML fixtures.")
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES_DIR)
+    parser.add_argument("--parser", default=data_collection.HTML_PARSER, help="BeautifulSoup backend (e.g. lxml).")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed parses per page (min and median are kept).")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Where to write the JSON results.")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON from an earlier run to check for regressions.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD)
+    parser.add_argument(
+        "--export-cache",
+        action="store_true",
+        help=f"Populate the fixtures directory from the scraper HTTP cache ({HTTP_CACHE_DIR}) first.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    if args.export_cache:
+        print(f"Exported {export_cache_fixtures(HTTP_CACHE_DIR, args.fixtures)} page(s) to {args.fixtures}")
+
+    # Every page kind must be covered, or the report silently compares a different workload.
+    files = _fixture_files(args.fixtures)
+    missing = [kind for kind in FIXTURE_PARSERS if not files.get(kind)]
+    if missing:
+        print(f"No HTML fixtures under {args.fixtures} for: {', '.join(missing)} (expected <kind>/*.html).")
+        return 1
+
+    data_collection.HTML_PARSER = args.parser
+    report = run_benchmark(args.fixtures, max(1, args.repeat))
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    _print_summary(report)
+    print(f"\nWrote results for {len(report['pages'])} page(s) to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare_results(report, baseline, args.threshold)
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression['kind']}/{regression['file']}: "
+                f"{regression['baseline_median_seconds'] * 1000:.3f} ms -> "
+                f"{regression['median_seconds'] * 1000:.3f} ms (x{regression['ratio']})"
+            )
+        print(f"{len(regressions)} regression(s) against {args.compare} (threshold x{args.threshold}).")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,7 @@ Central project configuration and filesystem paths.
 Scrape outputs and downstream recommendation paths.
 """
 
+import os
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parent
@@ -10,7 +11,55 @@ DATA_DIR = PROJECT_ROOT / "data"
 
 DEFAULT_CITY = "Pittsburgh, PA"
 DEFAULT_MAX_RESULTS = 3
+# Hard cap on suggestions per query (wizard, API, CLI) and the page size of the suggestions page.
+MAX_RESULTS_CAP = int(os.environ.get("MAX_RESULTS_CAP", "200"))
+SUGGESTIONS_PAGE_SIZE = int(os.environ.get("SUGGESTIONS_PAGE_SIZE", "10"))
+# Stage timers/counters and the web app's /metrics endpoint; METRICS_ENABLED=0 removes them entirely.
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "1").strip().lower() not in {"0", "false", "no"}
+# On-demand profiling (?profile=1 or an X-Profile header), accepted only from these client IPs;
+# empty disables it. Profiles rotate under PROFILE_DIR. A sample interval > 0 turns on stack sampling.
+PROFILE_ALLOWED_IPS = frozenset(ip.strip() for ip in os.environ.get("PROFILE_ALLOWED_IPS", "").split(",") if ip.strip())
+PROFILE_DIR = DATA_DIR / "profiles"
+PROFILE_MAX_FILES = int(os.environ.get("PROFILE_MAX_FILES", "50"))
+PROFILE_SAMPLE_INTERVAL_SECONDS = float(os.environ.get("PROFILE_SAMPLE_INTERVAL_SECONDS", "0"))
+# Web app: how often the static tree is re-scanned for its content-hashed URL prefix (0 = only at startup).
+STATIC_VERSION_CHECK_SECONDS = float(os.environ.get("STATIC_VERSION_CHECK_SECONDS", "2"))
+# Web app: cache of ranked results per normalized preferences (cleared on every dataset load).
+RANKING_CACHE_MAX_ENTRIES = int(os.environ.get("RANKING_CACHE_MAX_ENTRIES", "512"))
+RANKING_CACHE_TTL_SECONDS = float(os.environ.get("RANKING_CACHE_TTL_SECONDS", "900"))
+# Web app: generated suggestions are kept server-side (shared by all workers); the session holds an ID.
+RESULT_STORE_FILE = DATA_DIR / "results.sqlite3"
+RESULT_STORE_TTL_SECONDS = float(os.environ.get("RESULT_STORE_TTL_SECONDS", "3600"))
+RESULT_STORE_MAX_ENTRIES = int(os.environ.get("RESULT_STORE_MAX_ENTRIES", "5000"))
+# JSON API: most preference sets accepted by one POST /api/suggestions/batch request.
+API_BATCH_MAX_QUERIES = int(os.environ.get("API_BATCH_MAX_QUERIES", "500"))
+# Web app: poll interval for dataset hot reload (0 disables), and retry backoff cap for failed loads.
+DATASET_RELOAD_INTERVAL_SECONDS = float(os.environ.get("DATASET_RELOAD_INTERVAL_SECONDS", "5"))
+DATASET_RELOAD_BACKOFF_MAX_SECONDS = float(os.environ.get("DATASET_RELOAD_BACKOFF_MAX_SECONDS", "300"))
+# Web app: prepared dataset published once as memory-mapped files that every gunicorn worker
+# attaches to (requires pyarrow). SHARED_DATASET=0 gives each worker a private copy instead.
+SHARED_DATASET_DIR = DATA_DIR / "shared_index"
+SHARED_DATASET_ENABLED = os.environ.get("SHARED_DATASET", "1").strip().lower() not in {"0", "false", "no"}
+# Web app: query the SQLite event store per request instead of holding the dataset in memory.
+EVENT_DB_ENABLED = os.environ.get("EVENT_DB", "").strip().lower() in {"1", "true", "yes"}
 SCRAPE_REQUEST_TIMEOUT_SECONDS = 15
+# Shared scraper session: keep-alive sockets per host and retry/backoff on 429/5xx.
+SCRAPE_POOL_MAXSIZE = 4
+SCRAPE_MAX_RETRIES = 3
+SCRAPE_BACKOFF_BASE_SECONDS = 0.5
+SCRAPE_BACKOFF_MAX_SECONDS = 30.0
+# BeautifulSoup parser backend for the scrapers ("lxml" is faster when installed).
+SCRAPE_HTML_PARSER = os.environ.get("SCRAPE_HTML_PARSER", "html.parser")
+
+# On-disk HTTP response cache for the scrapers (bodies + ETag/Last-Modified validators).
+HTTP_CACHE_DIR = DATA_DIR / "http_cache"
+HTTP_CACHE_TTL_SECONDS = float(os.environ.get("HTTP_CACHE_TTL_SECONDS", "600"))
+# Bounds on the cache directory: entries fetched longer ago than the max age, then the oldest
+# beyond the max entries, are pruned while scraping (0 disables either bound).
+HTTP_CACHE_MAX_ENTRIES = int(os.environ.get("HTTP_CACHE_MAX_ENTRIES", "5000"))
+HTTP_CACHE_MAX_AGE_SECONDS = float(os.environ.get("HTTP_CACHE_MAX_AGE_SECONDS", str(7 * 24 * 3600)))
+# Serve only recorded responses and never touch the network (offline runs/tests).
+HTTP_CACHE_OFFLINE = os.environ.get("HTTP_CACHE_OFFLINE", "").strip().lower() in {"1", "true", "yes"}
 
 SCRAPED_EVENT_COLUMNS = [
     "event_name",
@@ -22,25 +71,45 @@ SCRAPED_EVENT_COLUMNS = [
     "url",
 ]
 
+# Extra column recording when each row's detail data was last fetched (incremental refresh).
+SCRAPED_AT_COLUMN = "scraped_at"
+
 # Standardized schema for scraped event outputs.
 STANDARD_COLUMNS = SCRAPED_EVENT_COLUMNS
 
 # Final output file.
 SCRAPED_OUTPUT_FILES = {
     "final_csv": DATA_DIR / "pittsburgh_events.csv",
+    # Typed columnar copy of final_csv (requires pyarrow); loaders prefer it when current.
+    "final_parquet": DATA_DIR / "pittsburgh_events.parquet",
+    # SQLite copy indexed on (day, period, cost) for filter pushdown; used by the web app with EVENT_DB=1.
+    "final_sqlite": DATA_DIR / "pittsburgh_events.sqlite3",
+    # Written last on every publish: row count, content hashes and scrape time of the live files.
+    "manifest": DATA_DIR / "pittsburgh_events.manifest.json",
 }
+# Every publish is also kept as a numbered snapshot; older ones beyond the newest N are removed.
+DATASET_SNAPSHOT_DIR = DATA_DIR / "snapshots"
+DATASET_SNAPSHOT_KEEP = int(os.environ.get("DATASET_SNAPSHOT_KEEP", "5"))
+# Scrapes stream rows here (one file per source, then the cleaned CSV) before publishing, next to
+# the checkpoint journal `--resume` continues from; removed after a successful publish.
+SCRAPE_STAGING_DIR = DATA_DIR / "scrape_staging"
 
 # Recommendation module compatibility.
 RECOMMENDATION_SAMPLE_FILE = SCRAPED_OUTPUT_FILES["final_csv"]
 LATEST_OPTIONS_FILE = SCRAPED_OUTPUT_FILES["final_csv"]
+EVENT_STORE_FILE = SCRAPED_OUTPUT_FILES["final_parquet"]
+DATASET_MANIFEST_FILE = SCRAPED_OUTPUT_FILES["manifest"]
+EVENT_DB_FILE = SCRAPED_OUTPUT_FILES["final_sqlite"]
 
+# Each key must match a source adapter registered in data_collection.py.
+# Sources are scraped in parallel; rows are concatenated in this order.
 DATA_SOURCES = {
-    "eventbrite": {
-        "type": "scrape",
-        "url": "https://www.eventbrite.com/d/pa--pittsburgh/all-events/",
-    },
     "pgh_events": {
         "type": "scrape",
         "url": "https://pgh.events/",
     },
+    "eventbrite": {
+        "type": "scrape",
+        "url": "https://www.eventbrite.com/d/pa--pittsburgh/all-events/",
+    },
 }
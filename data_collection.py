@@ -6,12 +6,18 @@ Refactored from teammate notebook logic and wired to project config paths.
 
 from __future__ import annotations
 
+import argparse
+import functools
 import json
 import re
-import time
-from datetime import datetime
+import shutil
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator, Sequence
+from urllib.parse import urljoin
 
 import pandas as pd
 import requests
@@ -19,10 +25,36 @@ from bs4 import BeautifulSoup
 
 from config import (
     DATA_SOURCES,
+    DATASET_SNAPSHOT_DIR,
+    DATASET_SNAPSHOT_KEEP,
+    HTTP_CACHE_DIR,
+    HTTP_CACHE_MAX_AGE_SECONDS,
+    HTTP_CACHE_MAX_ENTRIES,
+    HTTP_CACHE_OFFLINE,
+    HTTP_CACHE_TTL_SECONDS,
+    SCRAPE_BACKOFF_BASE_SECONDS,
+    SCRAPE_BACKOFF_MAX_SECONDS,
+    SCRAPE_HTML_PARSER,
+    SCRAPE_MAX_RETRIES,
+    SCRAPE_POOL_MAXSIZE,
     SCRAPE_REQUEST_TIMEOUT_SECONDS,
+    SCRAPE_STAGING_DIR,
+    SCRAPED_AT_COLUMN,
     SCRAPED_EVENT_COLUMNS,
     SCRAPED_OUTPUT_FILES,
 )
+from dataset_publish import atomic_write, live_manifest, publish_snapshot
+from metrics import stage_summary, stage_timer, timed_iter
+from event_db import write_event_db
+from event_store import (
+    event_store_is_current,
+    read_event_store,
+    to_csv_frame,
+    write_event_store,
+)
+from scrape_checkpoint import ScrapeCheckpoint, SourceCheckpoint, interrupted_run
+from scrape_http import HostRateLimiter, ResponseCache, ScrapeClient
+from scrape_pipeline import CsvSink, JsonlSink, dedupe_rows, drain, iter_jsonl, ordered_map
 from utils import ensure_project_directories
 
 HEADERS = {
@@ -34,11 +66,49 @@ HEADERS = {
 }
 
 MAX_PAGES = 3
+# BeautifulSoup backend for every page parse ("html.parser", or "lxml" when installed).
+HTML_PARSER = SCRAPE_HTML_PARSER
 LISTING_SLEEP_SECONDS = 1.5
 DETAIL_SLEEP_SECONDS = 1.2
+# Detail pages are fetched by a small worker pool; the per-host limiter keeps the
+# request rate at one request per DETAIL_SLEEP_SECONDS while latencies overlap.
+DETAIL_MAX_WORKERS = 4
+DETAIL_RATE_BURST = 1.0
 PGH_PRICE_FETCH_SLEEP_SECONDS = 0.8
+# Listing URLs for direct calls; source adapters use the "url" of their DATA_SOURCES entry.
+PGH_EVENTS_URL = str(DATA_SOURCES["pgh_events"]["url"])
+EVENTBRITE_URL = str(DATA_SOURCES["eventbrite"]["url"])
+# Incremental refresh re-fetches detail pages only for new URLs or rows older than this.
+INCREMENTAL_STALE_AFTER_HOURS = 24
+
+SCRAPE_MODE_CACHED = "cached"
+SCRAPE_MODE_FRESH = "fresh"
+SCRAPE_MODE_INCREMENTAL = "incremental"
+SCRAPE_MODES = (SCRAPE_MODE_CACHED, SCRAPE_MODE_FRESH, SCRAPE_MODE_INCREMENTAL)
 
 OUTPUT_FILE = Path(SCRAPED_OUTPUT_FILES["final_csv"])
+STORE_FILE = Path(SCRAPED_OUTPUT_FILES["final_parquet"])
+MANIFEST_FILE = Path(SCRAPED_OUTPUT_FILES["manifest"])
+EVENT_DB_FILE = Path(SCRAPED_OUTPUT_FILES["final_sqlite"])
+
+DATASET_COLUMNS = SCRAPED_EVENT_COLUMNS + [SCRAPED_AT_COLUMN]
+CLEANED_COLUMNS = DATASET_COLUMNS + ["max_price"]
+# Streamed publishes print only the first rows of the dataset.
+PREVIEW_ROWS = 20
+
+HTTP_CLIENT = ScrapeClient(
+    pool_maxsize=max(SCRAPE_POOL_MAXSIZE, DETAIL_MAX_WORKERS),
+    max_retries=SCRAPE_MAX_RETRIES,
+    backoff_base_seconds=SCRAPE_BACKOFF_BASE_SECONDS,
+    backoff_max_seconds=SCRAPE_BACKOFF_MAX_SECONDS,
+)
+RESPONSE_CACHE = ResponseCache(
+    HTTP_CACHE_DIR,
+    ttl_seconds=HTTP_CACHE_TTL_SECONDS,
+    offline=HTTP_CACHE_OFFLINE,
+    max_entries=HTTP_CACHE_MAX_ENTRIES,
+    max_age_seconds=HTTP_CACHE_MAX_AGE_SECONDS,
+)
 
 MANUAL_LOCATION_FIXES = {
     "Eddy TheatreWoodland": "Eddy Theatre",
@@ -57,8 +127,23 @@ def get_text(element: Any) -> str:
     return clean(element.get_text()) if element else "N/A"
 
 
-def _eventbrite_listing_page_url(page_num: int) -> str:
-    base_url = str(DATA_SOURCES["eventbrite"]["url"])
+def make_soup(html: str) -> BeautifulSoup:
+    return BeautifulSoup(html, HTML_PARSER)
+
+
+def fetch_html(
+    url: str,
+    request_timeout: int = SCRAPE_REQUEST_TIMEOUT_SECONDS,
+    limiter: HostRateLimiter | None = None,
+) -> str:
+    # All scraper page loads go through the response cache (raises requests.RequestException).
+    # The rate limiter only applies to real network requests (each retry included), so cache
+    # hits return immediately.
+    limited_get = functools.partial(HTTP_CLIENT.get, limiter=limiter)
+    return RESPONSE_CACHE.fetch(url, headers=HEADERS, timeout=request_timeout, get=limited_get)
+
+
+def _listing_page_url(base_url: str, page_num: int) -> str:
     if page_num == 1:
         return base_url
     return f"{base_url}?page={page_num}"
@@ -67,6 +152,7 @@ def _eventbrite_listing_page_url(page_num: int) -> str:
 def scrape_pgh_event_price(
     event_url: str,
     request_timeout: int = SCRAPE_REQUEST_TIMEOUT_SECONDS,
+    limiter: HostRateLimiter | None = None,
 ) -> str:
     """
     Fetch a pgh.events detail page and extract price text.
@@ -74,15 +160,27 @@ def scrape_pgh_event_price(
     """
     if not event_url or event_url == "N/A":
         return "N/A"
+    price = _fetch_pgh_event_price(event_url, request_timeout, limiter)
+    return "N/A" if price is None else price
 
+
+def _fetch_pgh_event_price(
+    event_url: str,
+    request_timeout: int,
+    limiter: HostRateLimiter | None,
+) -> str | None:
+    # None when the page could not be fetched, so callers can tell it apart from a page without a price.
     try:
-        response = requests.get(event_url, headers=HEADERS, timeout=request_timeout)
-        response.raise_for_status()
+        html = fetch_html(event_url, request_timeout=request_timeout, limiter=limiter)
     except requests.RequestException as exc:
         print(f"      ✗ Price fetch failed: {exc}")
-        return "N/A"
+        return None
+
+    return parse_pgh_event_price(html)
+
 
-    soup = BeautifulSoup(response.text, "html.parser")
+def parse_pgh_event_price(html: str) -> str:
+    soup = make_soup(html)
     full_text = soup.get_text(" ")
 
     for selector in [
@@ -126,104 +224,189 @@ def scrape_pgh_event_price(
     return "N/A"
 
 
-def scrape_pgh_events(
+def parse_pgh_listing(html: str, base_url: str = PGH_EVENTS_URL) -> tuple[int, list[dict[str, str]]]:
+    """Parse one pgh.events listing page into (day block count, event cards)."""
+    soup = make_soup(html)
+    day_blocks = soup.select("[class*='day-module--day']")
+    events: list[dict[str, str]] = []
+
+    for day in day_blocks:
+        day_time_el = day.select_one("time")
+        # Day blocks carry the calendar date; individual cards may only include time.
+        day_date = day_time_el.get("datetime", "N/A")[:10] if day_time_el else "N/A"
+
+        for card in day.select("[class*='event-module--event']"):
+            name_el = card.select_one("[class*='event-module--mainLink']")
+            event_name = get_text(name_el)
+
+            link_el = name_el if (name_el and name_el.name == "a") else card.select_one("a[href]")
+            source_url = link_el["href"] if link_el else "N/A"
+            if source_url != "N/A" and source_url.startswith("/"):
+                source_url = urljoin(base_url, source_url)
+
+            location = "N/A"
+            for paragraph in card.select("p"):
+                if not paragraph.get("class"):
+                    text = clean(paragraph.get_text())
+                    if text and text != "N/A":
+                        location = text
+                        break
+
+            card_time_el = card.select_one("time")
+            event_date = day_date
+            event_time = "N/A"
+            if card_time_el:
+                raw_dt = card_time_el.get("datetime", "")
+                if raw_dt and "T" in raw_dt:
+                    try:
+                        dt = datetime.strptime(
+                            re.sub(r"[+-]\d{4}$", "", raw_dt),
+                            "%Y-%m-%dT%H:%M:%S",
+                        )
+                        event_date = dt.strftime("%Y-%m-%d")
+                        event_time = dt.strftime("%I:%M %p")
+                    except ValueError:
+                        event_date = raw_dt[:10]
+
+            price_el = card.select_one("[class*='price']") or card.select_one("[class*='cost']")
+            price = get_text(price_el)
+            if price == "N/A":
+                matched = re.search(
+                    r"(\$[\d,]+(?:\.\d{1,2})?\s*(?:to|-|–)\s*\$[\d,]+(?:\.\d{1,2})?"
+                    r"|\$[\d,]+(?:\.\d{1,2})?|Free)",
+                    card.get_text(),
+                    re.IGNORECASE,
+                )
+                price = matched.group(0) if matched else "N/A"
+            events.append(
+                {
+                    "event_name": event_name,
+                    "date": event_date,
+                    "time": event_time,
+                    "location": location,
+                    "price": price,
+                    "source": "pgh.events",
+                    "url": source_url,
+                }
+            )
+    return len(day_blocks), events
+
+
+def iter_pgh_listing(
     max_pages: int = MAX_PAGES,
     request_timeout: int = SCRAPE_REQUEST_TIMEOUT_SECONDS,
-) -> list[dict[str, str]]:
-    pgh_events: list[dict[str, str]] = []
+    checkpoint: SourceCheckpoint | None = None,
+    base_url: str = PGH_EVENTS_URL,
+) -> Iterator[dict[str, str]]:
+    """
+    Yield pgh.events listing cards page by page; the next page is fetched on demand.
+    Pages already in `checkpoint` are replayed from it, fetched pages are recorded there.
+    """
+    # Rate limits replace fixed sleeps so pages served from the response cache cost nothing.
+    listing_limiter = HostRateLimiter(1.0 / LISTING_SLEEP_SECONDS)
+    listed = 0
 
     for page_num in range(1, max_pages + 1):
-        url = "https://pgh.events/" if page_num == 1 else f"https://pgh.events/?page={page_num}"
-        print(f"[pgh.events] Fetching page {page_num}: {url}")
-        try:
-            response = requests.get(url, headers=HEADERS, timeout=request_timeout)
-            response.raise_for_status()
-        except requests.RequestException as exc:
-            print(f"  ✗ {exc}")
-            break
-
-        soup = BeautifulSoup(response.text, "html.parser")
-        day_blocks = soup.select("[class*='day-module--day']")
-        if not day_blocks:
-            print("  ✗ No day blocks found.")
-            break
-        print(f"  ✓ {len(day_blocks)} day block(s) found.")
-
-        for day in day_blocks:
-            day_time_el = day.select_one("time")
-            # Day blocks carry the calendar date; individual cards may only include time.
-            day_date = day_time_el.get("datetime", "N/A")[:10] if day_time_el else "N/A"
-
-            for card in day.select("[class*='event-module--event']"):
-                name_el = card.select_one("[class*='event-module--mainLink']")
-                event_name = get_text(name_el)
-
-                link_el = name_el if (name_el and name_el.name == "a") else card.select_one("a[href]")
-                source_url = link_el["href"] if link_el else "N/A"
-                if source_url != "N/A" and source_url.startswith("/"):
-                    source_url = "https://pgh.events" + source_url
-
-                location = "N/A"
-                for paragraph in card.select("p"):
-                    if not paragraph.get("class"):
-                        text = clean(paragraph.get_text())
-                        if text and text != "N/A":
-                            location = text
-                            break
-
-                card_time_el = card.select_one("time")
-                event_date = day_date
-                event_time = "N/A"
-                if card_time_el:
-                    raw_dt = card_time_el.get("datetime", "")
-                    if raw_dt and "T" in raw_dt:
-                        try:
-                            dt = datetime.strptime(
-                                re.sub(r"[+-]\d{4}$", "", raw_dt),
-                                "%Y-%m-%dT%H:%M:%S",
-                            )
-                            event_date = dt.strftime("%Y-%m-%d")
-                            event_time = dt.strftime("%I:%M %p")
-                        except ValueError:
-                            event_date = raw_dt[:10]
-
-                price_el = card.select_one("[class*='price']") or card.select_one("[class*='cost']")
-                price = get_text(price_el)
-                if price == "N/A":
-                    matched = re.search(
-                        r"(\$[\d,]+(?:\.\d{1,2})?\s*(?:to|-|–)\s*\$[\d,]+(?:\.\d{1,2})?"
-                        r"|\$[\d,]+(?:\.\d{1,2})?|Free)",
-                        card.get_text(),
-                        re.IGNORECASE,
-                    )
-                    price = matched.group(0) if matched else "N/A"
-                if price == "N/A" and source_url != "N/A":
-                    # Fallback: open the event detail page when listing card omits price.
-                    print(f"    ↳ [{event_name[:40]}] fetching detail page for price...")
-                    price = scrape_pgh_event_price(
-                        source_url,
-                        request_timeout=request_timeout,
-                    )
-                    print(f"      → price found: {price}")
-                    time.sleep(PGH_PRICE_FETCH_SLEEP_SECONDS)
-
-                pgh_events.append(
-                    {
-                        "event_name": event_name,
-                        "date": event_date,
-                        "time": event_time,
-                        "location": location,
-                        "price": price,
-                        "source": "pgh.events",
-                        "url": source_url,
-                    }
-                )
+        page_events = checkpoint.listing_page(page_num) if checkpoint is not None else None
+        if page_events is not None:
+            print(f"[pgh.events] Page {page_num} restored from checkpoint.")
+        else:
+            url = _listing_page_url(base_url, page_num)
+            print(f"[pgh.events] Fetching page {page_num}: {url}")
+            try:
+                html = fetch_html(url, request_timeout=request_timeout, limiter=listing_limiter)
+            except requests.RequestException as exc:
+                print(f"  ✗ {exc}")
+                # Later pages were never listed, so a resumed run must fetch them again.
+                if checkpoint is not None:
+                    checkpoint.mark_incomplete()
+                break
+
+            day_count, page_events = parse_pgh_listing(html, base_url)
+            if not day_count:
+                print("  ✗ No day blocks found.")
+                break
+            print(f"  ✓ {day_count} day block(s) found.")
+            if checkpoint is not None:
+                checkpoint.record_listing_page(page_num, page_events)
+        listed += len(page_events)
+        print(f"  → {listed} events so far.")
+        yield from page_events
+
+
+def list_pgh_events(
+    max_pages: int = MAX_PAGES,
+    request_timeout: int = SCRAPE_REQUEST_TIMEOUT_SECONDS,
+) -> list[dict[str, str]]:
+    return list(iter_pgh_listing(max_pages=max_pages, request_timeout=request_timeout))
 
-        print(f"  → {len(pgh_events)} events so far.")
-        time.sleep(LISTING_SLEEP_SECONDS)
 
-    print(f"\n[pgh.events] Total: {len(pgh_events)} events\n")
-    return pgh_events
+def iter_pgh_event_prices(
+    pgh_events: Iterable[dict[str, str]],
+    request_timeout: int = SCRAPE_REQUEST_TIMEOUT_SECONDS,
+    known_details: dict[str, dict[str, str]] | None = None,
+    checkpoint: SourceCheckpoint | None = None,
+) -> Iterator[dict[str, str]]:
+    """
+    Fill missing listing prices from pgh.events detail pages, one record at a time.
+    `known_details` maps event URL -> {"price", "scraped_at"} from a recent run; those
+    events reuse the stored price instead of re-opening their detail page. Prices found
+    by an interrupted attempt are taken from `checkpoint`.
+    """
+    known_details = known_details or {}
+    price_limiter = HostRateLimiter(1.0 / PGH_PRICE_FETCH_SLEEP_SECONDS)
+    total = 0
+
+    for record in pgh_events:
+        total += 1
+        source_url = record["url"]
+        if record["price"] != "N/A":
+            yield record
+            continue
+        if source_url in known_details:
+            # Incremental mode: detail page was fetched recently, keep its price and age.
+            record["price"] = known_details[source_url]["price"]
+            record[SCRAPED_AT_COLUMN] = known_details[source_url]["scraped_at"]
+        else:
+            restored = checkpoint.detail(source_url) if checkpoint is not None else None
+            if restored is not None:
+                record["price"] = restored
+            elif source_url != "N/A":
+                # Fallback: open the event detail page when listing card omits price.
+                print(f"    ↳ [{record['event_name'][:40]}] fetching detail page for price...")
+                price = _fetch_pgh_event_price(source_url, request_timeout, price_limiter)
+                record["price"] = "N/A" if price is None else price
+                print(f"      → price found: {record['price']}")
+                # A failed fetch is not journaled, so a resumed run tries the page again.
+                if checkpoint is not None and price is not None:
+                    checkpoint.record_detail(source_url, price)
+        yield record
+
+    print(f"\n[pgh.events] Total: {total} events\n")
+
+
+def enrich_pgh_event_prices(
+    pgh_events: list[dict[str, str]],
+    request_timeout: int = SCRAPE_REQUEST_TIMEOUT_SECONDS,
+    known_details: dict[str, dict[str, str]] | None = None,
+) -> list[dict[str, str]]:
+    return list(
+        iter_pgh_event_prices(pgh_events, request_timeout=request_timeout, known_details=known_details)
+    )
+
+
+def scrape_pgh_events(
+    max_pages: int = MAX_PAGES,
+    request_timeout: int = SCRAPE_REQUEST_TIMEOUT_SECONDS,
+    known_details: dict[str, dict[str, str]] | None = None,
+) -> list[dict[str, str]]:
+    return list(
+        iter_pgh_event_prices(
+            iter_pgh_listing(max_pages=max_pages, request_timeout=request_timeout),
+            request_timeout=request_timeout,
+            known_details=known_details,
+        )
+    )
 
 
 def parse_eventbrite_datetime(soup: BeautifulSoup, raw_html: str) -> tuple[str, str]:
@@ -396,67 +579,168 @@ def parse_eventbrite_price(soup: BeautifulSoup, raw_html: str) -> str:
     return "N/A"
 
 
-def scrape_eventbrite(
+def _fetch_eventbrite_detail(
+    event_url: str,
+    index: int,
+    total: int | None,
+    limiter: HostRateLimiter,
+    request_timeout: int = SCRAPE_REQUEST_TIMEOUT_SECONDS,
+) -> dict[str, str] | None:
+    print(f"  [{index}/{total or '?'}] {event_url}")
+    try:
+        html = fetch_html(event_url, request_timeout=request_timeout, limiter=limiter)
+    except Exception:
+        return None
+
+    return parse_eventbrite_detail(html, event_url)
+
+
+def parse_eventbrite_detail(html: str, event_url: str) -> dict[str, str]:
+    detail = make_soup(html)
+    name_el = detail.select_one("h1") or detail.select_one("[class*='event-title']")
+    event_name = get_text(name_el)
+    event_date, event_time = parse_eventbrite_datetime(detail, html)
+    location = parse_eventbrite_location(detail)
+    price = parse_eventbrite_price(detail, html)
+
+    return {
+        "event_name": event_name,
+        "date": event_date,
+        "time": event_time,
+        "location": location,
+        "price": price,
+        "source": "Eventbrite",
+        "url": event_url,
+    }
+
+
+def parse_eventbrite_listing(html: str) -> list[str]:
+    """Event URLs on one Eventbrite listing page, in page order and without duplicates."""
+    found: list[str] = []
+    for anchor in make_soup(html).select("a[href*='/e/']"):
+        # Strip query params so tracking variants of the same event URL dedupe correctly.
+        href = str(anchor.get("href", "")).split("?")[0]
+        if href and href not in found:
+            found.append(href)
+    return found
+
+
+def iter_eventbrite_urls(
     max_pages: int = MAX_PAGES,
     request_timeout: int = SCRAPE_REQUEST_TIMEOUT_SECONDS,
-) -> list[dict[str, str]]:
+    checkpoint: SourceCheckpoint | None = None,
+    base_url: str = EVENTBRITE_URL,
+) -> Iterator[str]:
+    """
+    Yield new event URLs page by page; the next listing page is fetched on demand.
+    Pages already in `checkpoint` are replayed from it, fetched pages are recorded there.
+    """
     print("[Eventbrite] Step 1: Collecting event URLs...")
-    eb_urls: list[str] = []
+    seen: set[str] = set()
+    listing_limiter = HostRateLimiter(1.0 / LISTING_SLEEP_SECONDS)
 
     for page_num in range(1, max_pages + 1):
-        url = _eventbrite_listing_page_url(page_num)
-        print(f"  Fetching listing page {page_num}")
-        try:
-            response = requests.get(url, headers=HEADERS, timeout=request_timeout)
-            response.raise_for_status()
-        except requests.RequestException as exc:
-            print(f"  ✗ {exc}")
-            break
-
-        soup = BeautifulSoup(response.text, "html.parser")
-        found: list[str] = []
-        for anchor in soup.select("a[href*='/e/']"):
-            # Strip query params so tracking variants of the same event URL dedupe correctly.
-            href = str(anchor.get("href", "")).split("?")[0]
-            if href and href not in eb_urls and href not in found:
-                found.append(href)
-        eb_urls.extend(found)
+        page_urls = checkpoint.listing_page(page_num) if checkpoint is not None else None
+        if page_urls is not None:
+            print(f"  Listing page {page_num} restored from checkpoint")
+        else:
+            url = _listing_page_url(base_url, page_num)
+            print(f"  Fetching listing page {page_num}")
+            try:
+                html = fetch_html(url, request_timeout=request_timeout, limiter=listing_limiter)
+            except requests.RequestException as exc:
+                print(f"  ✗ {exc}")
+                # Later pages were never listed, so a resumed run must fetch them again.
+                if checkpoint is not None:
+                    checkpoint.mark_incomplete()
+                break
+            page_urls = parse_eventbrite_listing(html)
+            if checkpoint is not None:
+                checkpoint.record_listing_page(page_num, page_urls)
+
+        found = [href for href in page_urls if href not in seen]
+        seen.update(found)
         print(f"  ✓ {len(found)} URLs found on page {page_num}.")
-        time.sleep(LISTING_SLEEP_SECONDS)
+        yield from found
 
-    print(f"\n[Eventbrite] {len(eb_urls)} URLs. Fetching detail pages...\n")
-    eb_events: list[dict[str, str]] = []
-    for index, event_url in enumerate(eb_urls, start=1):
-        print(f"  [{index}/{len(eb_urls)}] {event_url}")
-        try:
-            response = requests.get(event_url, headers=HEADERS, timeout=request_timeout)
-            response.raise_for_status()
-        except Exception:
-            time.sleep(1.0)
-            continue
 
-        detail = BeautifulSoup(response.text, "html.parser")
-        name_el = detail.select_one("h1") or detail.select_one("[class*='event-title']")
-        event_name = get_text(name_el)
-        event_date, event_time = parse_eventbrite_datetime(detail, response.text)
-        location = parse_eventbrite_location(detail)
-        price = parse_eventbrite_price(detail, response.text)
-
-        eb_events.append(
-            {
-                "event_name": event_name,
-                "date": event_date,
-                "time": event_time,
-                "location": location,
-                "price": price,
-                "source": "Eventbrite",
-                "url": event_url,
-            }
+def collect_eventbrite_urls(
+    max_pages: int = MAX_PAGES,
+    request_timeout: int = SCRAPE_REQUEST_TIMEOUT_SECONDS,
+) -> list[str]:
+    return list(iter_eventbrite_urls(max_pages=max_pages, request_timeout=request_timeout))
+
+
+def iter_eventbrite_details(
+    eb_urls: Iterable[str],
+    request_timeout: int = SCRAPE_REQUEST_TIMEOUT_SECONDS,
+    max_workers: int = DETAIL_MAX_WORKERS,
+    total: int | None = None,
+    checkpoint: SourceCheckpoint | None = None,
+) -> Iterator[dict[str, str]]:
+    """
+    Fetch and parse detail pages for `eb_urls`, yielding events in URL order.
+    URLs are pulled lazily, with at most a few fetches in flight beyond the worker pool.
+    Events parsed by an interrupted attempt are taken from `checkpoint`; failed fetches
+    are not recorded, so a resumed run retries them.
+    """
+    counted = "" if total is None else f" {total} URLs."
+    print(f"\n[Eventbrite]{counted} Fetching detail pages...\n")
+    limiter = HostRateLimiter(1.0 / DETAIL_SLEEP_SECONDS, burst=DETAIL_RATE_BURST)
+
+    def fetch(indexed_url: tuple[int, str]) -> dict[str, str] | None:
+        index, event_url = indexed_url
+        restored = checkpoint.detail(event_url) if checkpoint is not None else None
+        if restored is not None:
+            return restored
+        event = _fetch_eventbrite_detail(
+            event_url,
+            index=index,
+            total=total,
+            limiter=limiter,
+            request_timeout=request_timeout,
         )
-        time.sleep(DETAIL_SLEEP_SECONDS)
+        if checkpoint is not None and event is not None:
+            checkpoint.record_detail(event_url, event)
+        return event
+
+    fetched = 0
+    # ordered_map yields results in submission order, so output matches a sequential run.
+    for event in ordered_map(fetch, enumerate(eb_urls, start=1), max_workers=max_workers):
+        if event is not None:
+            fetched += 1
+            yield event
 
-    print(f"\n[Eventbrite] Total: {len(eb_events)} events\n")
-    return eb_events
+    print(f"\n[Eventbrite] Total: {fetched} events\n")
+
+
+def fetch_eventbrite_details(
+    eb_urls: list[str],
+    request_timeout: int = SCRAPE_REQUEST_TIMEOUT_SECONDS,
+    max_workers: int = DETAIL_MAX_WORKERS,
+) -> list[dict[str, str]]:
+    return list(
+        iter_eventbrite_details(
+            eb_urls,
+            request_timeout=request_timeout,
+            max_workers=max_workers,
+            total=len(eb_urls),
+        )
+    )
+
+
+def scrape_eventbrite(
+    max_pages: int = MAX_PAGES,
+    request_timeout: int = SCRAPE_REQUEST_TIMEOUT_SECONDS,
+    max_workers: int = DETAIL_MAX_WORKERS,
+) -> list[dict[str, str]]:
+    return list(
+        iter_eventbrite_details(
+            iter_eventbrite_urls(max_pages=max_pages, request_timeout=request_timeout),
+            request_timeout=request_timeout,
+            max_workers=max_workers,
+        )
+    )
 
 
 def clean_location(location: Any) -> Any:
@@ -499,16 +783,24 @@ def extract_max_price(price_str: Any) -> float | str:
     return "N/A"
 
 
-def build_dataframe(all_events: list[dict[str, Any]]) -> pd.DataFrame:
-    df = pd.DataFrame(all_events, columns=SCRAPED_EVENT_COLUMNS)
-    if df.empty:
-        return df
-    df = df[df["event_name"].str.strip().str.len() > 0]
-    df = df[df["event_name"] != "N/A"]
+def build_rows(
+    events: Iterable[dict[str, Any]],
+    columns: Sequence[str] = DATASET_COLUMNS,
+) -> Iterator[dict[str, Any]]:
+    """Project events onto `columns`, dropping nameless rows and repeats of (event_name, date)."""
+    named = (
+        {column: event.get(column) for column in columns}
+        for event in events
+        if isinstance(event.get("event_name"), str)
+        and event["event_name"].strip()
+        and event["event_name"] != "N/A"
+    )
     # Same event often appears multiple times across paginated source listings.
-    df.drop_duplicates(subset=["event_name", "date"], inplace=True)
-    df.reset_index(drop=True, inplace=True)
-    return df
+    return dedupe_rows(named, ["event_name", "date"])
+
+
+def build_dataframe(all_events: Iterable[dict[str, Any]]) -> pd.DataFrame:
+    return pd.DataFrame(list(build_rows(all_events)), columns=DATASET_COLUMNS)
 
 
 def clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
@@ -525,31 +817,360 @@ def clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     return cleaned
 
 
-def save_csv(df: pd.DataFrame, path: Path | str) -> Path:
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(path, index=False, encoding="utf-8-sig")
+def _fill_missing(row: dict[str, Any]) -> dict[str, Any]:
+    return {column: "N/A" if pd.isna(value) else value for column, value in row.items()}
+
+
+def clean_row(row: dict[str, Any]) -> dict[str, Any]:
+    """clean_dataframe for a single row, for the streaming pipeline."""
+    cleaned = _fill_missing(row)
+    location = clean_location(cleaned["location"])
+    cleaned["location"] = MANUAL_LOCATION_FIXES.get(location, location) if isinstance(location, str) else location
+    price = cleaned["price"]
+    cleaned["price"] = price.rstrip(".") if isinstance(price, str) else price
+    cleaned["max_price"] = extract_max_price(cleaned["price"])
+    return cleaned
+
+
+def _published_row(row: dict[str, Any]) -> dict[str, Any]:
+    # Rows of the published dataset are already cleaned, and clean_location is not idempotent,
+    # so they are not cleaned again. max_price is re-derived because the typed store keeps
+    # only its numeric values ("Free" / "N/A" load as missing).
+    kept = _fill_missing(row)
+    kept["max_price"] = extract_max_price(kept["price"])
+    return kept
+
+
+def _print_saved_preview(
+    df: pd.DataFrame,
+    path: Path,
+    note: str = "saved to",
+    rows: int | None = None,
+) -> None:
+    # `df` may be just the first rows of a streamed dataset of `rows` events.
+    rows = len(df) if rows is None else rows
     print(f"\n{'=' * 50}")
-    print(f"✅  {len(df)} events saved to {path}")
+    print(f"✅  {rows} events {note} {path}")
     print(f"{'=' * 50}")
     if not df.empty:
         preview_columns = ["event_name", "date", "time", "location", "price", "source"]
         if "max_price" in df.columns:
             preview_columns.insert(5, "max_price")
         print(df[preview_columns].to_string(index=False))
+    if rows > len(df):
+        print(f"... and {rows - len(df)} more")
+
+
+def save_csv(df: pd.DataFrame, path: Path | str) -> Path:
+    # Written to a temp file and renamed, so concurrent readers never see a partial CSV.
+    path = atomic_write(path, lambda tmp: df.to_csv(tmp, index=False, encoding="utf-8-sig"))
+    _print_saved_preview(df, path)
     return path
 
 
-def load_csv(path: Path | str) -> pd.DataFrame:
-    df = pd.read_csv(Path(path))
+def load_csv(path: Path | str, store_path: Path | str | None = None) -> pd.DataFrame:
+    # Prefer the typed Parquet store when it was published after the CSV.
+    if store_path is not None and event_store_is_current(store_path, path):
+        df = to_csv_frame(read_event_store(store_path))
+    else:
+        df = pd.read_csv(Path(path))
     return df.fillna("N/A")
 
 
-def _save_collection_output(cleaned_df: pd.DataFrame, final_output_file: Path) -> None:
-    save_csv(cleaned_df, final_output_file)
+def _save_collection_output(
+    cleaned: pd.DataFrame | Path,
+    final_output_file: Path,
+    store_file: Path = STORE_FILE,
+    manifest_file: Path = MANIFEST_FILE,
+    event_db_file: Path = EVENT_DB_FILE,
+) -> None:
+    # CSV, typed store and SQLite store become a numbered snapshot and go live together, manifest last.
+    manifest, published = publish_snapshot(
+        cleaned,
+        final_output_file,
+        manifest_file,
+        DATASET_SNAPSHOT_DIR,
+        keep=DATASET_SNAPSHOT_KEEP,
+        stores=[(store_file, write_event_store), (event_db_file, write_event_db)],
+        scraped_at_column=SCRAPED_AT_COLUMN,
+    )
+    if not published:
+        print(f"\nDataset unchanged (snapshot {manifest['snapshot']}); nothing republished.")
+        return
+    if isinstance(cleaned, pd.DataFrame):
+        preview = cleaned
+    else:
+        preview = pd.read_csv(final_output_file, nrows=PREVIEW_ROWS, keep_default_na=False, encoding="utf-8-sig")
+    _print_saved_preview(
+        preview,
+        final_output_file,
+        note=f"published as snapshot {manifest['snapshot']} to",
+        rows=manifest["rows"],
+    )
+
+
+class SourceAdapter(ABC):
+    """
+    One event feed, registered under its DATA_SOURCES key; `settings` is that entry.
+    iter_listing yields listing-level records, iter_enriched fills them from detail pages
+    (skipping URLs in `known_details`), and normalize maps each onto SCRAPED_EVENT_COLUMNS.
+    Records flow through one at a time, so a source streams straight into its sink. With a
+    `checkpoint`, finished listing and detail pages are journaled and replayed on resume.
+    """
+
+    source_label = ""
+
+    def __init__(self, name: str, settings: dict[str, Any]) -> None:
+        self.name = name
+        self.settings = settings
+
+    @abstractmethod
+    def iter_listing(self, checkpoint: SourceCheckpoint | None = None) -> Iterator[dict[str, str]]:
+        """Yield listing-level records, starting from the page at `settings["url"]`."""
+
+    def iter_enriched(
+        self,
+        records: Iterable[dict[str, str]],
+        known_details: dict[str, dict[str, str]],
+        checkpoint: SourceCheckpoint | None = None,
+    ) -> Iterator[dict[str, str]]:
+        return iter(records)
+
+    def normalize(self, record: dict[str, str]) -> dict[str, str]:
+        row = {column: record.get(column) or "N/A" for column in SCRAPED_EVENT_COLUMNS}
+        row["source"] = record.get("source") or self.source_label
+        if record.get(SCRAPED_AT_COLUMN):
+            row[SCRAPED_AT_COLUMN] = record[SCRAPED_AT_COLUMN]
+        return row
+
+    def iter_events(
+        self,
+        known_details: dict[str, dict[str, str]] | None = None,
+        checkpoint: SourceCheckpoint | None = None,
+    ) -> Iterator[dict[str, str]]:
+        # scrape_list covers listing pages only; scrape_source is the whole source, detail pages included.
+        records = timed_iter(self.iter_listing(checkpoint), "scrape_list", source=self.name)
+        enriched = self.iter_enriched(records, known_details or {}, checkpoint)
+        for record in timed_iter(enriched, "scrape_source", source=self.name):
+            yield self.normalize(record)
+
+    def collect(self, known_details: dict[str, dict[str, str]] | None = None) -> list[dict[str, str]]:
+        return list(self.iter_events(known_details))
+
+
+SOURCE_ADAPTERS: dict[str, type[SourceAdapter]] = {}
+
+
+def register_source(name: str) -> Any:
+    def decorator(adapter_cls: type[SourceAdapter]) -> type[SourceAdapter]:
+        SOURCE_ADAPTERS[name] = adapter_cls
+        return adapter_cls
+
+    return decorator
+
+
+@register_source("pgh_events")
+class PghEventsAdapter(SourceAdapter):
+    source_label = "pgh.events"
+
+    def iter_listing(self, checkpoint: SourceCheckpoint | None = None) -> Iterator[dict[str, str]]:
+        return iter_pgh_listing(checkpoint=checkpoint, base_url=str(self.settings["url"]))
+
+    def iter_enriched(
+        self,
+        records: Iterable[dict[str, str]],
+        known_details: dict[str, dict[str, str]],
+        checkpoint: SourceCheckpoint | None = None,
+    ) -> Iterator[dict[str, str]]:
+        return iter_pgh_event_prices(records, known_details=known_details, checkpoint=checkpoint)
+
+
+@register_source("eventbrite")
+class EventbriteAdapter(SourceAdapter):
+    source_label = "Eventbrite"
+
+    def iter_listing(self, checkpoint: SourceCheckpoint | None = None) -> Iterator[dict[str, str]]:
+        urls = iter_eventbrite_urls(checkpoint=checkpoint, base_url=str(self.settings["url"]))
+        return ({"url": url} for url in urls)
+
+    def iter_enriched(
+        self,
+        records: Iterable[dict[str, str]],
+        known_details: dict[str, dict[str, str]],
+        checkpoint: SourceCheckpoint | None = None,
+    ) -> Iterator[dict[str, str]]:
+        skipped = 0
+
+        def pending_urls() -> Iterator[str]:
+            nonlocal skipped
+            for record in records:
+                if record["url"] in known_details:
+                    skipped += 1
+                    continue
+                yield record["url"]
+
+        yield from iter_eventbrite_details(pending_urls(), checkpoint=checkpoint)
+        if skipped:
+            print(f"[Eventbrite] {skipped} URL(s) still fresh, skipped detail fetch.")
+
+
+def build_source_adapters(sources: dict[str, dict[str, Any]] = DATA_SOURCES) -> list[SourceAdapter]:
+    adapters: list[SourceAdapter] = []
+    for name, settings in sources.items():
+        adapter_cls = SOURCE_ADAPTERS.get(name)
+        if adapter_cls is None:
+            print(f"[sources] No adapter registered for '{name}'; skipping.")
+            continue
+        adapters.append(adapter_cls(name, settings))
+    return adapters
+
+
+def stream_sources(
+    adapters: list[SourceAdapter],
+    staging_dir: Path = SCRAPE_STAGING_DIR,
+    known_details: dict[str, dict[str, str]] | None = None,
+    now: datetime | None = None,
+    checkpoint: ScrapeCheckpoint | None = None,
+) -> list[Path]:
+    """
+    Run every source concurrently; total time is the slowest source, not the sum.
+    Each source streams its normalized rows into `<staging_dir>/<name>.jsonl` as they are
+    parsed. Returns the files of the sources that finished, in DATA_SOURCES order; a failing
+    source is reported and contributes no rows (its partial file is left on disk).
+    With a `checkpoint`, sources that raised or missed listing pages are added to
+    `checkpoint.failed` (a source that missed pages still contributes what it fetched), and
+    on resume sources that already finished are not run again.
+    """
+    now = now or datetime.now()
+
+    def run(adapter: SourceAdapter) -> Path | None:
+        path = staging_dir / f"{adapter.name}.jsonl"
+        source_checkpoint = checkpoint.source(adapter.name) if checkpoint is not None else None
+        try:
+            if source_checkpoint is not None and source_checkpoint.done and path.exists():
+                print(f"[{adapter.name}] ✓ Finished before the interruption; not refetched.")
+                return path
+            with JsonlSink(path) as sink:
+                drain(_stamp_scraped_at(adapter.iter_events(known_details, source_checkpoint), now), sink)
+            if source_checkpoint is not None:
+                if source_checkpoint.restored:
+                    print(f"[{adapter.name}] {source_checkpoint.restored} page(s) restored from checkpoint.")
+                if source_checkpoint.complete:
+                    source_checkpoint.mark_done()
+                else:
+                    print(f"[{adapter.name}] ✗ Some listing pages could not be fetched.")
+                    checkpoint.failed.append(adapter.name)
+        except Exception as exc:
+            print(f"[{adapter.name}] ✗ Source failed: {exc}")
+            if checkpoint is not None:
+                checkpoint.failed.append(adapter.name)
+            return None
+        finally:
+            if source_checkpoint is not None:
+                source_checkpoint.close()
+        return path
+
+    if not adapters:
+        return []
+    with ThreadPoolExecutor(max_workers=len(adapters)) as pool:
+        paths = list(pool.map(run, adapters))
+    return [path for path in paths if path is not None]
+
+
+def iter_staged_rows(paths: Iterable[Path]) -> Iterator[dict[str, Any]]:
+    return chain.from_iterable(iter_jsonl(path) for path in paths)
+
+
+def collect_from_sources(
+    adapters: list[SourceAdapter],
+    known_details: dict[str, dict[str, str]] | None = None,
+    staging_dir: Path = SCRAPE_STAGING_DIR,
+) -> list[dict[str, str]]:
+    return list(iter_staged_rows(stream_sources(adapters, staging_dir, known_details=known_details)))
+
+
+def _stamp_scraped_at(events: Iterable[dict[str, str]], now: datetime) -> Iterator[dict[str, str]]:
+    # Rows that reused older detail data keep their original timestamp.
+    stamp = now.isoformat(timespec="seconds")
+    for event in events:
+        event.setdefault(SCRAPED_AT_COLUMN, stamp)
+        yield event
+
+
+def _iter_records(df: pd.DataFrame, chunk_rows: int = 1000) -> Iterator[dict[str, Any]]:
+    # to_dict("records") a chunk at a time, so the frame is never copied whole.
+    for start in range(0, len(df), chunk_rows):
+        yield from df.iloc[start : start + chunk_rows].to_dict("records")
+
+
+def _recent_event_details(existing_df: pd.DataFrame, cutoff: datetime) -> dict[str, dict[str, str]]:
+    if existing_df.empty or SCRAPED_AT_COLUMN not in existing_df.columns:
+        return {}
+    # Rows without a parseable timestamp (older datasets) count as stale.
+    scraped_at = pd.to_datetime(existing_df[SCRAPED_AT_COLUMN], errors="coerce")
+    recent = existing_df[(scraped_at >= cutoff) & (existing_df["url"] != "N/A")]
+    return {
+        str(url): {"price": str(price), "scraped_at": str(stamp)}
+        for url, price, stamp in zip(recent["url"], recent["price"], recent[SCRAPED_AT_COLUMN])
+    }
+
 
+@functools.lru_cache(maxsize=4096)
+def _event_day(date: Any) -> pd.Timestamp:
+    return pd.to_datetime(date, errors="coerce")
 
-def prompt_user(output_file: Path | str = OUTPUT_FILE) -> bool:
+
+def drop_past_rows(rows: Iterable[dict[str, Any]], now: datetime | None = None) -> Iterator[dict[str, Any]]:
+    today = pd.Timestamp(now or datetime.now()).normalize()
+    for row in rows:
+        # Unparseable dates are kept; only events known to be in the past are removed.
+        if not _event_day(row["date"]) < today:
+            yield row
+
+
+def scrape_incremental(
+    existing_df: pd.DataFrame,
+    stale_after_hours: float = INCREMENTAL_STALE_AFTER_HOURS,
+    now: datetime | None = None,
+    staging_dir: Path = SCRAPE_STAGING_DIR,
+    checkpoint: ScrapeCheckpoint | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Refresh an existing (published, cleaned) dataset by fetching detail pages only for new
+    URLs or rows older than `stale_after_hours`. Yields cleaned rows: the new ones merged
+    with the kept ones, past events dropped.
+    """
+    now = now or datetime.now()
+    recent = _recent_event_details(existing_df, now - timedelta(hours=stale_after_hours))
+    paths = stream_sources(
+        build_source_adapters(),
+        staging_dir,
+        known_details=recent,
+        now=now,
+        checkpoint=checkpoint,
+    )
+
+    # Rows seen again in this run replace their old versions; URLs whose detail fetch
+    # failed (or that dropped off the listings) keep the previous row.
+    refreshed_urls: set[str] = set()
+
+    def new_rows() -> Iterator[dict[str, Any]]:
+        for row in iter_staged_rows(paths):
+            if row["url"] != "N/A":
+                refreshed_urls.add(row["url"])
+            yield clean_row({column: row.get(column) for column in DATASET_COLUMNS})
+
+    def kept_rows() -> Iterator[dict[str, Any]]:
+        # Only read once every new row has passed, so refreshed_urls is complete.
+        for row in _iter_records(existing_df):
+            if row["url"] not in refreshed_urls:
+                yield _published_row({column: row.get(column) for column in CLEANED_COLUMNS})
+
+    # New rows come first so build_rows' (event_name, date) dedupe keeps them.
+    return drop_past_rows(build_rows(chain(new_rows(), kept_rows()), CLEANED_COLUMNS), now)
+
+
+def prompt_user(output_file: Path | str = OUTPUT_FILE) -> str:
     output_file = Path(output_file)
     cached_exists = output_file.exists()
 
@@ -559,46 +1180,137 @@ def prompt_user(output_file: Path | str = OUTPUT_FILE) -> bool:
     if cached_exists:
         print(f"\n  Cached dataset found: {output_file}\n")
         print("  [1] Use cached data  (instant)")
-        print("  [2] Download fresh data  ( ~3-5 minutes)\n")
+        print("  [2] Download fresh data  ( ~3-5 minutes)")
+        print("  [3] Refresh incrementally  (new or stale events only)\n")
         while True:
-            choice = input("  Enter 1 or 2: ").strip()
+            choice = input("  Enter 1, 2 or 3: ").strip()
             if choice == "1":
-                return False
+                return SCRAPE_MODE_CACHED
             if choice == "2":
                 confirm = input("  Are you sure? (y/n): ").strip().lower()
-                return confirm == "y"
-            print("  Please enter 1 or 2.")
+                return SCRAPE_MODE_FRESH if confirm == "y" else SCRAPE_MODE_CACHED
+            if choice == "3":
+                return SCRAPE_MODE_INCREMENTAL
+            print("  Please enter 1, 2 or 3.")
 
     print("\n  No cached data found. Fresh download required (~3-5 mins).")
     input("  Press Enter to start...")
-    return True
+    return SCRAPE_MODE_FRESH
 
 
-def main() -> None:
-    ensure_project_directories()
-    use_fresh = prompt_user(OUTPUT_FILE)
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Collect Pittsburgh event data.")
+    parser.add_argument(
+        "--mode",
+        choices=SCRAPE_MODES,
+        help="Skip the interactive prompt (e.g. for scheduled incremental refreshes).",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted scrape from its checkpoint (its mode unless --mode is given).",
+    )
+    return parser.parse_args(argv)
 
-    if use_fresh:
-        print("\n[Starting fresh scrape...]\n")
-        all_events = scrape_pgh_events() + scrape_eventbrite()
-        if not all_events:
-            print("No events collected.")
-            return
 
-        scraped_df = build_dataframe(all_events)
-        cleaned_df = clean_dataframe(scraped_df)
+def _print_http_stats() -> None:
+    stats = HTTP_CLIENT.stats()
+    if not stats["requests"]:
+        return
+    print(
+        f"\n[HTTP] {stats['requests']} request(s), {stats['retries']} retries, "
+        f"{stats['failures']} failure(s), {stats['bytes'] / 1024:.0f} KiB, "
+        f"p50 {stats['latency_p50_seconds']:.2f}s / p95 {stats['latency_p95_seconds']:.2f}s"
+    )
 
-        if cleaned_df.empty:
-            print("No events collected.")
-            return
 
-        _save_collection_output(cleaned_df, OUTPUT_FILE)
+def _print_stage_timings() -> None:
+    for labels, runs, seconds in stage_summary():
+        print(f"[timing] {labels}: {seconds:.2f}s over {runs} run(s)")
+
+
+def _publish_rows(
+    rows: Iterable[dict[str, Any]],
+    staging_dir: Path = SCRAPE_STAGING_DIR,
+    checkpoint: ScrapeCheckpoint | None = None,
+) -> None:
+    # Cleaned rows are appended to a staged CSV as they come; the publish copies that file.
+    staged_csv = staging_dir / OUTPUT_FILE.name
+    with stage_timer("build_dataset") as timer, CsvSink(staged_csv, CLEANED_COLUMNS) as sink:
+        timer.rows = drain(rows, sink)
+
+    if not sink.rows:
+        print("No events collected.")
+    else:
+        _save_collection_output(staged_csv, OUTPUT_FILE)
+    if checkpoint is not None and checkpoint.failed:
+        # The unfinished sources' journals stay, so a resumed run only fetches what is missing.
+        print(
+            f"\n  Not finished: {', '.join(checkpoint.failed)}. Progress is kept in {staging_dir};"
+            " rerun with --resume to continue."
+        )
+        return
+    if sink.rows:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def _open_checkpoint(mode: str, resume: bool) -> ScrapeCheckpoint:
+    checkpoint = ScrapeCheckpoint(SCRAPE_STAGING_DIR, mode, resume=resume)
+    if checkpoint.resumed:
+        print(f"[Resuming the {mode} scrape started {checkpoint.started_at:%Y-%m-%d %H:%M:%S}]")
+    elif resume:
+        print(f"[No interrupted {mode} scrape to resume; starting over]")
+    return checkpoint
+
+
+def _run_collection(mode: str, resume: bool = False) -> None:
+    if mode == SCRAPE_MODE_FRESH:
+        print("\n[Starting fresh scrape...]\n")
+        checkpoint = _open_checkpoint(mode, resume)
+        paths = stream_sources(
+            build_source_adapters(),
+            SCRAPE_STAGING_DIR,
+            now=checkpoint.started_at,
+            checkpoint=checkpoint,
+        )
+        rows = (clean_row(row) for row in build_rows(iter_staged_rows(paths)))
+        _publish_rows(rows, checkpoint=checkpoint)
+    elif mode == SCRAPE_MODE_INCREMENTAL:
+        print("\n[Starting incremental scrape...]\n")
+        existing_df = load_csv(OUTPUT_FILE, STORE_FILE)
+        checkpoint = _open_checkpoint(mode, resume)
+        _publish_rows(
+            scrape_incremental(existing_df, now=checkpoint.started_at, checkpoint=checkpoint),
+            checkpoint=checkpoint,
+        )
     else:
         print(f"\n[Loading cached data...]\n")
-        cached_df = load_csv(OUTPUT_FILE)
+        manifest = live_manifest(MANIFEST_FILE)
+        if manifest is not None:
+            # Already cleaned and published; re-cleaning cleaned rows is not idempotent.
+            print(f"Cached dataset is published as snapshot {manifest['snapshot']} ({manifest['rows']} events).")
+            return
+        cached_df = load_csv(OUTPUT_FILE, STORE_FILE)
         cleaned_df = clean_dataframe(cached_df)
         _save_collection_output(cleaned_df, OUTPUT_FILE)
 
 
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    ensure_project_directories()
+    HTTP_CLIENT.reset_stats()
+    interrupted = interrupted_run(SCRAPE_STAGING_DIR) if args.resume else None
+    mode = args.mode or (interrupted or {}).get("mode") or prompt_user(OUTPUT_FILE)
+    if mode != SCRAPE_MODE_FRESH and not OUTPUT_FILE.exists():
+        print(f"\n  No cached data found at {OUTPUT_FILE}; running a fresh scrape instead.")
+        mode = SCRAPE_MODE_FRESH
+
+    try:
+        _run_collection(mode, resume=args.resume)
+    finally:
+        _print_http_stats()
+        _print_stage_timings()
+
+
 if __name__ == "__main__":
     main()
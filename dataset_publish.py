@@ -0,0 +1,248 @@
+"""
+Crash-safe publishing of the processed event dataset.
+Each publish is staged as a numbered snapshot (CSV, typed store and a manifest with row count,
+content hashes and scrape time), fsynced, and only then renamed into place; the live manifest is
+replaced last. Readers never see a half-written file, and can tell from the manifest alone
+whether anything changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from contextlib import suppress
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import pandas as pd
+
+MANIFEST_FILE = "manifest.json"
+
+
+def fsync_directory(path: Path | str) -> None:
+    # Persists renames/creations in `path`; not supported (or needed) on every platform.
+    with suppress(OSError, AttributeError):
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def _fsync_file(path: Path) -> None:
+    with path.open("rb") as handle:
+        os.fsync(handle.fileno())
+
+
+def atomic_write(path: Path | str, write: Callable[[Path], Any]) -> Path:
+    """Call `write(tmp_path)` on a sibling temp file, fsync it and rename it over `path`."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    try:
+        write(tmp_path)
+        _fsync_file(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    fsync_directory(path.parent)
+    return path
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    atomic_write(path, lambda tmp: tmp.write_text(json.dumps(data, indent=2), encoding="utf-8"))
+
+
+def file_sha256(path: Path | str) -> str:
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_manifest(path: Path | str) -> dict[str, Any] | None:
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _live_entry_matches(manifest: dict[str, Any] | None, path: Path) -> bool:
+    # The manifest vouches for a live file only while its size and mtime are the published ones.
+    entry = (manifest or {}).get("files", {}).get(path.name)
+    if not entry:
+        return False
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+    return entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns
+
+
+def live_manifest(manifest_path: Path | str) -> dict[str, Any] | None:
+    """The manifest, if every file it lists (next to it) is still exactly as published."""
+    manifest_path = Path(manifest_path)
+    manifest = read_manifest(manifest_path)
+    if not manifest or not manifest.get("files"):
+        return None
+    if all(_live_entry_matches(manifest, manifest_path.parent / name) for name in manifest["files"]):
+        return manifest
+    return None
+
+
+def _snapshot_numbers(snapshot_root: Path) -> list[int]:
+    return sorted(int(path.name) for path in snapshot_root.glob("[0-9]*") if path.name.isdigit())
+
+
+def _promote(source: Path, destination: Path) -> None:
+    # Hard links cost no extra space; live files are only ever replaced, never written in place.
+    tmp_path = destination.with_name(f".{destination.name}.promote.tmp")
+    tmp_path.unlink(missing_ok=True)
+    try:
+        os.link(source, tmp_path)
+    except OSError:
+        shutil.copy2(source, tmp_path)
+        _fsync_file(tmp_path)
+    os.replace(tmp_path, destination)
+
+
+def _latest_scrape(stamps: pd.Series) -> pd.Timestamp | None:
+    stamps = pd.to_datetime(stamps, errors="coerce").dropna()
+    return stamps.max() if not stamps.empty else None
+
+
+def _dataset_summary(df: pd.DataFrame | Path, scraped_at_column: str) -> tuple[int, str | None]:
+    # (row count, latest scrape time); a CSV is read in chunks of its scrape-time column only.
+    if isinstance(df, pd.DataFrame):
+        latest = _latest_scrape(df[scraped_at_column]) if scraped_at_column in df.columns else None
+        return len(df), latest.isoformat() if latest is not None else None
+    header = pd.read_csv(df, nrows=0, encoding="utf-8-sig").columns
+    if scraped_at_column not in header:
+        return sum(len(chunk) for chunk in pd.read_csv(df, usecols=[0], chunksize=50_000, encoding="utf-8-sig")), None
+    rows, latest = 0, None
+    for chunk in pd.read_csv(df, usecols=[scraped_at_column], chunksize=50_000, encoding="utf-8-sig"):
+        rows += len(chunk)
+        chunk_latest = _latest_scrape(chunk[scraped_at_column])
+        if chunk_latest is not None and (latest is None or chunk_latest > latest):
+            latest = chunk_latest
+    return rows, latest.isoformat() if latest is not None else None
+
+
+def publish_snapshot(
+    df: pd.DataFrame | Path | str,
+    csv_path: Path | str,
+    manifest_path: Path | str,
+    snapshot_root: Path | str,
+    keep: int = 5,
+    stores: Iterable[tuple[Path | str, Callable[[Path, Path], Path | None]]] = (),
+    scraped_at_column: str = "scraped_at",
+) -> tuple[dict[str, Any], bool]:
+    """
+    Publish `df` as the next snapshot and make it live; returns (manifest, published).
+    `df` is a frame, or the path of a CSV already written in the final format (copied as is).
+    `stores` are (live path, writer) pairs; each writer derives its file from the staged CSV
+    and may return None to skip it. Content identical to the live, manifest-backed CSV is
+    not republished.
+    """
+    stores = [(Path(store_path), write_store) for store_path, write_store in stores]
+    if not isinstance(df, pd.DataFrame):
+        df = Path(df)
+    csv_path, manifest_path, snapshot_root = Path(csv_path), Path(manifest_path), Path(snapshot_root)
+    snapshot_root.mkdir(parents=True, exist_ok=True)
+    current = read_manifest(manifest_path)
+
+    staging = Path(tempfile.mkdtemp(dir=snapshot_root, prefix=".staging-"))
+    try:
+        staged_csv = staging / csv_path.name
+        if isinstance(df, pd.DataFrame):
+            df.to_csv(staged_csv, index=False, encoding="utf-8-sig")
+        else:
+            shutil.copyfile(df, staged_csv)
+        csv_sha256 = file_sha256(staged_csv)
+        if (
+            current is not None
+            and current.get("files", {}).get(csv_path.name, {}).get("sha256") == csv_sha256
+            and _live_entry_matches(current, csv_path)
+        ):
+            shutil.rmtree(staging, ignore_errors=True)
+            return current, False
+
+        staged = [staged_csv]
+        # Store writers load the whole staged CSV (typed columns and dedupe codes span every row),
+        # so this is the one step of a streamed scrape whose memory still grows with the dataset.
+        for store_path, write_store in stores:
+            if write_store(staged_csv, staging / store_path.name) is not None:
+                staged.append(staging / store_path.name)
+        for path in staged:
+            _fsync_file(path)
+
+        numbers = _snapshot_numbers(snapshot_root)
+        number = (numbers[-1] if numbers else 0) + 1
+        rows, scraped_at = _dataset_summary(df, scraped_at_column)
+        manifest: dict[str, Any] = {
+            "snapshot": number,
+            "rows": int(rows),
+            "published_at": datetime.now().isoformat(timespec="seconds"),
+            "scraped_at": scraped_at,
+            "files": {
+                path.name: {
+                    "sha256": csv_sha256 if path == staged_csv else file_sha256(path),
+                    "size": path.stat().st_size,
+                }
+                for path in staged
+            },
+        }
+        (staging / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        _fsync_file(staging / MANIFEST_FILE)
+        fsync_directory(staging)
+        snapshot_dir = snapshot_root / f"{number:06d}"
+        os.replace(staging, snapshot_dir)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    fsync_directory(snapshot_root)
+
+    # CSV first, then the stores in order (so their mtimes stay >= the CSV's), then the manifest.
+    live_paths = {csv_path.name: csv_path, **{store_path.name: store_path for store_path, _ in stores}}
+    for name in manifest["files"]:
+        _promote(snapshot_dir / name, live_paths[name])
+        stat = live_paths[name].stat()
+        manifest["files"][name]["mtime_ns"] = stat.st_mtime_ns
+    fsync_directory(csv_path.parent)
+    _write_json(manifest_path, manifest)
+
+    prune_snapshots(snapshot_root, keep)
+    return manifest, True
+
+
+def prune_snapshots(snapshot_root: Path | str, keep: int) -> None:
+    snapshot_root = Path(snapshot_root)
+    for number in _snapshot_numbers(snapshot_root)[: -max(1, int(keep))]:
+        shutil.rmtree(snapshot_root / f"{number:06d}", ignore_errors=True)
+
+
+def dataset_digest(paths: Iterable[Path | str], manifest_path: Path | str) -> str:
+    """
+    Content digest of `paths`, taking each file's hash from the manifest while its size and mtime
+    still match the published ones; only files changed outside a publish are re-hashed.
+    """
+    manifest = read_manifest(manifest_path)
+    digest = hashlib.sha1()
+    for path in map(Path, paths):
+        digest.update(str(path).encode("utf-8"))
+        if _live_entry_matches(manifest, path):
+            digest.update(manifest["files"][path.name]["sha256"].encode("ascii"))
+            continue
+        try:
+            digest.update(file_sha256(path).encode("ascii"))
+        except OSError:
+            digest.update(b"<missing>")
+    return digest.hexdigest()
@@ -0,0 +1,170 @@
+"""
+Hot reload of the prepared event dataset for the web process.
+A daemon thread polls the dataset files (mtime/size, confirmed by a content hash),
+rebuilds the snapshot off the request path and swaps it in with a single assignment,
+so in-flight requests keep the snapshot they started with.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+
+def _file_signature(paths: tuple[Path, ...]) -> tuple[tuple[str, int | None, int | None], ...]:
+    signature = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            signature.append((str(path), None, None))
+        else:
+            signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _content_digest(paths: tuple[Path, ...]) -> str:
+    digest = hashlib.sha1()
+    for path in paths:
+        digest.update(str(path).encode("utf-8"))
+        try:
+            with path.open("rb") as handle:
+                for chunk in iter(lambda: handle.read(1 << 20), b""):
+                    digest.update(chunk)
+        except OSError:
+            digest.update(b"<missing>")
+    return digest.hexdigest()
+
+
+class DatasetWatcher:
+    """
+    Holds the current dataset snapshot produced by `loader` and reloads it when `paths` change.
+    A change must be stable for one poll interval before reloading, so a half-written publish
+    is not picked up. Failed loads keep the previous snapshot and are retried with exponential
+    backoff. `poll_seconds <= 0` disables the thread; loads then only happen on demand.
+    `digest` fingerprints the files' contents (a publish manifest can make this cheap).
+    `still_current(snapshot)` may veto a reload whose changes the live snapshot already
+    reflects, e.g. files the loader itself rewrote while loading it.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Any],
+        paths: Iterable[Path | str],
+        poll_seconds: float = 5.0,
+        backoff_base_seconds: float = 1.0,
+        backoff_max_seconds: float = 300.0,
+        on_swap: Callable[[Any], None] | None = None,
+        digest: Callable[[tuple[Path, ...]], str] = _content_digest,
+        still_current: Callable[[Any], bool] | None = None,
+    ) -> None:
+        self.loader = loader
+        self.digest = digest
+        self.still_current = still_current
+        self.paths = tuple(Path(path) for path in paths)
+        self.poll_seconds = float(poll_seconds)
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.on_swap = on_swap
+        self.generation = 0
+        self.last_error: str | None = None
+        self._snapshot: Any = None
+        self._signature: tuple | None = None
+        self._pending_signature: tuple | None = None
+        self._digest: str | None = None
+        self._failures = 0
+        self._retry_at = 0.0
+        self._load_lock = threading.Lock()
+        self._thread_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    @property
+    def snapshot(self) -> Any:
+        return self._snapshot
+
+    def current(self) -> Any:
+        """Return the live snapshot, loading it on first use (or once a failed load's backoff has passed)."""
+        if self._snapshot is None and time.monotonic() >= self._retry_at:
+            self.reload()
+        self.start()
+        return self._snapshot
+
+    def reload(self, force: bool = False) -> bool:
+        """Rebuild the snapshot if the files' contents changed; returns True when a new one was swapped in."""
+        with self._load_lock:
+            signature = _file_signature(self.paths)
+            digest = self.digest(self.paths)
+            if not force and self._snapshot is not None and (
+                digest == self._digest
+                or (self.still_current is not None and self.still_current(self._snapshot))
+            ):
+                # Touched (or re-published byte-identical); nothing to rebuild. A failed load of
+                # since-reverted files is over too: the live snapshot matches the files again.
+                self._signature = signature
+                self._digest = digest
+                self._failures = 0
+                self._retry_at = 0.0
+                self.last_error = None
+                return False
+            try:
+                snapshot = self.loader()
+            except Exception as exc:
+                self._failures += 1
+                delay = min(self.backoff_max_seconds, self.backoff_base_seconds * (2 ** (self._failures - 1)))
+                self._retry_at = time.monotonic() + delay
+                self.last_error = str(exc)
+                print(f"Dataset load failed (attempt {self._failures}, retrying in {delay:.0f}s): {exc}")
+                return False
+
+            # One reference assignment: readers see either the old or the new snapshot, never a mix.
+            self._snapshot = snapshot
+            self._signature = signature
+            self._digest = digest
+            self._failures = 0
+            self._retry_at = 0.0
+            self.last_error = None
+            self.generation += 1
+
+        if self.on_swap is not None:
+            self.on_swap(snapshot)
+        return True
+
+    def poll_once(self) -> bool:
+        if self.last_error is not None:
+            return time.monotonic() >= self._retry_at and self.reload()
+
+        signature = _file_signature(self.paths)
+        if signature == self._signature:
+            self._pending_signature = None
+            return False
+        if signature != self._pending_signature:
+            # Wait one more interval so writers can finish (CSV first, then the typed store).
+            self._pending_signature = signature
+            return False
+        self._pending_signature = None
+        return self.reload()
+
+    def start(self) -> None:
+        if self.poll_seconds <= 0:
+            return
+        with self._thread_lock:
+            # Threads do not survive fork, so gunicorn workers (re)start their own watcher here.
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="dataset-watcher", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_seconds):
+            try:
+                self.poll_once()
+            except Exception as exc:  # keep watching; the next poll retries
+                print(f"Dataset watcher error: {exc}")
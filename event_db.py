@@ -0,0 +1,250 @@
+"""
+SQLite copy of the prepared event dataset for the web app.
+Rows are indexed on (day, period_code, estimated_cost), so the price, time-period and date
+filters run as indexed SQL range queries and only the matching candidates are loaded for
+scoring. Every row is stored; duplicates are resolved at ranking time, as in memory. Workers
+open the file read-only and hold nothing in memory between requests.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from dataset_publish import atomic_write
+from event_store import CATEGORICAL_COLUMNS, build_typed_frame
+from recommend import (
+    FLEXIBLE_DATE_WINDOW_DAYS,
+    NO_PERIOD_CODE,
+    PERIOD_INDEX,
+    EventIndex,
+    UserPreferences,
+    _build_flexible_filter_stages,
+    _day_ordinals,
+    _MISSING_DAY,
+    _normalize_event_date,
+    _normalize_period,
+    build_event_index,
+    score_candidates,
+    select_ranked_candidates_with_flexible_filters,
+)
+
+TEXT_COLUMNS = ["name", "date", "time", "location", "price", "source", "url"]
+# Bumped whenever the table layout changes; files of another version are rebuilt.
+SCHEMA_VERSION = "2"
+
+# rowid is the event's position in the processed dataset, so ORDER BY rowid is dataset order
+# (score ties resolve exactly as in memory) and both indexes cover every scoring column.
+# dedupe_code numbers the dedupe keys over the whole dataset, like EventIndex.dedupe_keys.
+_SCHEMA = """
+CREATE TABLE events (
+    dedupe_key TEXT NOT NULL,
+    dedupe_code INTEGER NOT NULL,
+    day INTEGER,
+    period_code INTEGER NOT NULL,
+    estimated_cost REAL NOT NULL,
+    start_time TEXT,
+    name TEXT NOT NULL,
+    date TEXT NOT NULL,
+    time TEXT NOT NULL,
+    location TEXT NOT NULL,
+    price TEXT NOT NULL,
+    source TEXT NOT NULL,
+    url TEXT NOT NULL
+);
+CREATE INDEX events_day_period_cost ON events (day, period_code, estimated_cost, dedupe_code);
+-- Date-less queries range over price instead.
+CREATE INDEX events_cost_period_day ON events (estimated_cost, period_code, day, dedupe_code);
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+_EVENT_COLUMNS = ["dedupe_key", "dedupe_code", "day", "period_code", "estimated_cost", "start_time"] + TEXT_COLUMNS
+# Scoring only needs these; text columns are fetched for the selected rows alone.
+_SCORING_COLUMNS = ["rowid", "day", "period_code", "estimated_cost", "dedupe_code"]
+_DETAIL_COLUMNS = ["rowid", "dedupe_key", "start_time"] + TEXT_COLUMNS
+
+
+def _source_frame(csv_path: Path | str) -> pd.DataFrame:
+    # Same typed parse as the Parquet store, in the column layout the web loader hands to ranking.
+    df = build_typed_frame(csv_path)
+    if df.empty:
+        return df
+    for column in CATEGORICAL_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype(object)
+    df["price"] = df["price"].fillna("").astype(str).str.strip()
+    return df.rename(columns={"event_name": "name"})
+
+
+def write_event_db(csv_path: Path | str, db_path: Path | str) -> Path:
+    """Build the SQLite store from the processed CSV and rename it into place."""
+    index = build_event_index(_source_frame(csv_path))
+    frame = index.frame
+
+    def write(tmp_path: Path) -> None:
+        tmp_path.unlink(missing_ok=True)
+        with closing(sqlite3.connect(tmp_path)) as connection, connection:
+            connection.executescript(_SCHEMA)
+            if not frame.empty:
+                days = _day_ordinals(frame["_event_day"])
+                start_times = pd.to_datetime(frame["start_time"], errors="coerce")
+                rows = zip(
+                    range(len(frame)),
+                    frame["_dedupe_key"],
+                    index.dedupe_keys.tolist(),
+                    [None if day == _MISSING_DAY else int(day) for day in days],
+                    index.period_codes.tolist(),
+                    index.costs.tolist(),
+                    [None if pd.isna(value) else value.isoformat() for value in start_times],
+                    *(frame[column].astype(str).tolist() for column in TEXT_COLUMNS),
+                )
+                connection.executemany(
+                    f"INSERT INTO events (rowid, {', '.join(_EVENT_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * (1 + len(_EVENT_COLUMNS)))})",
+                    rows,
+                )
+            connection.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [
+                    ("version", index.version),
+                    ("schema", SCHEMA_VERSION),
+                    ("built_at", datetime.now().isoformat(timespec="seconds")),
+                ],
+            )
+            connection.execute("ANALYZE")
+
+    return atomic_write(db_path, write)
+
+
+def _schema_version(db_path: Path) -> str | None:
+    try:
+        with closing(sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)) as connection:
+            row = connection.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+def event_db_is_current(db_path: Path | str, csv_path: Path | str) -> bool:
+    db_path, csv_path = Path(db_path), Path(csv_path)
+    if not db_path.exists() or _schema_version(db_path) != SCHEMA_VERSION:
+        return False
+    return not csv_path.exists() or db_path.stat().st_mtime >= csv_path.stat().st_mtime
+
+
+class EventDatabase:
+    """
+    Read-only view of a published SQLite store. The file is only ever replaced, never modified,
+    so it is opened immutable (no locking); a swapped-in file is picked up by opening a new view.
+    """
+
+    def __init__(self, db_path: Path | str) -> None:
+        self.db_path = Path(db_path)
+        with closing(self._connect()) as connection:
+            meta = dict(connection.execute("SELECT key, value FROM meta").fetchall())
+            self._rows = int(connection.execute("SELECT COUNT(*) FROM events").fetchone()[0])
+        self.version = meta.get("version", "")
+
+    def _connect(self) -> sqlite3.Connection:
+        # A short-lived connection per call: sqlite3 connections must not cross threads.
+        return sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro&immutable=1", uri=True)
+
+    def __len__(self) -> int:
+        return self._rows
+
+    @property
+    def empty(self) -> bool:
+        return self._rows == 0
+
+    def _where(self, prefs: UserPreferences, exact_only: bool) -> tuple[str, list[Any]]:
+        # Conditions every stage shares (price, date window), plus the period for the exact stage.
+        clauses: list[str] = []
+        params: list[Any] = []
+        target_date = _normalize_event_date(prefs.event_date)
+        if target_date is not None:
+            day = int(np.datetime64(target_date.normalize(), "D").astype("int64"))
+            radius = FLEXIBLE_DATE_WINDOW_DAYS if prefs.allow_flexible_dates and not exact_only else 0
+            clauses.append("day BETWEEN ? AND ?")
+            params += [day - radius, day + radius]
+        preferred_period = _normalize_period(prefs.preferred_period)
+        if exact_only and preferred_period != "any":
+            clauses.append("period_code = ?")
+            params.append(PERIOD_INDEX[preferred_period])
+        if prefs.min_price > 0:
+            clauses.append("estimated_cost >= ?")
+            params.append(float(prefs.min_price))
+        if prefs.budget > 0:
+            clauses.append("estimated_cost <= ?")
+            params.append(float(prefs.budget))
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def _select(self, columns: list[str], where: str, params: list[Any]) -> pd.DataFrame:
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                f"SELECT {', '.join(columns)} FROM events{where} ORDER BY rowid",
+                params,
+            ).fetchall()
+        return pd.DataFrame.from_records(rows, columns=columns)
+
+    def candidates(self, prefs: UserPreferences, exact_only: bool = False) -> EventIndex:
+        """
+        EventIndex over just the rows that pass the pushed-down filters, in dataset order.
+        Its frame holds the scoring columns only; see `with_details`.
+        """
+        where, params = self._where(prefs, exact_only)
+        columns = self._select(_SCORING_COLUMNS, where, params)
+        frame = pd.DataFrame(
+            {
+                "_rowid": columns["rowid"].astype("int64"),
+                "estimated_cost": columns["estimated_cost"].astype("float64"),
+                "_period_code": columns["period_code"].fillna(NO_PERIOD_CODE).astype("int8"),
+            }
+        )
+        days = pd.to_numeric(columns["day"]).fillna(_MISSING_DAY).to_numpy(dtype="int64")
+        day_order = np.argsort(days, kind="stable")
+        return EventIndex(
+            frame=frame,
+            costs=frame["estimated_cost"].to_numpy(dtype="float64"),
+            period_codes=frame["_period_code"].to_numpy(),
+            dedupe_keys=columns["dedupe_code"].to_numpy(dtype="int64"),
+            day_order=day_order,
+            sorted_days=days[day_order],
+            version=self.version,
+        )
+
+    def with_details(self, rows: pd.DataFrame) -> pd.DataFrame:
+        """Add the event fields (name, location, start time, ...) to candidate rows, keeping their order."""
+        if rows.empty:
+            return rows
+        rowids = rows["_rowid"].tolist()
+        where = f" WHERE rowid IN ({', '.join('?' * len(rowids))})"
+        details = self._select(_DETAIL_COLUMNS, where, rowids).set_index("rowid").loc[rowids]
+        frame = details[TEXT_COLUMNS].reset_index(drop=True)
+        frame["start_time"] = pd.to_datetime(details["start_time"].to_numpy(), errors="coerce")
+        frame["_event_day"] = frame["start_time"].dt.normalize()
+        frame["_dedupe_key"] = details["dedupe_key"].to_numpy()
+        return pd.concat([frame, rows.drop(columns="_rowid").reset_index(drop=True)], axis=1)
+
+    def rank(self, prefs: UserPreferences) -> tuple[pd.DataFrame, dict[str, int]]:
+        """
+        Same result as select_ranked_candidates_with_flexible_filters over the full dataset.
+        Exact matches are queried first; the wider flexible-stage query only runs when they
+        cannot fill the request.
+        """
+        ranked = summary = None
+        if len(_build_flexible_filter_stages(prefs)) > 1:
+            ranked, summary = select_ranked_candidates_with_flexible_filters(
+                self.candidates(prefs, exact_only=True), prefs
+            )
+        if summary is None or summary["returned"] < summary["requested"]:
+            ranked, summary = select_ranked_candidates_with_flexible_filters(self.candidates(prefs), prefs)
+        return self.with_details(ranked), summary
+
+    def score_candidates(self, prefs: UserPreferences) -> pd.DataFrame:
+        return self.with_details(score_candidates(self.candidates(prefs, exact_only=True), prefs))
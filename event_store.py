@@ -0,0 +1,87 @@
+"""
+Typed columnar (Parquet) copy of the processed event CSV.
+The CSV stays the human-readable export; loaders prefer this store when it is current.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+
+from dataset_publish import atomic_write
+from recommend import _coerce_start_time, _parse_price_text
+
+try:
+    import pyarrow  # noqa: F401
+
+    HAS_PYARROW = True
+except ImportError:  # pragma: no cover - depends on the deployment environment
+    HAS_PYARROW = False
+
+CATEGORICAL_COLUMNS = ["source", "location"]
+# Columns pre-parsed at publish time so recommendation does not re-parse them per request.
+PREPARSED_COLUMNS = ["estimated_cost", "start_time"]
+
+
+def _max_price_to_float(value: object) -> float:
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text == "free":
+            return 0.0
+        try:
+            return float(text)
+        except ValueError:
+            return float("nan")
+    return float("nan") if value is None or pd.isna(value) else float(value)
+
+
+def build_typed_frame(csv_path: Path | str) -> pd.DataFrame:
+    # Read the CSV exactly like the CSV loaders do, so both paths see identical values.
+    df = pd.read_csv(Path(csv_path))
+    if df.empty:
+        return df
+
+    text = df[["date", "time"]].fillna("").astype(str).apply(lambda column: column.str.strip())
+    df["start_time"] = _coerce_start_time(text)
+    df["estimated_cost"] = df["price"].apply(_parse_price_text).astype("float64")
+    if "max_price" in df.columns:
+        df["max_price"] = df["max_price"].map(_max_price_to_float).astype("float64")
+    for column in CATEGORICAL_COLUMNS:
+        if column in df.columns:
+            if df[column].dtype == object:
+                df[column] = df[column].str.strip()
+            df[column] = df[column].astype("category")
+    return df
+
+
+def write_event_store(csv_path: Path | str, store_path: Path | str) -> Path | None:
+    """Publish the typed store next to the CSV; returns None when pyarrow is unavailable."""
+    if not HAS_PYARROW:
+        print("Skipping Parquet event store (pyarrow is not installed).")
+        return None
+    typed = build_typed_frame(csv_path)
+    return atomic_write(store_path, lambda tmp: typed.to_parquet(tmp, engine="pyarrow", index=False))
+
+
+def event_store_is_current(store_path: Path | str, csv_path: Path | str) -> bool:
+    # A CSV edited (or re-exported) after the last publish makes the store stale.
+    store_path, csv_path = Path(store_path), Path(csv_path)
+    if not HAS_PYARROW or not store_path.exists():
+        return False
+    if not csv_path.exists():
+        return True
+    return store_path.stat().st_mtime >= csv_path.stat().st_mtime
+
+
+def read_event_store(store_path: Path | str) -> pd.DataFrame:
+    return pd.read_parquet(Path(store_path), engine="pyarrow")
+
+
+def to_csv_frame(df: pd.DataFrame) -> pd.DataFrame:
+    # Undo the typed conversions for callers that expect the plain CSV shape.
+    plain = df.drop(columns=[column for column in PREPARSED_COLUMNS if column in df.columns])
+    for column in CATEGORICAL_COLUMNS:
+        if column in plain.columns:
+            plain[column] = plain[column].astype(object)
+    return plain
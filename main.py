@@ -13,20 +13,70 @@ from __future__ import annotations
 
 # imports
 
+import copy
+import dataclasses
+import functools
+import math
 import os
+import time
 from pathlib import Path
 
 import pandas as pd
-from flask import Flask, render_template, request, redirect, session, url_for
-
-from config import LATEST_OPTIONS_FILE, RECOMMENDATION_SAMPLE_FILE
+from flask import Flask, Response, g, jsonify, render_template, request, redirect, send_from_directory, session, url_for
+from flask import before_render_template, template_rendered
+
+from config import (
+    API_BATCH_MAX_QUERIES,
+    DATASET_RELOAD_BACKOFF_MAX_SECONDS,
+    DATASET_MANIFEST_FILE,
+    DATASET_RELOAD_INTERVAL_SECONDS,
+    EVENT_DB_ENABLED,
+    EVENT_DB_FILE,
+    EVENT_STORE_FILE,
+    LATEST_OPTIONS_FILE,
+    MAX_RESULTS_CAP,
+    PROFILE_ALLOWED_IPS,
+    PROFILE_DIR,
+    PROFILE_MAX_FILES,
+    PROFILE_SAMPLE_INTERVAL_SECONDS,
+    RANKING_CACHE_MAX_ENTRIES,
+    RANKING_CACHE_TTL_SECONDS,
+    RECOMMENDATION_SAMPLE_FILE,
+    RESULT_STORE_FILE,
+    RESULT_STORE_MAX_ENTRIES,
+    RESULT_STORE_TTL_SECONDS,
+    SHARED_DATASET_DIR,
+    SHARED_DATASET_ENABLED,
+    STATIC_VERSION_CHECK_SECONDS,
+    SUGGESTIONS_PAGE_SIZE,
+)
+from dataset_publish import dataset_digest
+from dataset_watch import DatasetWatcher
+from event_db import EventDatabase, event_db_is_current, write_event_db
+from event_store import HAS_PYARROW, PREPARSED_COLUMNS, event_store_is_current, read_event_store
 from recommend import (
+    EventIndex,
     UserPreferences,
+    build_event_index,
     build_event_suggestions,
     format_plan,
+    preferences_cache_key,
     select_ranked_candidates_with_flexible_filters,
 )
+import metrics
+from profiling import PROFILE_ID_HEADER, RequestProfiler, StackSampler
+from query_cache import LRUCache
+from result_store import ResultStore
+from shared_dataset import CURRENT_FILE, load_shared_index, shared_index_is_current
 from utils import ensure_project_directories
+from web_http import (
+    STATIC_MAX_AGE_SECONDS,
+    StaticTreeVersion,
+    compress_response,
+    content_etag,
+    etag_matches,
+    not_modified,
+)
 
 
 
@@ -58,16 +108,27 @@ def _load_local_env(env_path: Path = Path(".env")) -> None:
             os.environ[key] = value
 
 
+def _clean_text_column(series: pd.Series) -> pd.Series:
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Typed-store categoricals are written stripped; only fill missing values, keep the dtype.
+        if "" not in series.cat.categories:
+            series = series.cat.add_categories([""])
+        return series.fillna("")
+    return series.fillna("").astype(str).str.strip()
+
+
 def _ensure_schema(df: pd.DataFrame) -> pd.DataFrame:
     missing_columns = [column for column in REQUIRED_INPUT_COLUMNS if column not in df.columns]
     if missing_columns:
         raise ValueError("Dataset is missing required columns: " + ", ".join(missing_columns))
 
-    normalized = df[REQUIRED_INPUT_COLUMNS].copy()
+    # Pre-parsed typed-store columns ride along so recommendation can skip re-parsing.
+    preparsed_columns = [column for column in PREPARSED_COLUMNS if column in df.columns]
+    normalized = df[REQUIRED_INPUT_COLUMNS + preparsed_columns].copy()
     normalized["name"] = normalized["event_name"].fillna("").astype(str).str.strip()
 
     for column in ["source", "location", "price", "url", "date", "time"]:
-        normalized[column] = normalized[column].fillna("").astype(str).str.strip()
+        normalized[column] = _clean_text_column(normalized[column])
 
     normalized = normalized[normalized["name"] != ""]
     normalized = normalized.drop(columns=["event_name"])
@@ -85,7 +146,12 @@ def _load_dataset() -> tuple[Path, pd.DataFrame]:
             "Run data collection first to generate latest event data."
         )
 
-    df = pd.read_csv(RECOMMENDATION_SAMPLE_FILE)
+    if event_store_is_current(EVENT_STORE_FILE, RECOMMENDATION_SAMPLE_FILE):
+        df = read_event_store(EVENT_STORE_FILE)
+        dataset_source = EVENT_STORE_FILE
+    else:
+        df = pd.read_csv(RECOMMENDATION_SAMPLE_FILE)
+        dataset_source = RECOMMENDATION_SAMPLE_FILE
     df = _ensure_schema(df)
 
     if LATEST_OPTIONS_FILE != RECOMMENDATION_SAMPLE_FILE:
@@ -93,12 +159,18 @@ def _load_dataset() -> tuple[Path, pd.DataFrame]:
         df.to_csv(LATEST_OPTIONS_FILE, index=False)
 
     print(f"\nLoaded event dataset: {len(df)} records")
-    print(f"Working dataset source: {RECOMMENDATION_SAMPLE_FILE}")
+    print(f"Working dataset source: {dataset_source}")
     return LATEST_OPTIONS_FILE, df
 
 
 # web-friendly wrappers (knorris2)
 
+def _cap_max_results(value: int) -> int:
+    # Bounds ranking/rendering work per query no matter how large the dataset grows.
+    return min(MAX_RESULTS_CAP, max(1, int(value)))
+
+
+@metrics.timed_stage("load_dataset")
 def load_events_df() -> pd.DataFrame:
     ensure_project_directories()
     _load_local_env()
@@ -106,19 +178,50 @@ def load_events_df() -> pd.DataFrame:
     return df
 
 
-def generate_suggestions_for_preferences(df: pd.DataFrame, prefs: UserPreferences) -> list[dict]:
+def load_event_index() -> EventIndex:
+    # Prepare the dataset once (price parsing, timestamps, dedupe keys) for all later requests.
+    return build_event_index(load_events_df())
+
+
+# Ranked results per (dataset version, normalized preferences); plain DataFrame inputs are not cached.
+RANKING_CACHE = LRUCache(RANKING_CACHE_MAX_ENTRIES, RANKING_CACHE_TTL_SECONDS)
+
+
+def _rank_preferences(
+    df: pd.DataFrame | EventIndex | EventDatabase,
+    prefs: UserPreferences,
+) -> tuple[list[dict], dict[str, int]]:
+    if isinstance(df, EventDatabase):
+        scored, summary = df.rank(prefs)
+    else:
+        scored, summary = select_ranked_candidates_with_flexible_filters(df, prefs)
+    return build_event_suggestions(scored, prefs), summary
+
+
+def generate_suggestions_for_preferences(
+    df: pd.DataFrame | EventIndex,
+    prefs: UserPreferences,
+) -> list[dict]:
     # Shared helper used by CLI: run ranking flow and convert rows to UI-friendly plan objects.
-    scored, _ = select_ranked_candidates_with_flexible_filters(df, prefs)
-    return build_event_suggestions(scored, prefs)
+    plans, _ = generate_suggestions_and_summary_for_preferences(df, prefs)
+    return plans
 
 
 def generate_suggestions_and_summary_for_preferences(
-    df: pd.DataFrame,
+    df: pd.DataFrame | EventIndex | EventDatabase,
     prefs: UserPreferences,
 ) -> tuple[list[dict], dict[str, int]]:
     # Shared helper used by web flow: returns both plans and the strict-vs-flexible summary.
-    scored, summary = select_ranked_candidates_with_flexible_filters(df, prefs)
-    return build_event_suggestions(scored, prefs), summary
+    if not isinstance(df, (EventIndex, EventDatabase)):
+        return _rank_preferences(df, prefs)
+
+    key = (df.version, preferences_cache_key(prefs))
+    cached = RANKING_CACHE.get(key)
+    if cached is None:
+        cached = _rank_preferences(df, prefs)
+        RANKING_CACHE.set(key, cached)
+    # Hand out copies so callers (session storage, templates) never mutate cached entries.
+    return copy.deepcopy(cached)
 
 
 
@@ -188,7 +291,7 @@ def _collect_preferences() -> UserPreferences:
     return UserPreferences(
         budget=max(0.0, budget),
         preferred_period=period,
-        max_results=max(1, max_results),
+        max_results=_cap_max_results(max_results),
         event_date=event_date,
         allow_flexible_dates=False,
     )
@@ -212,7 +315,7 @@ def main_cli() -> None:
     print("=" * 30)
     print("Loading latest event dataset...\n")
 
-    df = load_events_df()
+    df = load_event_index()
     generated_plans: list[dict] = []
 
     while True:
@@ -248,22 +351,142 @@ def main_cli() -> None:
 app = Flask(__name__)
 app.secret_key = "dev-secret-change-me"  
 
-_EVENTS_DF: pd.DataFrame | None = None
-_LOAD_ERROR: str | None = None
+STATIC_VERSION = StaticTreeVersion(app.static_folder, STATIC_VERSION_CHECK_SECONDS)
 
 
-def get_cached_df() -> pd.DataFrame | None:
-    global _EVENTS_DF, _LOAD_ERROR
-    # Cache dataset load result for this process to avoid re-reading on every request.
-    if _EVENTS_DF is not None or _LOAD_ERROR is not None:
-        return _EVENTS_DF
-    try:
-        _EVENTS_DF = load_events_df()
-        _LOAD_ERROR = None
-    except Exception as exc:
-        _EVENTS_DF = None
-        _LOAD_ERROR = str(exc)
-    return _EVENTS_DF
+@app.context_processor
+def _static_url_helper():
+    # Templates link static files through the content-hashed prefix so they can be cached long-term.
+    def static_url(filename: str) -> str:
+        return url_for("versioned_static", version=STATIC_VERSION.current(), filename=filename)
+
+    return {"static_url": static_url}
+
+
+@app.get("/static/v/<version>/<path:filename>")
+def versioned_static(version: str, filename: str):
+    # Relative URLs inside CSS (images/...) inherit the version prefix, so they are covered too.
+    # A stale version (old cached page) still gets the file, just without the long cache lifetime.
+    is_current = version == STATIC_VERSION.current()
+    response = send_from_directory(app.static_folder, filename, max_age=STATIC_MAX_AGE_SECONDS if is_current else 0)
+    if is_current:
+        response.headers["Cache-Control"] = f"public, max-age={STATIC_MAX_AGE_SECONDS}, immutable"
+    return response
+
+
+if metrics.ENABLED:
+    # Request and template timing hooks are only installed when metrics are on. Registered before
+    # _compress so the request latency includes compression (after_request hooks run in reverse).
+
+    @app.before_request
+    def _start_request_timer():
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def _record_request(response):
+        started = g.pop("request_started", None)
+        if started is not None:
+            endpoint = request.endpoint or "unmatched"
+            metrics.observe("http_request_duration_seconds", time.perf_counter() - started, endpoint=endpoint)
+            metrics.inc("http_requests_total", endpoint=endpoint, method=request.method, status=response.status_code)
+        return response
+
+    def _start_template_timer(sender, template, context, **extra):
+        g.setdefault("template_started", []).append(time.perf_counter())
+
+    def _record_template(sender, template, context, **extra):
+        started = g.get("template_started")
+        if started:
+            metrics.record_stage("render_template", time.perf_counter() - started.pop(), template=template.name)
+
+    before_render_template.connect(_start_template_timer, app)
+    template_rendered.connect(_record_template, app)
+
+
+# Opt-in profiling: one allowlisted request's ranking under cProfile, or process-wide stack sampling.
+PROFILER = RequestProfiler(PROFILE_DIR, PROFILE_ALLOWED_IPS, PROFILE_MAX_FILES)
+SAMPLER = StackSampler(PROFILE_SAMPLE_INTERVAL_SECONDS)
+
+
+@app.before_request
+def _start_sampler():
+    SAMPLER.start()
+
+
+@app.after_request
+def _tag_profiled_response(response):
+    # A batch request captures one profile per query, listed in query order.
+    profile_ids = g.pop("profile_ids", None)
+    if profile_ids:
+        response.headers[PROFILE_ID_HEADER] = ", ".join(profile_ids)
+    return response
+
+
+@app.after_request
+def _compress(response):
+    return compress_response(request, response)
+
+
+DATASET_FILES = [RECOMMENDATION_SAMPLE_FILE, EVENT_STORE_FILE]
+# Published files are fingerprinted from their manifest; only files edited by hand are re-hashed.
+DATASET_DIGEST = functools.partial(dataset_digest, manifest_path=DATASET_MANIFEST_FILE)
+USE_SHARED_DATASET = SHARED_DATASET_ENABLED and HAS_PYARROW and not EVENT_DB_ENABLED
+if EVENT_DB_ENABLED:
+    DATASET_FILES.append(EVENT_DB_FILE)
+
+
+def load_web_event_index() -> EventIndex | EventDatabase:
+    # With EVENT_DB=1 each request queries the SQLite store; nothing is loaded up front.
+    if EVENT_DB_ENABLED:
+        if not event_db_is_current(EVENT_DB_FILE, RECOMMENDATION_SAMPLE_FILE):
+            write_event_db(RECOMMENDATION_SAMPLE_FILE, EVENT_DB_FILE)
+        return EventDatabase(EVENT_DB_FILE)
+    # Workers share one published, memory-mapped copy; the first to see new files publishes it.
+    if USE_SHARED_DATASET:
+        return load_shared_index(SHARED_DATASET_DIR, DATASET_FILES, load_event_index, DATASET_DIGEST)
+    return load_event_index()
+
+
+# Prepared dataset for this process, rebuilt in the background when the published files change.
+# With the shared dataset, watching CURRENT lets every worker follow generations published by another;
+# the worker that published a generation does not reload it again when it sees CURRENT change.
+DATASET = DatasetWatcher(
+    load_web_event_index,
+    DATASET_FILES + ([SHARED_DATASET_DIR / CURRENT_FILE] if USE_SHARED_DATASET else []),
+    poll_seconds=DATASET_RELOAD_INTERVAL_SECONDS,
+    backoff_max_seconds=DATASET_RELOAD_BACKOFF_MAX_SECONDS,
+    on_swap=lambda _snapshot: RANKING_CACHE.clear(),
+    digest=DATASET_DIGEST,
+    still_current=(
+        functools.partial(shared_index_is_current, SHARED_DATASET_DIR, source_paths=DATASET_FILES, digest=DATASET_DIGEST)
+        if USE_SHARED_DATASET
+        else None
+    ),
+)
+
+
+# Generated plans live here, not in the cookie session; the session only carries `result_id`.
+RESULT_STORE = ResultStore(RESULT_STORE_FILE, RESULT_STORE_TTL_SECONDS, RESULT_STORE_MAX_ENTRIES)
+
+
+def rank_for_request(df: EventIndex | EventDatabase, prefs: UserPreferences) -> tuple[list[dict], dict[str, int]]:
+    # A profiled request bypasses the ranking cache so the profile shows the real work.
+    if not PROFILER.requested(request):
+        return generate_suggestions_and_summary_for_preferences(df, prefs)
+    result, profile_id = PROFILER.run(
+        lambda: _rank_preferences(df, prefs),
+        endpoint=request.endpoint,
+        preferences=dataclasses.asdict(prefs),
+        dataset_version=df.version,
+        captured_at=time.time(),
+    )
+    g.setdefault("profile_ids", []).append(profile_id)
+    return result
+
+
+def get_cached_df() -> EventIndex | EventDatabase | None:
+    # Each request takes one snapshot reference and keeps it even if a reload swaps in a new one.
+    return DATASET.current()
 
 
 def build_user_preferences_from_session() -> UserPreferences:
@@ -271,7 +494,7 @@ def build_user_preferences_from_session() -> UserPreferences:
     return UserPreferences(
         budget=float(session.get("budget", 75.0)),
         preferred_period=str(session.get("preferred_period", "any")),
-        max_results=int(session.get("max_results", 3)),
+        max_results=_cap_max_results(session.get("max_results", 3)),
         event_date=(session.get("event_date") or None) or None,
         allow_flexible_dates=bool(session.get("allow_flexible_dates", False)),
     )
@@ -282,12 +505,159 @@ def healthz():
     return "ok", 200
 
 
+@app.get("/healthz/cache")
+def cache_stats():
+    return jsonify(ranking_cache=RANKING_CACHE.stats())
+
+
+def _dataset_metrics():
+    # Computed at scrape time from live state, so they cost nothing between scrapes.
+    snapshot = DATASET.snapshot
+    yield "event_dataset_rows", "gauge", {}, len(snapshot) if snapshot is not None else 0
+    yield "event_dataset_generation", "gauge", {}, DATASET.generation
+    yield "event_dataset_load_error", "gauge", {}, 1 if DATASET.last_error else 0
+    mtimes = [path.stat().st_mtime for path in DATASET_FILES if path.exists()]
+    if mtimes:
+        yield "event_dataset_age_seconds", "gauge", {}, max(0.0, time.time() - max(mtimes))
+    stats = RANKING_CACHE.stats()
+    for field in ("hits", "misses", "evictions", "expirations", "invalidations"):
+        yield f"ranking_cache_{field}_total", "counter", {}, stats[field]
+    yield "ranking_cache_entries", "gauge", {}, stats["size"]
+    yield "ranking_cache_hit_ratio", "gauge", {}, stats["hit_ratio"]
+
+
+metrics.register_collector(_dataset_metrics)
+
+
+@app.get("/debug/profile/samples")
+def profile_samples():
+    # Aggregated stack samples for this worker; ?format=collapsed feeds flamegraph tools, ?reset=1 starts over.
+    if not PROFILER.enabled or request.remote_addr not in PROFILER.allowed_ips:
+        return "not found", 404
+    if request.args.get("format") == "collapsed":
+        response = Response(SAMPLER.collapsed(), mimetype="text/plain")
+    else:
+        response = jsonify(SAMPLER.report(limit=request.args.get("limit", 25, type=int)))
+    if request.args.get("reset") == "1":
+        SAMPLER.reset()
+    return response
+
+
+@app.get("/metrics")
+def metrics_endpoint():
+    if not metrics.ENABLED:
+        return "metrics disabled", 404
+    return Response(metrics.render_prometheus(), mimetype="text/plain; version=0.0.4")
+
+
+# JSON API: stateless ranking for scripted clients (kiosk, newsletter jobs).
+
+_TRUE_VALUES = {"1", "true", "yes", "on"}
+
+
+def _api_flag(value: object) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value or "").strip().lower() in _TRUE_VALUES
+
+
+def _api_number(params: dict, name: str, default: float, cast: type = float) -> float:
+    raw = params.get(name)
+    if raw is None or str(raw).strip() == "":
+        return default
+    try:
+        value = cast(raw)
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(f"Invalid {name}: {raw!r}") from None
+    # float() accepts "nan" and "inf", which would poison the cost scores.
+    if not math.isfinite(value):
+        raise ValueError(f"Invalid {name}: {raw!r}")
+    return value
+
+
+def user_preferences_from_params(params: dict) -> UserPreferences:
+    """Validate API query/JSON parameters into preferences, mirroring the wizard defaults."""
+    period = str(params.get("period") or "any").strip().lower()
+    if period not in {"morning", "afternoon", "evening", "any"}:
+        raise ValueError(f"Invalid period: {period!r}")
+
+    event_date = None
+    raw_date = str(params.get("date") or "").strip()
+    if raw_date:
+        parsed = pd.to_datetime(raw_date, errors="coerce")
+        if pd.isna(parsed):
+            raise ValueError(f"Invalid date: {raw_date!r}")
+        event_date = pd.Timestamp(parsed).strftime("%Y-%m-%d")
+
+    return UserPreferences(
+        budget=max(0.0, _api_number(params, "budget", 75.0)),
+        preferred_period=period,
+        max_results=_cap_max_results(_api_number(params, "max_results", 3, int)),
+        min_price=max(0.0, _api_number(params, "min_price", 0.0)),
+        event_date=event_date,
+        # Flexible dates only applies with a target date, as in the wizard.
+        allow_flexible_dates=event_date is not None and _api_flag(params.get("flexible")),
+    )
+
+
+def _api_result(df: EventIndex | EventDatabase, params: dict) -> dict:
+    try:
+        prefs = user_preferences_from_params(params)
+    except ValueError as exc:
+        return {"error": str(exc)}
+    plans, summary = rank_for_request(df, prefs)
+    return {"plans": plans, "summary": summary}
+
+
+def _api_dataset_unavailable():
+    return jsonify(error=f"Dataset is not available yet: {DATASET.last_error}"), 503
+
+
+@app.get("/api/suggestions")
+def api_suggestions():
+    df = get_cached_df()
+    if df is None:
+        return _api_dataset_unavailable()
+    try:
+        prefs = user_preferences_from_params(request.args.to_dict())
+    except ValueError as exc:
+        return jsonify(error=str(exc)), 400
+
+    # Same dataset version and normalized preferences always rank identically.
+    etag = content_etag(df.version, preferences_cache_key(prefs))
+    if etag_matches(request, etag) and not PROFILER.requested(request):
+        return not_modified(request, etag, "no-cache")
+    plans, summary = rank_for_request(df, prefs)
+    response = jsonify(dataset_version=df.version, plans=plans, summary=summary)
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+@app.post("/api/suggestions/batch")
+def api_suggestions_batch():
+    payload = request.get_json(silent=True)
+    queries = payload.get("queries") if isinstance(payload, dict) else payload
+    if not isinstance(queries, list) or not all(isinstance(query, dict) for query in queries):
+        return jsonify(error='Expected a JSON list of preference objects (or {"queries": [...]}).'), 400
+    if len(queries) > API_BATCH_MAX_QUERIES:
+        return jsonify(error=f"Too many queries: {len(queries)} > {API_BATCH_MAX_QUERIES}."), 400
+
+    df = get_cached_df()
+    if df is None:
+        return _api_dataset_unavailable()
+    # One snapshot for the whole batch; repeated preference sets are served from the ranking cache
+    # (a profiled batch ranks every query uncached, one profile each).
+    # An invalid entry gets its own {"error": ...} instead of failing the batch.
+    return jsonify(dataset_version=df.version, results=[_api_result(df, query) for query in queries])
+
+
 @app.route("/")
 def web_menu():
-    get_cached_df()
+    df = get_cached_df()
     message = session.pop("message", None)
-    if _LOAD_ERROR:
-        message = f"Dataset load error: {_LOAD_ERROR}"
+    if df is None and DATASET.last_error:
+        message = f"Dataset load error: {DATASET.last_error}"
     return render_template("menu.html", message=message)
 
 
@@ -405,23 +775,25 @@ def wizard_max_results():
             return render_template(
                 "step.html",
                 title="Number of suggestions to generate",
-                help_text="Enter an integer (default 3).",
+                help_text=f"Enter an integer (default 3, at most {MAX_RESULTS_CAP}).",
                 input_type="number",
                 min="1",
+                max_value=str(MAX_RESULTS_CAP),
                 step="1",
                 default=str(session.get("max_results", 3)),
                 error="Invalid integer.",
             )
 
-        session["max_results"] = max(1, max_results)
+        session["max_results"] = _cap_max_results(max_results)
         return redirect(url_for("wizard_generate"))
 
     return render_template(
         "step.html",
         title="Number of suggestions to generate",
-        help_text="Default is 3",
+        help_text=f"Default is 3 (at most {MAX_RESULTS_CAP})",
         input_type="number",
         min="1",
+        max_value=str(MAX_RESULTS_CAP),
         step="1",
         default=str(session.get("max_results", 3)),
     )
@@ -431,15 +803,22 @@ def wizard_max_results():
 def wizard_generate():
     df = get_cached_df()
     if df is None:
-        session.pop("suggestion_summary", None)
-        session["message"] = f"Dataset is not available yet: {_LOAD_ERROR}"
+        session.pop("result_id", None)
+        session["message"] = f"Dataset is not available yet: {DATASET.last_error}"
         return redirect(url_for("web_menu"))
 
     prefs = build_user_preferences_from_session()
-    plans, summary = generate_suggestions_and_summary_for_preferences(df, prefs)
-    session["generated_plans"] = plans
+    plans, summary = rank_for_request(df, prefs)
     # Summary powers the message like "Requested N, showing M..." on suggestions page.
-    session["suggestion_summary"] = summary
+    session["result_id"] = RESULT_STORE.put(
+        {
+            "plans": plans,
+            "summary": summary,
+            # ETag inputs for the rendered suggestions pages.
+            "dataset_version": df.version,
+            "preferences_key": list(preferences_cache_key(prefs)),
+        }
+    )
 
     if not plans:
         session["message"] = (
@@ -451,11 +830,62 @@ def wizard_generate():
     return redirect(url_for("suggestions"))
 
 
+def _suggestions_page(plans: list[dict], cursor: str | None) -> tuple[list[dict], dict[str, int | None]]:
+    # The cursor is an offset into the stored (immutable) ranking, so pages stay stable
+    # and paging only slices it; nothing is re-ranked.
+    try:
+        offset = int(cursor or 0)
+    except ValueError:
+        offset = 0
+    size = max(1, SUGGESTIONS_PAGE_SIZE)
+    # Past the end (a stale or hand-edited link) shows the last full page, not a lone row.
+    offset = max(0, offset)
+    if offset >= len(plans):
+        offset = (max(0, len(plans) - 1) // size) * size
+    page_plans = plans[offset:offset + size]
+    return page_plans, {
+        "offset": offset,
+        "total": len(plans),
+        "next_cursor": offset + size if offset + size < len(plans) else None,
+        "prev_cursor": max(0, offset - size) if offset > 0 else None,
+    }
+
+
 @app.route("/suggestions")
-def suggestions():
-    plans = session.get("generated_plans", [])
-    summary = session.get("suggestion_summary")
-    return render_template("suggestions.html", plans=plans, summary=summary)
+@app.route("/suggestions/<result_id>")
+def suggestions(result_id: str | None = None):
+    result_id = result_id or session.get("result_id", "")
+    # Expired or unknown IDs render the same "no suggestions" page as an empty session.
+    result = RESULT_STORE.get(result_id) or {}
+    plans, page = _suggestions_page(result.get("plans", []), request.args.get("cursor"))
+
+    etag = None
+    if result:
+        # Stored results are immutable, so the page bytes only depend on these inputs.
+        etag = content_etag(
+            result_id,
+            result.get("dataset_version"),
+            result.get("preferences_key"),
+            page["offset"],
+            SUGGESTIONS_PAGE_SIZE,
+            STATIC_VERSION.current(),
+        )
+        if etag_matches(request, etag):
+            return not_modified(request, etag, "private, no-cache")
+
+    response = app.make_response(
+        render_template(
+            "suggestions.html",
+            plans=plans,
+            summary=result.get("summary"),
+            page=page,
+            result_id=result_id,
+        )
+    )
+    if etag:
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "private, no-cache"
+    return response
 
 
 @app.route("/exit")
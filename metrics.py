@@ -0,0 +1,268 @@
+"""
+Low-overhead in-process metrics: stage timers, counters and gauges, rendered as
+Prometheus text for the web app's /metrics endpoint.
+With METRICS_ENABLED=0 the decorators return the undecorated functions and every
+hook returns immediately, so instrumentation costs nothing.
+Metrics are per process; under gunicorn each worker reports its own series.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+from config import METRICS_ENABLED
+
+ENABLED = METRICS_ENABLED
+
+# Upper bounds (seconds) shared by all latency histograms; +Inf is implied.
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+METRIC_HELP = {
+    "event_stage_duration_seconds": ("histogram", "Wall time per pipeline stage."),
+    "event_stage_rows_total": ("counter", "Rows produced by each pipeline stage."),
+    "event_stage_last_rows": ("gauge", "Rows produced by the latest run of each pipeline stage."),
+    "event_ranked_rows_total": ("counter", "Ranked rows contributed by each match level."),
+    "http_request_duration_seconds": ("histogram", "Web request latency by endpoint."),
+    "http_requests_total": ("counter", "Web requests by endpoint, method and status."),
+}
+
+Labels = tuple[tuple[str, str], ...]
+F = TypeVar("F", bound=Callable[..., Any])
+T = TypeVar("T")
+
+
+class _Histogram:
+    __slots__ = ("bucket_counts", "total", "count")
+
+    def __init__(self) -> None:
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+_lock = threading.Lock()
+_histograms: dict[tuple[str, Labels], _Histogram] = {}
+_counters: dict[tuple[str, Labels], float] = {}
+_gauges: dict[tuple[str, Labels], float] = {}
+_collectors: list[Callable[[], Iterable[tuple[str, str, dict[str, Any], float]]]] = []
+
+
+def _labels(labels: dict[str, Any]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def observe(name: str, value: float, **labels: Any) -> None:
+    if not ENABLED:
+        return
+    key = (name, _labels(labels))
+    with _lock:
+        histogram = _histograms.get(key)
+        if histogram is None:
+            histogram = _histograms[key] = _Histogram()
+        histogram.observe(value)
+
+
+def inc(name: str, amount: float = 1.0, **labels: Any) -> None:
+    if not ENABLED:
+        return
+    key = (name, _labels(labels))
+    with _lock:
+        _counters[key] = _counters.get(key, 0.0) + amount
+
+
+def set_gauge(name: str, value: float, **labels: Any) -> None:
+    if not ENABLED:
+        return
+    with _lock:
+        _gauges[(name, _labels(labels))] = value
+
+
+def record_stage(stage: str, seconds: float, rows: int | None = None, **labels: Any) -> None:
+    observe("event_stage_duration_seconds", seconds, stage=stage, **labels)
+    if rows is not None:
+        inc("event_stage_rows_total", rows, stage=stage, **labels)
+        set_gauge("event_stage_last_rows", rows, stage=stage, **labels)
+
+
+def _row_count(result: Any) -> int | None:
+    # Stages return a frame/index, or (frame, summary) for the flexible ranking.
+    if isinstance(result, tuple) and result:
+        result = result[0]
+    try:
+        return len(result)
+    except TypeError:
+        return None
+
+
+def timed_stage(stage: str) -> Callable[[F], F]:
+    """Record the wrapped function's duration and result row count under `stage`."""
+
+    def decorator(function: F) -> F:
+        if not ENABLED:
+            return function
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            result = function(*args, **kwargs)
+            record_stage(stage, time.perf_counter() - started, _row_count(result))
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+class _StageTimer:
+    __slots__ = ("stage", "labels", "rows", "_started")
+
+    def __init__(self, stage: str, labels: dict[str, Any]) -> None:
+        self.stage = stage
+        self.labels = labels
+        self.rows: int | None = None
+
+    def __enter__(self) -> "_StageTimer":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        record_stage(self.stage, time.perf_counter() - self._started, self.rows, **self.labels)
+
+
+class _NullTimer:
+    # Shared no-op stand-in while metrics are disabled; assigned rows are simply dropped.
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def stage_timer(stage: str, **labels: Any) -> _StageTimer | _NullTimer:
+    """Context manager timing a block; set `.rows` inside it to record a row count."""
+    if not ENABLED:
+        return _NULL_TIMER
+    return _StageTimer(stage, labels)
+
+
+def timed_iter(items: Iterable[T], stage: str, **labels: Any) -> Iterable[T]:
+    """
+    Pass `items` through, recording the time spent producing them and their count under
+    `stage` once the iterator is exhausted or closed. Consumer time is not included.
+    """
+    if not ENABLED:
+        return items
+    return _timed_iter(iter(items), stage, labels)
+
+
+def _timed_iter(iterator: Iterator[T], stage: str, labels: dict[str, Any]) -> Iterator[T]:
+    seconds, rows = 0.0, 0
+    try:
+        while True:
+            started = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                seconds += time.perf_counter() - started
+            rows += 1
+            yield item
+    finally:
+        record_stage(stage, seconds, rows, **labels)
+
+
+def register_collector(collector: Callable[[], Iterable[tuple[str, str, dict[str, Any], float]]]) -> None:
+    """Add a callback yielding (name, type, labels, value) samples computed at scrape time."""
+    _collectors.append(collector)
+
+
+def stage_summary() -> list[tuple[str, int, float]]:
+    """(stage, runs, total seconds) per stage label set, for end-of-run console reports."""
+    with _lock:
+        return sorted(
+            (
+                ",".join(f"{key}={value}" for key, value in labels),
+                histogram.count,
+                histogram.total,
+            )
+            for (name, labels), histogram in _histograms.items()
+            if name == "event_stage_duration_seconds"
+        )
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Labels | Iterable[tuple[str, str]]) -> str:
+    labels = tuple(labels)
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def render_prometheus() -> str:
+    """Current metrics in the Prometheus text exposition format (version 0.0.4)."""
+    with _lock:
+        histograms = {key: (list(h.bucket_counts), h.total, h.count) for key, h in _histograms.items()}
+        counters = dict(_counters)
+        gauges = dict(_gauges)
+
+    samples: dict[str, list[str]] = {}
+    types: dict[str, str] = {}
+
+    for (name, labels), (bucket_counts, total, count) in sorted(histograms.items()):
+        types[name] = "histogram"
+        lines = samples.setdefault(name, [])
+        cumulative = 0
+        for bound, bucket_count in zip(LATENCY_BUCKETS + (float("inf"),), bucket_counts):
+            cumulative += bucket_count
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f"{name}_bucket{_format_labels(labels + (('le', le),))} {cumulative}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(total)}")
+        lines.append(f"{name}_count{_format_labels(labels)} {count}")
+
+    for metric_type, values in (("counter", counters), ("gauge", gauges)):
+        for (name, labels), value in sorted(values.items()):
+            types[name] = metric_type
+            samples.setdefault(name, []).append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+    for collector in _collectors:
+        for name, metric_type, labels, value in collector():
+            types[name] = metric_type
+            samples.setdefault(name, []).append(f"{name}{_format_labels(_labels(labels))} {_format_value(value)}")
+
+    output: list[str] = []
+    for name, lines in samples.items():
+        metric_type, help_text = METRIC_HELP.get(name, (types[name], ""))
+        if help_text:
+            output.append(f"# HELP {name} {help_text}")
+        output.append(f"# TYPE {name} {metric_type}")
+        output.extend(lines)
+    return "\n".join(output) + "\n"
@@ -0,0 +1,230 @@
+"""
+On-demand profiling for the web app.
+An allowlisted client can ask for one request's ranking to run under cProfile; the stats are
+saved to a rotating directory next to a JSON sidecar holding the preferences, so the run can be
+replayed offline (`python profiling.py replay <id>`). A background stack sampler aggregates
+hot spots across all requests of a process.
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import io
+import json
+import os
+import pstats
+import secrets
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from config import PROFILE_DIR, PROJECT_ROOT
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_QUERY_FLAG = "profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+
+class RequestProfiler:
+    """Runs single calls under cProfile and keeps the newest `max_files` profiles in `directory`."""
+
+    def __init__(self, directory: Path | str, allowed_ips: Iterable[str], max_files: int = 50) -> None:
+        self.directory = Path(directory)
+        self.allowed_ips = frozenset(allowed_ips)
+        self.max_files = max(1, int(max_files))
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.allowed_ips)
+
+    def requested(self, request: Any) -> bool:
+        # The client address is the direct peer; behind a proxy, allowlist the proxy or apply ProxyFix.
+        if not self.enabled or request.remote_addr not in self.allowed_ips:
+            return False
+        flag = request.headers.get(PROFILE_HEADER) or request.args.get(PROFILE_QUERY_FLAG) or ""
+        return flag.strip().lower() in {"1", "true", "yes", "on"}
+
+    def run(self, function: Callable[[], Any], **metadata: Any) -> tuple[Any, str]:
+        """Call `function` under cProfile; returns (result, profile_id)."""
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        result = profiler.runcall(function)
+        duration = time.perf_counter() - started
+
+        profile_id = f"{datetime.now():%Y%m%d-%H%M%S}-{secrets.token_hex(3)}"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(self.directory / f"{profile_id}.prof")
+        sidecar = {"id": profile_id, "duration_seconds": round(duration, 6), "pid": os.getpid(), **metadata}
+        (self.directory / f"{profile_id}.json").write_text(json.dumps(sidecar, indent=2, default=str), encoding="utf-8")
+        self._rotate()
+        return result, profile_id
+
+    def _rotate(self) -> None:
+        with self._lock:
+            # IDs start with a timestamp, so name order is age order.
+            sidecars = sorted(self.directory.glob("*.json"))
+            for stale in sidecars[: max(0, len(sidecars) - self.max_files)]:
+                stale.with_suffix(".prof").unlink(missing_ok=True)
+                stale.unlink(missing_ok=True)
+
+
+class StackSampler:
+    """
+    Periodically samples every busy thread's stack in this process. Only stacks running project
+    code are kept, attributed to their innermost project frame (file:function:line).
+    """
+
+    def __init__(self, interval_seconds: float, project_root: Path | str = PROJECT_ROOT) -> None:
+        self.interval_seconds = float(interval_seconds)
+        self.project_root = str(Path(project_root).resolve())
+        self.samples = 0
+        self._hot_spots: Counter[str] = Counter()
+        self._stacks: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._thread_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        if self.interval_seconds <= 0:
+            return
+        with self._thread_lock:
+            # Threads do not survive fork, so gunicorn workers (re)start their own sampler here.
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            self.sample_once()
+
+    def _is_project_file(self, filename: str) -> bool:
+        return filename.startswith(self.project_root) and "site-packages" not in filename
+
+    def sample_once(self) -> None:
+        own_thread = threading.get_ident()
+        hot_spots: list[str] = []
+        stacks: list[str] = []
+        for thread_id, frame in sys._current_frames().items():
+            # Skip this thread and idle ones parked in Event/Condition.wait (e.g. the dataset watcher).
+            if thread_id == own_thread or frame.f_code.co_filename == threading.__file__:
+                continue
+            names: list[str] = []
+            innermost: str | None = None
+            while frame is not None:
+                code = frame.f_code
+                if self._is_project_file(code.co_filename):
+                    module = Path(code.co_filename).name
+                    names.append(f"{module}:{code.co_name}")
+                    if innermost is None:
+                        innermost = f"{module}:{code.co_name}:{frame.f_lineno}"
+                frame = frame.f_back
+            if innermost is None:
+                continue
+            hot_spots.append(innermost)
+            stacks.append(";".join(reversed(names)))
+        with self._lock:
+            self.samples += 1
+            self._hot_spots.update(hot_spots)
+            self._stacks.update(stacks)
+
+    def report(self, limit: int = 25) -> dict[str, Any]:
+        with self._lock:
+            busy = sum(self._hot_spots.values())
+            return {
+                "interval_seconds": self.interval_seconds,
+                "samples": self.samples,
+                "busy_samples": busy,
+                "hot_spots": [
+                    {"location": location, "samples": count, "share": round(count / busy, 4)}
+                    for location, count in self._hot_spots.most_common(limit)
+                ],
+            }
+
+    def collapsed(self) -> str:
+        # "frame;frame;frame count" lines, the input format of flamegraph tools.
+        with self._lock:
+            return "".join(f"{stack} {count}\n" for stack, count in self._stacks.most_common())
+
+    def reset(self) -> None:
+        with self._lock:
+            self.samples = 0
+            self._hot_spots.clear()
+            self._stacks.clear()
+
+
+def _resolve_profile(reference: str) -> Path:
+    path = Path(reference)
+    if path.suffix in {".json", ".prof"} and path.exists():
+        return path.with_suffix(".json")
+    return PROFILE_DIR / f"{reference}.json"
+
+
+def _print_stats(profile: cProfile.Profile | Path, limit: int, sort: str) -> None:
+    stream = io.StringIO()
+    stats = pstats.Stats(str(profile) if isinstance(profile, Path) else profile, stream=stream)
+    stats.sort_stats(sort).print_stats(limit)
+    print(stream.getvalue())
+
+
+def replay(reference: str, limit: int = 30, sort: str = "cumulative") -> None:
+    """Re-run a saved request's ranking locally, under cProfile, against the current dataset."""
+    # Imported here: the web app imports this module.
+    from main import _rank_preferences, load_event_index
+    from recommend import UserPreferences
+
+    sidecar = json.loads(_resolve_profile(reference).read_text(encoding="utf-8"))
+    prefs = UserPreferences(**sidecar["preferences"])
+    index = load_event_index()
+    if sidecar.get("dataset_version") and sidecar["dataset_version"] != index.version:
+        print(f"Note: dataset changed since the capture ({sidecar['dataset_version']} -> {index.version}).")
+    print(f"Replaying {sidecar['id']} ({sidecar.get('endpoint')}): {prefs}")
+
+    profiler = cProfile.Profile()
+    profiler.runcall(_rank_preferences, index, prefs)
+    _print_stats(profiler, limit, sort)
+
+
+def show(reference: str, limit: int = 30, sort: str = "cumulative") -> None:
+    sidecar_path = _resolve_profile(reference)
+    print(sidecar_path.read_text(encoding="utf-8"))
+    _print_stats(sidecar_path.with_suffix(".prof"), limit, sort)
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Inspect or replay request profiles saved by the web app.")
+    parser.add_argument("command", choices=["show", "replay", "list"])
+    parser.add_argument("profile", nargs="?", help=f"Profile ID (under {PROFILE_DIR}) or path to its .json/.prof file.")
+    parser.add_argument("--limit", type=int, default=30, help="Number of functions to print.")
+    parser.add_argument("--sort", default="cumulative", help="pstats sort key (cumulative, tottime, calls, ...).")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    if args.command == "list":
+        for sidecar_path in sorted(PROFILE_DIR.glob("*.json")):
+            sidecar = json.loads(sidecar_path.read_text(encoding="utf-8"))
+            print(f"{sidecar['id']}  {sidecar.get('endpoint', '-'):<20} {sidecar['duration_seconds']:.4f}s  {sidecar.get('preferences')}")
+        return
+    if not args.profile:
+        raise SystemExit(f"{args.command} needs a profile ID.")
+    if args.command == "show":
+        show(args.profile, args.limit, args.sort)
+    else:
+        replay(args.profile, args.limit, args.sort)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,16 @@ Filter and rank events by time of day, date, and price.
 
 from __future__ import annotations
 
+import hashlib
 import re
 from dataclasses import dataclass, replace
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from metrics import inc, stage_timer, timed_stage
+
 
 @dataclass
 class UserPreferences:
@@ -49,6 +53,9 @@ MATCH_LEVEL_LABEL = {
 
 FLEXIBLE_DATE_WINDOW_DAYS = 3
 
+# Sentinel period code for events without a parseable start time.
+NO_PERIOD_CODE = -1
+
 
 def _normalize_period(value: Any, default: str = "any") -> str:
     text = str(value or "").strip().lower()
@@ -70,14 +77,6 @@ def _normalize_event_date(value: Any) -> pd.Timestamp | None:
     return pd.Timestamp(timestamp).normalize()
 
 
-def _hour_to_period(hour: int) -> str:
-    if 5 <= hour < 12:
-        return "morning"
-    if 12 <= hour < 17:
-        return "afternoon"
-    return "evening"
-
-
 def _parse_price_text(value: Any) -> float:
     if value is None or pd.isna(value):
         return 0.0
@@ -112,6 +111,7 @@ def _coerce_start_time(df: pd.DataFrame) -> pd.Series:
     return combined.fillna(date_only)
 
 
+@timed_stage("prepare_candidates")
 def _prepare_candidates(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return df.copy()
@@ -124,15 +124,19 @@ def _prepare_candidates(df: pd.DataFrame) -> pd.DataFrame:
             + ", ".join(missing_columns)
         )
 
-    prepared = df[required_columns].copy()
+    # The typed event store ships these pre-parsed; only derive them when absent.
+    preparsed_columns = [column for column in ("estimated_cost", "start_time") if column in df.columns]
+    prepared = df[required_columns + preparsed_columns].copy()
 
     for column in required_columns:
         if column != "price":
             prepared[column] = prepared[column].fillna("").astype(str).str.strip()
 
-    prepared["estimated_cost"] = prepared["price"].apply(_parse_price_text)
+    if "estimated_cost" not in preparsed_columns:
+        prepared["estimated_cost"] = prepared["price"].apply(_parse_price_text)
 
-    prepared["start_time"] = _coerce_start_time(prepared)
+    if "start_time" not in preparsed_columns:
+        prepared["start_time"] = _coerce_start_time(prepared)
     prepared["name"] = prepared["name"].fillna("").astype(str)
     prepared = prepared[prepared["name"].str.strip() != ""]
 
@@ -143,23 +147,156 @@ def _prepare_candidates(df: pd.DataFrame) -> pd.DataFrame:
     return prepared
 
 
+def _period_codes(start_times: pd.Series) -> np.ndarray:
+    # Map start hours to PERIOD_INDEX codes: morning 5-11, afternoon 12-16, evening otherwise.
+    # Missing timestamps get NO_PERIOD_CODE.
+    hours = start_times.dt.hour.to_numpy(dtype="float64", na_value=np.nan)
+    codes = np.select(
+        [np.isnan(hours), (hours >= 5) & (hours < 12), (hours >= 12) & (hours < 17)],
+        [NO_PERIOD_CODE, PERIOD_INDEX["morning"], PERIOD_INDEX["afternoon"]],
+        default=PERIOD_INDEX["evening"],
+    )
+    return codes.astype("int8")
+
+
+def _dedupe_keys(df: pd.DataFrame) -> pd.Series:
+    # Stable event identity used to deduplicate items that can reappear across stages:
+    # (source, name, date, time, location), case-folded where it matters, joined into one string.
+    parts = [
+        df["source"].astype(str).str.strip().str.lower(),
+        df["name"].astype(str).str.strip().str.lower(),
+        df["date"].astype(str).str.strip(),
+        df["time"].astype(str).str.strip(),
+        df["location"].astype(str).str.strip().str.lower(),
+    ]
+    return parts[0].str.cat(parts[1:], sep="\x1f")
+
+
+# Sort key for events without a start day: after every real day, so searches never reach them.
+_MISSING_DAY = np.iinfo("int64").max
+
+
+def _day_ordinals(days: pd.Series) -> np.ndarray:
+    ordinals = days.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]").astype("int64")
+    return np.where(days.isna().to_numpy(), _MISSING_DAY, ordinals)
+
+
+@dataclass(frozen=True, eq=False)
+class EventIndex:
+    """
+    Prepared, read-only candidate frame built once per loaded dataset.
+    Holds parsed costs and start times plus helper columns (`_event_day`, `_period_code`,
+    `_dedupe_key`) so ranking stages only filter it and never re-run _prepare_candidates.
+    `day_order`/`sorted_days` are a day-sorted permutation of the rows, so date and
+    date-window lookups are binary searches instead of full scans.
+    `version` fingerprints the dataset contents, so results cached against one load are
+    never served for another.
+    """
+
+    frame: pd.DataFrame
+    costs: np.ndarray
+    period_codes: np.ndarray
+    dedupe_keys: np.ndarray
+    day_order: np.ndarray
+    sorted_days: np.ndarray
+    version: str = ""
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    @property
+    def empty(self) -> bool:
+        return self.frame.empty
+
+    def day_window(self, target_date: pd.Timestamp, radius_days: int = 0) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Row positions (in dataset order) of events within `radius_days` of `target_date`,
+        with each event's distance in whole days.
+        """
+        day = int(np.datetime64(target_date.normalize(), "D").astype("int64"))
+        start = np.searchsorted(self.sorted_days, day - radius_days, side="left")
+        stop = np.searchsorted(self.sorted_days, day + radius_days, side="right")
+        positions = self.day_order[start:stop]
+        distances = np.abs(self.sorted_days[start:stop] - day).astype("float64")
+        # Restore dataset order so score ties resolve exactly as in a full scan.
+        restore = np.argsort(positions, kind="stable")
+        return positions[restore], distances[restore]
+
+
+def _dataset_version(df: pd.DataFrame) -> str:
+    hashed = pd.util.hash_pandas_object(df.astype(str), index=False).to_numpy()
+    digest = hashlib.sha1(hashed.tobytes())
+    digest.update(",".join(map(str, df.columns)).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+@timed_stage("build_event_index")
+def build_event_index(df: pd.DataFrame) -> EventIndex:
+    prepared = _prepare_candidates(df)
+    if not prepared.empty:
+        start_times = pd.to_datetime(prepared["start_time"], errors="coerce")
+        prepared["_event_day"] = start_times.dt.normalize()
+        prepared["_period_code"] = _period_codes(start_times)
+        prepared["_dedupe_key"] = _dedupe_keys(prepared)
+        day_ordinals = _day_ordinals(prepared["_event_day"])
+    else:
+        day_ordinals = np.empty(0, dtype="int64")
+
+    day_order = np.argsort(day_ordinals, kind="stable")
+    return EventIndex(
+        frame=prepared,
+        costs=_cost_array(prepared) if not prepared.empty else np.empty(0),
+        period_codes=(
+            prepared["_period_code"].to_numpy() if not prepared.empty else np.empty(0, dtype="int8")
+        ),
+        # Integer codes of `_dedupe_key`: equality is all dedupe needs, and they can be memory-mapped.
+        dedupe_keys=(
+            pd.factorize(prepared["_dedupe_key"])[0] if not prepared.empty else np.empty(0, dtype="int64")
+        ),
+        day_order=day_order,
+        sorted_days=day_ordinals[day_order],
+        version=_dataset_version(df),
+    )
+
+
+def _as_prepared(df: pd.DataFrame | EventIndex) -> pd.DataFrame:
+    if isinstance(df, EventIndex):
+        return df.frame
+    return _prepare_candidates(df)
+
+
+def _price_mask(costs: np.ndarray, min_price: float, max_price: float) -> np.ndarray:
+    mask = np.ones(costs.shape, dtype=bool)
+    if min_price > 0:
+        mask &= costs >= min_price
+    if max_price > 0:
+        mask &= costs <= max_price
+    return mask
+
+
+def _cost_array(df: pd.DataFrame) -> np.ndarray:
+    return pd.to_numeric(df["estimated_cost"], errors="coerce").fillna(0.0).to_numpy(dtype="float64")
+
+
+@timed_stage("filter_by_price")
 def filter_by_price(df: pd.DataFrame, min_price: float = 0.0, max_price: float = 0.0) -> pd.DataFrame:
     if df.empty:
         return df.copy()
     if min_price <= 0 and max_price <= 0:
         return df.copy()
 
-    price = pd.to_numeric(df["estimated_cost"], errors="coerce").fillna(0.0)
-    mask = pd.Series(True, index=df.index)
+    mask = _price_mask(_cost_array(df), min_price, max_price)
+    return df[mask].copy().reset_index(drop=True)
 
-    if min_price > 0:
-        mask &= price >= min_price
-    if max_price > 0:
-        mask &= price <= max_price
 
-    return df[mask].copy().reset_index(drop=True)
+def _period_code_array(df: pd.DataFrame) -> np.ndarray:
+    # Prepared EventIndex frames carry precomputed codes; plain frames derive them on the fly.
+    if "_period_code" in df.columns:
+        return df["_period_code"].to_numpy()
+    return _period_codes(pd.to_datetime(df["start_time"], errors="coerce"))
 
 
+@timed_stage("filter_by_time_period")
 def filter_by_time_period(
     df: pd.DataFrame,
     preferred_period: str,
@@ -172,81 +309,85 @@ def filter_by_time_period(
         # Keep full result set when user does not want time-of-day constraints.
         return df.copy().reset_index(drop=True)
 
-    timestamps = pd.to_datetime(df["start_time"], errors="coerce")
-    in_period = timestamps.apply(
-        lambda ts: _hour_to_period(int(ts.hour)) == target_period if pd.notna(ts) else False
-    )
-
+    in_period = _period_code_array(df) == PERIOD_INDEX[target_period]
     return df[in_period].copy().reset_index(drop=True)
 
 
+@timed_stage("filter_by_event_date")
 def filter_by_event_date(
-    df: pd.DataFrame,
+    df: pd.DataFrame | EventIndex,
     event_date: Any = None,
 ) -> pd.DataFrame:
-    if df.empty:
-        return df.copy()
+    frame = df.frame if isinstance(df, EventIndex) else df
+    if frame.empty:
+        return frame.copy()
 
     target_date = _normalize_event_date(event_date)
     if target_date is None:
-        return df.copy()
+        return frame.copy()
 
-    timestamps = pd.to_datetime(df["start_time"], errors="coerce")
+    if isinstance(df, EventIndex):
+        # Same-day rows are one contiguous slice of the day-sorted index.
+        positions, _ = df.day_window(target_date)
+        return frame.iloc[positions].copy().reset_index(drop=True)
+
+    timestamps = pd.to_datetime(frame["start_time"], errors="coerce")
     # Compare at day granularity so HH:MM differences do not exclude valid same-day events.
     on_target_date = timestamps.dt.normalize() == target_date
-    return df[on_target_date].copy().reset_index(drop=True)
+    return frame[on_target_date].copy().reset_index(drop=True)
 
 
-def _budget_score(cost: float, budget: float) -> float:
+def _budget_scores(costs: np.ndarray, budget: float) -> np.ndarray:
     # Piecewise penalty: within budget scores highest, modest overages are tolerated.
     if budget <= 0:
-        return 0.7
-    if cost <= budget:
-        return max(0.4, 1 - (cost / max(budget, 1e-9)) * 0.6)
-
-    over_ratio = (cost - budget) / max(budget, 1e-9)
-    if over_ratio <= 0.1:
-        return 0.2
-    if over_ratio <= 0.25:
-        return 0.1
-    return 0.0
+        return np.full(costs.shape, 0.7)
+
+    safe_budget = max(budget, 1e-9)
+    within_budget = np.maximum(0.4, 1 - (costs / safe_budget) * 0.6)
+    over_ratio = (costs - budget) / safe_budget
+    return np.select(
+        [costs <= budget, over_ratio <= 0.1, over_ratio <= 0.25],
+        [within_budget, 0.2, 0.1],
+        default=0.0,
+    )
 
 
-def _time_score(timestamp: Any, prefs: UserPreferences) -> float:
+def _time_scores(period_codes: np.ndarray, prefs: UserPreferences) -> np.ndarray:
     preferred_period = _normalize_period(prefs.preferred_period)
     if preferred_period == "any":
         # Neutral/full credit when user has no time-of-day preference.
-        return 1.0
-
-    if pd.isna(timestamp):
-        return 0.2
+        return np.ones(period_codes.shape)
 
-    event_period = _hour_to_period(int(pd.Timestamp(timestamp).hour))
     # Neighbor periods are partially acceptable; opposite period gets lowest score.
-    distance = abs(PERIOD_INDEX[event_period] - PERIOD_INDEX[preferred_period])
-
-    if distance == 0:
-        return 1.0
-    if distance == 1:
-        return 0.55
-    return 0.25
+    distance = np.abs(period_codes.astype("int64") - PERIOD_INDEX[preferred_period])
+    return np.select(
+        [period_codes == NO_PERIOD_CODE, distance == 0, distance == 1],
+        [0.2, 1.0, 0.55],
+        default=0.25,
+    )
 
 
-def score_candidates(df: pd.DataFrame, prefs: UserPreferences) -> pd.DataFrame:
+@timed_stage("score_candidates")
+def score_candidates(df: pd.DataFrame | EventIndex, prefs: UserPreferences) -> pd.DataFrame:
     """
     Key recommendation flow:
-    1) normalize candidate fields
+    1) normalize candidate fields (skipped when given a prebuilt EventIndex)
     2) filter by price, preferred period of day, and date (optional, if user specified)
     3) score remaining events
     """
-    prepared = _prepare_candidates(df)
+    prepared = _as_prepared(df)
     if prepared.empty:
         return prepared
 
     preferred_period = _normalize_period(prefs.preferred_period)
 
+    # Date first: on an EventIndex it is a binary-search slice, so later filters see fewer rows.
+    filtered = filter_by_event_date(
+        df if isinstance(df, EventIndex) else prepared,
+        prefs.event_date,
+    )
     filtered = filter_by_price(
-        prepared,
+        filtered,
         min_price=max(0.0, prefs.min_price),
         max_price=max(0.0, prefs.budget),
     )
@@ -254,20 +395,15 @@ def score_candidates(df: pd.DataFrame, prefs: UserPreferences) -> pd.DataFrame:
         filtered,
         preferred_period,
     )
-    filtered = filter_by_event_date(
-        filtered,
-        prefs.event_date,
-    )
 
     if filtered.empty:
         return filtered
 
     scored = filtered.copy()
 
-    scored["price_score"] = scored["estimated_cost"].fillna(0.0).apply(
-        lambda value: _budget_score(float(value), prefs.budget)
-    )
-    scored["time_score"] = scored["start_time"].apply(lambda value: _time_score(value, prefs))
+    costs = scored["estimated_cost"].fillna(0.0).to_numpy(dtype="float64")
+    scored["price_score"] = _budget_scores(costs, float(prefs.budget))
+    scored["time_score"] = _time_scores(_period_code_array(scored), prefs)
     scored["overall_score"] = (
         scored["price_score"] * 0.55
         + scored["time_score"] * 0.45
@@ -279,17 +415,6 @@ def score_candidates(df: pd.DataFrame, prefs: UserPreferences) -> pd.DataFrame:
     ).reset_index(drop=True)
 
 
-def _candidate_identity(row: pd.Series) -> tuple[str, str, str, str, str]:
-    # Stable event identity used to deduplicate items that can reappear across stages.
-    return (
-        str(row.get("source", "")).strip().lower(),
-        str(row.get("name", "")).strip().lower(),
-        str(row.get("date", "")).strip(),
-        str(row.get("time", "")).strip(),
-        str(row.get("location", "")).strip().lower(),
-    )
-
-
 def _build_flexible_filter_stages(prefs: UserPreferences) -> list[tuple[str, UserPreferences]]:
     """
     Build ordered scoring stages:
@@ -329,89 +454,134 @@ def _build_flexible_filter_stages(prefs: UserPreferences) -> list[tuple[str, Use
     return stages
 
 
-def _filter_to_nearby_dates(
-    scored_df: pd.DataFrame,
-    target_date: pd.Timestamp | None,
-    max_distance_days: int = FLEXIBLE_DATE_WINDOW_DAYS,
-) -> pd.DataFrame:
-    # Keep flexible-date results within a bounded window around the requested day.
-    if scored_df.empty or target_date is None:
-        return scored_df.copy()
-
-    filtered = scored_df.copy()
-    event_days = pd.to_datetime(filtered["start_time"], errors="coerce").dt.normalize()
-    date_distance_days = (event_days - target_date).abs().dt.days
-    filtered["_date_distance_days"] = date_distance_days
-
-    nearby_only = (
-        filtered["_date_distance_days"].notna()
-        & (filtered["_date_distance_days"] <= max_distance_days)
-    )
-    return filtered[nearby_only].copy().reset_index(drop=True)
-
+def _top_positions(
+    positions: np.ndarray,
+    overall_scores: np.ndarray,
+    time_scores: np.ndarray,
+    keys: np.ndarray,
+    limit: int,
+    taken_keys: set[int],
+) -> np.ndarray:
+    """
+    Best `limit` rows among `positions`, ordered by overall then time score (descending),
+    ties keeping dataset order; rows whose dedupe key is already taken are skipped.
+    """
+    if taken_keys:
+        fresh = ~pd.Series(keys[positions]).isin(taken_keys).to_numpy()
+        positions = positions[fresh]
 
-def _apply_stage_specific_filters(
-    scored_df: pd.DataFrame,
-    stage_level: str,
-    user_prefs: UserPreferences,
-) -> pd.DataFrame:
-    # Only flexible-date stages use a nearby-date window; other stages keep full stage output.
-    if stage_level not in {MATCH_LEVEL_FLEXIBLE_DATE, MATCH_LEVEL_FLEXIBLE_PERIOD_AND_DATE}:
-        return scored_df
+    has_duplicates = bool(pd.Series(keys[positions]).duplicated().any())
+    if not has_duplicates and len(positions) > limit:
+        # Only rows scoring at least the limit-th best overall score can make the cut.
+        kth = len(positions) - limit
+        cutoff = np.partition(overall_scores[positions], kth)[kth]
+        positions = positions[overall_scores[positions] >= cutoff]
 
-    target_date = _normalize_event_date(user_prefs.event_date)
-    return _filter_to_nearby_dates(scored_df, target_date)
+    order = np.lexsort((positions, -time_scores[positions], -overall_scores[positions]))
+    ranked = positions[order]
+    if has_duplicates:
+        ranked = ranked[~pd.Series(keys[ranked]).duplicated().to_numpy()]
+    return ranked[:limit]
 
 
+@timed_stage("rank_flexible")
 def select_ranked_candidates_with_flexible_filters(
-    df: pd.DataFrame,
+    df: pd.DataFrame | EventIndex,
     prefs: UserPreferences,
 ) -> tuple[pd.DataFrame, dict[str, int]]:
     """
     Return up to prefs.max_results by prioritizing strict matches first, then
     progressively applying flexible period/date filters when needed.
+
+    All stages are evaluated from boolean masks in one pass: each event belongs to the
+    first (strictest) stage it qualifies for, and only the top rows per stage are sorted.
     """
+    # Prepare once for all stages; callers holding an EventIndex skip preparation entirely.
+    index = df if isinstance(df, EventIndex) else build_event_index(df)
+    frame = index.frame
     target = max(1, int(prefs.max_results))
-    selected_rows: list[dict[str, Any]] = []
-    seen: set[tuple[str, str, str, str, str]] = set()
 
-    exact_available = 0
+    if frame.empty:
+        return pd.DataFrame(), _selection_summary(target, 0, 0, 0)
 
-    for level, stage_prefs in _build_flexible_filter_stages(prefs):
-        scored = score_candidates(df, stage_prefs)
-        scored = _apply_stage_specific_filters(scored, level, prefs)
-        if level == MATCH_LEVEL_EXACT:
-            exact_available = len(scored)
-        if scored.empty:
-            continue
+    target_date = _normalize_event_date(prefs.event_date)
+    if target_date is None:
+        universe = np.arange(len(frame))
+        date_distances = np.zeros(len(frame))
+    else:
+        # Every stage is bounded by the requested day (or the flexible window around it),
+        # so only that slice of the day-sorted index is ever scored.
+        radius = FLEXIBLE_DATE_WINDOW_DAYS if prefs.allow_flexible_dates else 0
+        universe, date_distances = index.day_window(target_date, radius)
+
+    # The price/period/date filters of every stage, as masks over the candidate universe.
+    with stage_timer("rank_filters") as timer:
+        costs = index.costs[universe]
+        period_codes = index.period_codes[universe]
+        keys = index.dedupe_keys[universe]
+        in_budget = _price_mask(costs, max(0.0, prefs.min_price), max(0.0, prefs.budget))
+        price_scores = _budget_scores(costs, float(prefs.budget))
+
+        preferred_period = _normalize_period(prefs.preferred_period)
+        period_match = (
+            np.ones(len(universe), dtype=bool)
+            if preferred_period == "any"
+            else period_codes == PERIOD_INDEX[preferred_period]
+        )
+        date_match = date_distances == 0
+        # Flexible-date stages keep results within a bounded window around the requested day.
+        nearby_match = date_distances <= FLEXIBLE_DATE_WINDOW_DAYS
+
+        stage_masks = {
+            MATCH_LEVEL_EXACT: in_budget & period_match & date_match,
+            MATCH_LEVEL_FLEXIBLE_PERIOD: in_budget & date_match,
+            MATCH_LEVEL_FLEXIBLE_DATE: in_budget & period_match & nearby_match,
+            MATCH_LEVEL_FLEXIBLE_PERIOD_AND_DATE: in_budget & nearby_match,
+        }
+        timer.rows = len(universe)
 
-        for _, row in scored.iterrows():
-            identity = _candidate_identity(row)
-            if identity in seen:
-                continue
+    assigned = np.zeros(len(universe), dtype=bool)
+    taken_keys: set[int] = set()
+    selected_parts: list[pd.DataFrame] = []
+    remaining = target
+    exact_available = int(stage_masks[MATCH_LEVEL_EXACT].sum())
 
-            row_dict = row.to_dict()
-            # Track the stage that contributed this row for summary/ordering.
-            row_dict["_match_level"] = level
-            selected_rows.append(row_dict)
-            seen.add(identity)
+    for level, stage_prefs in _build_flexible_filter_stages(prefs):
+        mask = stage_masks[level]
+        positions = np.flatnonzero(mask & ~assigned)
+        # An event only competes in its strictest stage; reappearances later are skipped.
+        assigned |= mask
+        if len(positions) == 0:
+            continue
 
-            if len(selected_rows) >= target:
-                break
+        with stage_timer("rank_score", match_level=level) as timer:
+            time_scores = _time_scores(period_codes, stage_prefs)
+            overall_scores = price_scores * 0.55 + time_scores * 0.45
+            top = _top_positions(positions, overall_scores, time_scores, keys, remaining, taken_keys)
+            timer.rows = len(positions)
+        if len(top) == 0:
+            continue
 
-        if len(selected_rows) >= target:
+        part = frame.iloc[universe[top]].copy()
+        part["price_score"] = price_scores[top]
+        part["time_score"] = time_scores[top]
+        part["overall_score"] = overall_scores[top]
+        if level in {MATCH_LEVEL_FLEXIBLE_DATE, MATCH_LEVEL_FLEXIBLE_PERIOD_AND_DATE}:
+            part["_date_distance_days"] = date_distances[top]
+        # Track the stage that contributed this row for summary/ordering.
+        part["_match_level"] = level
+        selected_parts.append(part)
+
+        taken_keys.update(keys[top])
+        inc("event_ranked_rows_total", len(top), match_level=level)
+        remaining -= len(top)
+        if remaining <= 0:
             break
 
-    if not selected_rows:
-        return pd.DataFrame(), {
-            "requested": target,
-            "returned": 0,
-            "exact_available": exact_available,
-            "exact_returned": 0,
-            "flexible_returned": 0,
-        }
+    if not selected_parts:
+        return pd.DataFrame(), _selection_summary(target, 0, exact_available, 0)
 
-    selected = pd.DataFrame(selected_rows)
+    selected = pd.concat(selected_parts, ignore_index=True)
     selected["_match_priority"] = selected["_match_level"].map(MATCH_LEVEL_PRIORITY).fillna(99)
     if "_date_distance_days" in selected.columns:
         date_distance_series = pd.to_numeric(selected["_date_distance_days"], errors="coerce")
@@ -427,10 +597,33 @@ def select_ranked_candidates_with_flexible_filters(
     ).head(target).reset_index(drop=True)
 
     exact_returned = int((selected["_match_level"] == MATCH_LEVEL_EXACT).sum())
-    returned = len(selected)
+    return selected, _selection_summary(target, len(selected), exact_available, exact_returned)
+
+
+def preferences_cache_key(prefs: UserPreferences) -> tuple[Any, ...]:
+    """
+    Hashable key that is equal for preferences producing identical rankings:
+    period and date are normalized, and the flexible-dates flag only counts with a date.
+    """
+    target_date = _normalize_event_date(prefs.event_date)
+    return (
+        _normalize_period(prefs.preferred_period),
+        None if target_date is None else target_date.strftime("%Y-%m-%d"),
+        float(prefs.budget),
+        float(prefs.min_price),
+        bool(prefs.allow_flexible_dates) and target_date is not None,
+        max(1, int(prefs.max_results)),
+    )
 
-    return selected, {
-        "requested": target,
+
+def _selection_summary(
+    requested: int,
+    returned: int,
+    exact_available: int,
+    exact_returned: int,
+) -> dict[str, int]:
+    return {
+        "requested": requested,
         "returned": returned,
         "exact_available": exact_available,
         "exact_returned": exact_returned,
@@ -455,6 +648,7 @@ def _row_to_stop(row: pd.Series) -> dict[str, Any]:
     }
 
 
+@timed_stage("build_suggestions")
 def build_event_suggestions(scored_df: pd.DataFrame, prefs: UserPreferences) -> list[dict[str, Any]]:
     if scored_df.empty:
         return []
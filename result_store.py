@@ -0,0 +1,77 @@
+"""
+Server-side store for generated suggestions.
+The web session keeps only a short result ID; plans live in a local SQLite file that every
+gunicorn worker can read, with TTL expiry and a cap on the number of stored results.
+"""
+
+from __future__ import annotations
+
+import json
+import secrets
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_created_at ON results (created_at);
+"""
+
+
+class ResultStore:
+    """JSON payloads keyed by random IDs; entries expire after `ttl_seconds`, oldest dropped past `max_entries`."""
+
+    def __init__(self, db_path: Path | str, ttl_seconds: float = 3600.0, max_entries: int = 5000) -> None:
+        self.db_path = Path(db_path)
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.max_entries = max(1, int(max_entries))
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        # A short-lived connection per call: sqlite3 connections must not cross threads.
+        if not self._initialized:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.db_path, timeout=5.0)
+        if not self._initialized:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            self._initialized = True
+        return connection
+
+    def put(self, payload: Any) -> str:
+        result_id = secrets.token_urlsafe(12)
+        now = time.time()
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT INTO results (id, created_at, payload) VALUES (?, ?, ?)",
+                (result_id, now, json.dumps(payload, separators=(",", ":"))),
+            )
+            self._evict(connection, now)
+        return result_id
+
+    def get(self, result_id: str) -> Any | None:
+        if not result_id:
+            return None
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT created_at, payload FROM results WHERE id = ?",
+                (result_id,),
+            ).fetchone()
+        if row is None or (self.ttl_seconds and time.time() - row[0] > self.ttl_seconds):
+            return None
+        return json.loads(row[1])
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        if self.ttl_seconds:
+            connection.execute("DELETE FROM results WHERE created_at < ?", (now - self.ttl_seconds,))
+        connection.execute(
+            "DELETE FROM results WHERE id IN ("
+            "SELECT id FROM results ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
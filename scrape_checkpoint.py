@@ -0,0 +1,126 @@
+"""
+Checkpoint journal for scrape runs, so an interrupted run can be resumed (`--resume`).
+Each source appends every listing page and detail page it finishes (with the parsed records)
+to its own journal; a resumed run replays those instead of refetching them and skips sources
+that had already finished. The journal lives in the staging directory and is removed with it
+after a successful publish.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from scrape_pipeline import iter_jsonl
+
+RUN_FILE = "run.json"
+
+
+def _valid_length(path: Path) -> int:
+    # Byte length up to the last complete line; a crash can leave a torn entry after it.
+    data = path.read_bytes()
+    return data.rfind(b"\n") + 1
+
+
+class SourceCheckpoint:
+    """Append-only progress journal of one source; safe to record from worker threads."""
+
+    def __init__(self, path: Path | str, resume: bool = False) -> None:
+        self.path = Path(path)
+        self.listing_pages: dict[int, list[Any]] = {}
+        self.details: dict[str, Any] = {}
+        self.done = False
+        # Cleared when a listing page could not be fetched: the source then stays unfinished.
+        self.complete = True
+        self.restored = 0
+        self._lock = threading.Lock()
+        if resume and self.path.exists():
+            os.truncate(self.path, _valid_length(self.path))
+            for entry in iter_jsonl(self.path):
+                if entry["kind"] == "page":
+                    self.listing_pages[entry["page"]] = entry["records"]
+                elif entry["kind"] == "detail":
+                    self.details[entry["url"]] = entry["record"]
+                elif entry["kind"] == "done":
+                    self.done = True
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = self.path.open("a" if resume else "w", encoding="utf-8")
+
+    def _append(self, entry: dict[str, Any]) -> None:
+        with self._lock:
+            self._handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._handle.flush()
+
+    def listing_page(self, page: int) -> list[Any] | None:
+        """Records of a listing page finished by an earlier attempt, or None."""
+        records = self.listing_pages.get(page)
+        if records is not None:
+            self.restored += 1
+        return records
+
+    def record_listing_page(self, page: int, records: list[Any]) -> None:
+        self.listing_pages[page] = records
+        self._append({"kind": "page", "page": page, "records": records})
+
+    def detail(self, url: str) -> Any | None:
+        """Parsed result of a detail page fetched by an earlier attempt, or None."""
+        record = self.details.get(url)
+        if record is not None:
+            with self._lock:
+                self.restored += 1
+        return record
+
+    def record_detail(self, url: str, record: Any) -> None:
+        with self._lock:
+            self.details[url] = record
+        self._append({"kind": "detail", "url": url, "record": record})
+
+    def mark_incomplete(self) -> None:
+        self.complete = False
+
+    def mark_done(self) -> None:
+        self.done = True
+        self._append({"kind": "done"})
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+class ScrapeCheckpoint:
+    """
+    Run-level checkpoint in `directory`: the mode and start time of the run, plus one
+    SourceCheckpoint per source. Without `resume` (or when the interrupted run had another
+    mode) any earlier progress is discarded and a new run starts. `failed` lists the sources
+    that did not finish in this attempt; their journals are what `--resume` continues from.
+    """
+
+    def __init__(self, directory: Path | str, mode: str, resume: bool = False) -> None:
+        self.directory = Path(directory)
+        self.mode = mode
+        self.failed: list[str] = []
+        run = interrupted_run(self.directory) if resume else None
+        self.resumed = run is not None and run.get("mode") == mode
+        if self.resumed:
+            self.started_at = datetime.fromisoformat(run["started_at"])
+            return
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.started_at = datetime.now().replace(microsecond=0)
+        run = {"mode": mode, "started_at": self.started_at.isoformat()}
+        (self.directory / RUN_FILE).write_text(json.dumps(run), encoding="utf-8")
+
+    def source(self, name: str) -> SourceCheckpoint:
+        return SourceCheckpoint(self.directory / f"{name}.journal.jsonl", resume=self.resumed)
+
+
+def interrupted_run(directory: Path | str) -> dict[str, Any] | None:
+    """{"mode", "started_at"} of the run that left its checkpoint in `directory`, if any."""
+    try:
+        return json.loads((Path(directory) / RUN_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,300 @@
+"""
+HTTP helpers shared by the scrapers in data_collection.py.
+A pooled session client with retry/backoff, per-host rate limiting so concurrent
+fetches stay polite to each source, and an on-disk response cache that
+revalidates with ETag / Last-Modified.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, up to `capacity` banked."""
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be positive.")
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(capacity))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Block until one token is available; return the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return waited
+                # Sleep outside the lock so other threads can still refill/inspect.
+                delay = (1.0 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class HostRateLimiter:
+    """One token bucket per URL host, created lazily on first use."""
+
+    def __init__(self, rate_per_host: float, burst: float = 1.0) -> None:
+        self.rate_per_host = rate_per_host
+        self.burst = burst
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket_for(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rate_per_host, self.burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def wait(self, url: str) -> float:
+        host = urlsplit(url).netloc.lower()
+        return self._bucket_for(host).acquire()
+
+
+def _retry_after_seconds(value: str | None) -> float | None:
+    # Retry-After is either delta-seconds or an HTTP-date.
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class ScrapeClient:
+    """
+    Shared keep-alive session for all scrapers.
+    Retries connection errors and 429/5xx responses with exponential backoff and jitter,
+    honoring Retry-After, and keeps per-run counters of requests, retries, bytes and latency.
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = 4,
+        max_retries: int = 3,
+        backoff_base_seconds: float = 0.5,
+        backoff_max_seconds: float = 30.0,
+    ) -> None:
+        self.max_retries = max(0, int(max_retries))
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.session = requests.Session()
+        # pool_maxsize is per host, so each source can keep `pool_maxsize` sockets alive.
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=max(1, int(pool_maxsize)))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats = {"requests": 0, "retries": 0, "failures": 0, "bytes": 0}
+            self._latencies: list[float] = []
+
+    def _record(self, latency: float, size: int) -> None:
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["bytes"] += size
+            self._latencies.append(latency)
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def _backoff_delay(self, attempt: int, retry_after: float | None) -> float:
+        # Full jitter: sleep a random amount up to the exponential cap.
+        delay = random.uniform(0.0, self.backoff_base_seconds * (2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return min(delay, self.backoff_max_seconds)
+
+    def get(self, url: str, limiter: HostRateLimiter | None = None, **kwargs: Any) -> requests.Response:
+        """GET `url` with retries; every attempt, retries included, first takes a `limiter` token."""
+        attempt = 0
+        while True:
+            if limiter is not None:
+                limiter.wait(url)
+            started = time.perf_counter()
+            try:
+                response = self.session.get(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self._record(time.perf_counter() - started, 0)
+                if attempt >= self.max_retries:
+                    self._count("failures")
+                    raise
+                retry_after = None
+            else:
+                self._record(time.perf_counter() - started, len(response.content))
+                if response.status_code not in RETRY_STATUS_CODES:
+                    return response
+                if attempt >= self.max_retries:
+                    self._count("failures")
+                    return response
+                retry_after = _retry_after_seconds(response.headers.get("Retry-After"))
+
+            self._count("retries")
+            time.sleep(self._backoff_delay(attempt, retry_after))
+            attempt += 1
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            summary: dict[str, float] = dict(self._stats)
+            latencies = sorted(self._latencies)
+        if latencies:
+            last = len(latencies) - 1
+            summary["latency_p50_seconds"] = round(latencies[round(last * 0.50)], 4)
+            summary["latency_p95_seconds"] = round(latencies[round(last * 0.95)], 4)
+            summary["latency_total_seconds"] = round(sum(latencies), 4)
+        return summary
+
+
+class ResponseCache:
+    """
+    URL-keyed response cache stored as one JSON file per URL.
+    Entries younger than `ttl_seconds` are served without a request; older ones are
+    revalidated with If-None-Match / If-Modified-Since and reused on 304.
+    In offline mode only recorded entries are served, so the pipeline can run without network.
+    Stores prune the directory every PRUNE_EVERY_STORES writes (starting with the first), so it
+    stays within `max_entries` and `max_age_seconds` give or take one interval (0 = unbounded).
+    """
+
+    PRUNE_EVERY_STORES = 100
+
+    def __init__(
+        self,
+        cache_dir: Path | str,
+        ttl_seconds: float = 0.0,
+        offline: bool = False,
+        max_entries: int = 0,
+        max_age_seconds: float = 0.0,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.offline = offline
+        self.max_entries = max(0, int(max_entries))
+        self.max_age_seconds = max(0.0, float(max_age_seconds))
+        self._stores_until_prune = 0
+        self._prune_lock = threading.Lock()
+
+    def _entry_path(self, url: str) -> Path:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def load(self, url: str) -> dict[str, Any] | None:
+        path = self._entry_path(url)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        # Guard against (very unlikely) hash collisions and hand-edited files.
+        return entry if entry.get("url") == url else None
+
+    def store(self, url: str, entry: dict[str, Any]) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(url)
+        # Write-then-rename so concurrent scraper threads never read a partial entry.
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(entry, handle)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        with self._prune_lock:
+            due = self._stores_until_prune <= 0
+            self._stores_until_prune = self.PRUNE_EVERY_STORES if due else self._stores_until_prune - 1
+        if due and (self.max_entries or self.max_age_seconds):
+            self.prune()
+
+    def prune(self, now: float | None = None) -> int:
+        """Remove entries fetched over `max_age_seconds` ago, then the oldest past `max_entries`."""
+        now = time.time() if now is None else now
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                # Every store rewrites the file, so its mtime is the last fetch or revalidation.
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        entries.sort(reverse=True)
+        removed = 0
+        for position, (fetched_at, path) in enumerate(entries):
+            expired = self.max_age_seconds > 0 and now - fetched_at > self.max_age_seconds
+            if expired or (self.max_entries > 0 and position >= self.max_entries):
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def fetch(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        get: Callable[..., requests.Response] = requests.get,
+    ) -> str:
+        """Return the body for `url`, using the cache where possible."""
+        entry = self.load(url)
+        now = time.time()
+        if entry is not None and (self.offline or now - entry.get("fetched_at", 0.0) < self.ttl_seconds):
+            return entry["body"]
+        if self.offline:
+            raise requests.RequestException(f"No cached response for {url} (offline mode)")
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry.get("etag"):
+                request_headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                request_headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = get(url, headers=request_headers, timeout=timeout)
+        if response.status_code == 304 and entry is not None:
+            entry["fetched_at"] = now
+            self.store(url, entry)
+            return entry["body"]
+
+        response.raise_for_status()
+        self.store(
+            url,
+            {
+                "url": url,
+                "fetched_at": now,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "body": response.text,
+            },
+        )
+        return response.text
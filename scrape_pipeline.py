@@ -0,0 +1,125 @@
+"""
+Streaming stages for the scrape pipeline.
+Sources yield one record at a time and every stage is a generator, so only the records in
+flight are held in memory. Sinks append each row to disk as it arrives and flush it, so a run
+that dies midway leaves everything written so far on disk.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterable, Iterator, Sequence, TypeVar
+
+import pandas as pd
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def ordered_map(
+    function: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int,
+    max_pending: int | None = None,
+) -> Iterator[R]:
+    """
+    Like ThreadPoolExecutor.map, but pulls `items` lazily and keeps at most `max_pending`
+    calls in flight (default: twice the workers). Results are yielded in input order.
+    """
+    max_workers = max(1, max_workers)
+    max_pending = max(max_workers, max_pending or 2 * max_workers)
+    pending: deque[Future[R]] = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        try:
+            for item in items:
+                pending.append(pool.submit(function, item))
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # Closed early (or failed): drop the queued calls instead of running them out.
+            for future in pending:
+                future.cancel()
+
+
+def dedupe_rows(rows: Iterable[dict[str, Any]], key_columns: Sequence[str]) -> Iterator[dict[str, Any]]:
+    """First row per key wins, like drop_duplicates(keep="first"); only the keys are kept in memory."""
+    seen: set[tuple[Hashable, ...]] = set()
+    for row in rows:
+        # Missing values compare equal to each other, as in pandas.
+        key = tuple(None if pd.isna(row.get(column)) else row.get(column) for column in key_columns)
+        if key in seen:
+            continue
+        seen.add(key)
+        yield row
+
+
+class JsonlSink:
+    """Appends rows to a JSON-lines file, one flushed line per row."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.rows = 0
+        self._handle: Any = None
+
+    def __enter__(self) -> "JsonlSink":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = self.path.open("w", encoding="utf-8")
+        return self
+
+    def write(self, row: dict[str, Any]) -> None:
+        self._handle.write(json.dumps(row, ensure_ascii=False) + "\n")
+        self._handle.flush()
+        self.rows += 1
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._handle.close()
+
+
+def iter_jsonl(path: Path | str) -> Iterator[dict[str, Any]]:
+    with Path(path).open(encoding="utf-8") as handle:
+        for line in handle:
+            # A crash can leave a torn last line; everything before it is intact.
+            if line.endswith("\n"):
+                yield json.loads(line)
+
+
+class CsvSink:
+    """
+    Appends rows to a CSV file as they arrive. The output is byte-identical to
+    DataFrame.to_csv(index=False, encoding="utf-8-sig") over the same rows.
+    """
+
+    def __init__(self, path: Path | str, columns: Sequence[str]) -> None:
+        self.path = Path(path)
+        self.columns = list(columns)
+        self.rows = 0
+        self._handle: Any = None
+        self._writer: Any = None
+
+    def __enter__(self) -> "CsvSink":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = self.path.open("w", encoding="utf-8-sig", newline="")
+        self._writer = csv.writer(self._handle, lineterminator="\n")
+        self._writer.writerow(self.columns)
+        return self
+
+    def write(self, row: dict[str, Any]) -> None:
+        self._writer.writerow(["" if pd.isna(row.get(column)) else row.get(column) for column in self.columns])
+        self._handle.flush()
+        self.rows += 1
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._handle.close()
+
+
+def drain(rows: Iterable[dict[str, Any]], sink: JsonlSink | CsvSink) -> int:
+    """Write every row to `sink`; returns the number written."""
+    for row in rows:
+        sink.write(row)
+    return sink.rows
@@ -0,0 +1,175 @@
+"""
+Memory-mapped copy of the prepared EventIndex shared by all web workers.
+One worker publishes each dataset version as a numbered generation directory
+(NumPy arrays plus an Arrow IPC frame); every worker maps the same files read-only,
+so the data lives once in the OS page cache instead of once per gunicorn worker.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from dataset_watch import _content_digest
+from event_store import HAS_PYARROW
+from recommend import EventIndex
+
+if HAS_PYARROW:
+    import pyarrow as pa
+    import pyarrow.ipc
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms run a single dev worker
+    fcntl = None
+
+CURRENT_FILE = "CURRENT"
+FRAME_FILE = "frame.arrow"
+ARRAY_FIELDS = ("costs", "period_codes", "dedupe_keys", "day_order", "sorted_days")
+# Keep the previous generation around for workers that have not switched yet.
+KEEP_GENERATIONS = 2
+
+
+@contextmanager
+def _publish_lock(root: Path) -> Iterator[None]:
+    # Serializes publish/attach across worker processes so only one of them parses the dataset.
+    if fcntl is None:
+        yield
+        return
+    with (root / ".lock").open("a") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def _generation_dir(root: Path, generation: int) -> Path:
+    return root / f"gen-{generation:06d}"
+
+
+def read_current(root: Path | str) -> dict[str, Any] | None:
+    try:
+        return json.loads((Path(root) / CURRENT_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_current(root: Path, manifest: dict[str, Any]) -> None:
+    fd, tmp_name = tempfile.mkstemp(dir=root, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(manifest, handle)
+        # Flipping CURRENT is the commit point: readers see the old or the new generation.
+        os.replace(tmp_name, root / CURRENT_FILE)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _prune(root: Path, generation: int) -> None:
+    # Unlinking files that other workers still map is safe on POSIX; their mappings stay valid.
+    for path in root.glob("gen-*"):
+        try:
+            number = int(path.name.split("-", 1)[1])
+        except ValueError:
+            continue
+        if number <= generation - KEEP_GENERATIONS:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def publish_shared_index(index: EventIndex, root: Path | str, source_digest: str) -> int:
+    """Write `index` as the next generation and point CURRENT at it; returns the generation."""
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    generation = int((read_current(root) or {}).get("generation", 0)) + 1
+
+    staging = Path(tempfile.mkdtemp(dir=root, prefix=".publish-"))
+    try:
+        for name in ARRAY_FIELDS:
+            np.save(staging / f"{name}.npy", np.ascontiguousarray(getattr(index, name)))
+        table = pa.Table.from_pandas(index.frame, preserve_index=False)
+        with pa.OSFile(str(staging / FRAME_FILE), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(staging, _generation_dir(root, generation))
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    _write_current(
+        root,
+        {"generation": generation, "version": index.version, "source_digest": source_digest},
+    )
+    _prune(root, generation)
+    return generation
+
+
+def _string_dtype(arrow_type: Any) -> pd.ArrowDtype | None:
+    # Text columns stay Arrow-backed views of the mapped file; numeric/time columns become NumPy.
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return pd.ArrowDtype(arrow_type)
+    return None
+
+
+def attach_shared_index(root: Path | str, manifest: dict[str, Any]) -> EventIndex:
+    generation_dir = _generation_dir(Path(root), int(manifest["generation"]))
+    arrays = {
+        name: np.asarray(np.load(generation_dir / f"{name}.npy", mmap_mode="r"))
+        for name in ARRAY_FIELDS
+    }
+    source = pa.memory_map(str(generation_dir / FRAME_FILE), "r")
+    # split_blocks keeps each column in its own block, so null-free numeric and timestamp columns
+    # are views of the mapped file too; columns with nulls are still copied into this worker.
+    frame = pa.ipc.open_file(source).read_all().to_pandas(types_mapper=_string_dtype, split_blocks=True)
+    return EventIndex(frame=frame, version=str(manifest["version"]), **arrays)
+
+
+def shared_index_is_current(
+    root: Path | str,
+    index: EventIndex,
+    source_paths: Iterable[Path | str],
+    digest: Callable[[tuple[Path, ...]], str] = _content_digest,
+) -> bool:
+    """True when CURRENT names a generation holding `index`'s data, built from the current `source_paths`."""
+    manifest = read_current(root)
+    return (
+        manifest is not None
+        and manifest.get("version") == index.version
+        and manifest.get("source_digest") == digest(tuple(Path(path) for path in source_paths))
+    )
+
+
+def load_shared_index(
+    root: Path | str,
+    source_paths: Iterable[Path | str],
+    build: Callable[[], EventIndex],
+    digest: Callable[[tuple[Path, ...]], str] = _content_digest,
+) -> EventIndex:
+    """
+    Attach to the current shared generation, publishing a new one first (with `build`)
+    when the source files changed since it was written. Cold workers only attach.
+    """
+    if not HAS_PYARROW:
+        raise RuntimeError("The shared dataset requires pyarrow.")
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    source_digest = digest(tuple(Path(path) for path in source_paths))
+
+    with _publish_lock(root):
+        manifest = read_current(root)
+        if manifest is None or manifest.get("source_digest") != source_digest:
+            publish_shared_index(build(), root, source_digest)
+            manifest = read_current(root)
+        index = attach_shared_index(root, manifest)
+
+    print(f"Attached shared dataset generation {manifest['generation']} ({len(index)} records)")
+    return index
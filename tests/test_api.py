@@ -0,0 +1,51 @@
+import pytest
+
+import main
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # Parameters are validated before the dataset is used, so no dataset needs to be loaded.
+    monkeypatch.setattr(main, "get_cached_df", lambda: object())
+    return main.app.test_client()
+
+
+@pytest.mark.parametrize("query", ["budget=nan", "budget=inf", "budget=-Infinity", "max_results=1e400", "budget=abc"])
+def test_non_finite_numbers_are_rejected(client, query):
+    response = client.get(f"/api/suggestions?{query}")
+    assert response.status_code == 400
+    assert response.get_json()["error"].startswith("Invalid ")
+
+
+def test_finite_numbers_are_accepted():
+    prefs = main.user_preferences_from_params({"budget": "20.5", "max_results": "4"})
+    assert (prefs.budget, prefs.max_results) == (20.5, 4)
+
+
+@pytest.mark.parametrize(
+    ("cursor", "offset", "rows"),
+    [(None, 0, 10), ("10", 10, 10), ("25", 25, 5), ("30", 20, 10), ("9999", 20, 10), ("-5", 0, 10), ("x", 0, 10)],
+)
+def test_suggestions_cursor_is_clamped_to_the_last_page(monkeypatch, cursor, offset, rows):
+    monkeypatch.setattr(main, "SUGGESTIONS_PAGE_SIZE", 10)
+    plans, page = main._suggestions_page([{"rank": rank} for rank in range(30)], cursor)
+    assert (page["offset"], len(plans), page["total"]) == (offset, rows, 30)
+
+
+def test_suggestions_page_of_no_plans():
+    assert main._suggestions_page([], "40") == ([], {"offset": 0, "total": 0, "next_cursor": None, "prev_cursor": None})
+
+
+def test_profiled_batch_captures_one_profile_per_query(monkeypatch, tmp_path):
+    index = main.load_event_index()
+    monkeypatch.setattr(main, "get_cached_df", lambda: index)
+    monkeypatch.setattr(main, "PROFILER", main.RequestProfiler(tmp_path, {"127.0.0.1"}))
+    queries = [{"budget": 20}, {"budget": "nan"}, {"budget": 60, "period": "evening"}]
+
+    response = main.app.test_client().post("/api/suggestions/batch?profile=1", json=queries)
+
+    assert response.status_code == 200
+    profile_ids = response.headers[main.PROFILE_ID_HEADER].split(", ")
+    # The invalid query is never ranked, so it has no profile.
+    assert len(profile_ids) == 2
+    assert sorted(path.stem for path in tmp_path.glob("*.prof")) == sorted(profile_ids)
@@ -0,0 +1,23 @@
+import shutil
+
+import benchmark_scrape
+
+
+def test_committed_fixtures_cover_every_page_kind():
+    files = benchmark_scrape._fixture_files(benchmark_scrape.DEFAULT_FIXTURES_DIR)
+    assert set(files) == set(benchmark_scrape.FIXTURE_PARSERS)
+    for kind, paths in files.items():
+        parse = benchmark_scrape.FIXTURE_PARSERS[kind]
+        assert paths
+        assert all(parse(path.read_text(encoding="utf-8"), path) > 0 for path in paths)
+
+
+def test_benchmark_runs_on_committed_fixtures(tmp_path):
+    assert benchmark_scrape.main(["--repeat", "1", "--output", str(tmp_path / "scrape.json")]) == 0
+
+
+def test_missing_fixture_kind_fails(tmp_path):
+    fixtures = tmp_path / "html"
+    shutil.copytree(benchmark_scrape.DEFAULT_FIXTURES_DIR, fixtures)
+    shutil.rmtree(fixtures / "eventbrite_detail")
+    assert benchmark_scrape.main(["--fixtures", str(fixtures), "--output", str(tmp_path / "scrape.json")]) == 1
@@ -0,0 +1,31 @@
+import os
+
+from dataset_watch import DatasetWatcher
+
+
+def test_restoring_the_loaded_file_clears_a_failed_load(tmp_path):
+    path = tmp_path / "events.csv"
+    path.write_text("good", encoding="utf-8")
+
+    def load():
+        content = path.read_text(encoding="utf-8")
+        if content != "good":
+            raise ValueError("boom")
+        return content
+
+    watcher = DatasetWatcher(load, [path], poll_seconds=0, backoff_base_seconds=0.0)
+    assert watcher.current() == "good"
+
+    path.write_text("bad!", encoding="utf-8")
+    watcher.poll_once()
+    assert watcher.poll_once() is False
+    assert watcher.last_error == "boom"
+
+    path.write_text("good", encoding="utf-8")
+    os.utime(path, ns=(0, 0))
+    assert watcher.poll_once() is False
+    assert watcher.last_error is None
+    assert watcher.snapshot == "good"
+    # Back on the cheap stat comparison: an untouched file is not re-hashed.
+    watcher.digest = lambda paths: (_ for _ in ()).throw(AssertionError("re-hashed"))
+    assert watcher.poll_once() is False
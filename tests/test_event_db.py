@@ -0,0 +1,78 @@
+import itertools
+
+import pandas as pd
+import pytest
+
+import main
+from event_db import EventDatabase, write_event_db
+from recommend import UserPreferences, build_event_index, select_ranked_candidates_with_flexible_filters
+
+# Columns the suggestion builders read, plus the scores and stage of each ranked row.
+COMPARED_COLUMNS = [
+    "name", "date", "time", "location", "price", "source", "url", "start_time",
+    "estimated_cost", "price_score", "time_score", "overall_score", "_match_level",
+]
+
+
+def _with_case_duplicates(df):
+    # Every event again under an upper-cased name and a free price, after the originals: both
+    # backends must keep the best-ranked copy, not the first one in file order.
+    copies = df.copy()
+    copies["event_name"] = copies["event_name"].str.upper()
+    copies["price"] = "Free"
+    copies["max_price"] = "Free"
+    return pd.concat([df, copies], ignore_index=True)
+
+
+@pytest.fixture(scope="module", params=["published", "case_duplicates"])
+def backends(request, tmp_path_factory):
+    directory = tmp_path_factory.mktemp("event_db")
+    if request.param == "published":
+        csv_path = main.RECOMMENDATION_SAMPLE_FILE
+        index = main.load_event_index()
+    else:
+        csv_path = directory / "events.csv"
+        _with_case_duplicates(pd.read_csv(main.RECOMMENDATION_SAMPLE_FILE)).to_csv(csv_path, index=False)
+        index = build_event_index(main._ensure_schema(pd.read_csv(csv_path)))
+    return index, EventDatabase(write_event_db(csv_path, directory / "events.sqlite3"))
+
+
+def _preference_grid():
+    dates = sorted(set(pd.read_csv(main.RECOMMENDATION_SAMPLE_FILE)["date"].astype(str)))
+    for period, budget, event_date, flexible, max_results in itertools.product(
+        ["any", "morning", "afternoon", "evening"],
+        [0, 15, 60],
+        [None, dates[0], dates[len(dates) // 2], "2031-01-01"],
+        [False, True],
+        [3, 50],
+    ):
+        yield UserPreferences(
+            budget=budget,
+            preferred_period=period,
+            event_date=event_date,
+            allow_flexible_dates=flexible,
+            max_results=max_results,
+        )
+
+
+def test_every_row_is_stored(backends):
+    index, database = backends
+    assert len(database) == len(index)
+
+
+@pytest.mark.parametrize("prefs", list(_preference_grid()), ids=str)
+def test_rank_matches_in_memory_ranking(backends, prefs):
+    index, database = backends
+    expected, expected_summary = select_ranked_candidates_with_flexible_filters(index, prefs)
+    ranked, summary = database.rank(prefs)
+
+    assert summary == expected_summary
+    assert len(ranked) == len(expected)
+    if expected.empty:
+        return
+    pd.testing.assert_frame_equal(
+        ranked[COMPARED_COLUMNS].reset_index(drop=True),
+        expected[COMPARED_COLUMNS].reset_index(drop=True),
+        check_dtype=False,
+        check_categorical=False,
+    )
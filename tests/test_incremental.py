@@ -0,0 +1,45 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+import data_collection
+from event_store import write_event_store
+from scrape_pipeline import CsvSink, drain
+
+# Before every event in the dataset, so no row is dropped as past.
+NOW = datetime(2020, 1, 1)
+
+
+def _refresh(source, target, staging_dir):
+    existing = data_collection.load_csv(source)
+    with CsvSink(target, data_collection.CLEANED_COLUMNS) as sink:
+        drain(data_collection.scrape_incremental(existing, now=NOW, staging_dir=staging_dir), sink)
+    return target
+
+
+def test_incremental_refresh_without_new_events_is_stable(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_collection, "stream_sources", lambda *args, **kwargs: [])
+
+    first = _refresh(data_collection.OUTPUT_FILE, tmp_path / "first.csv", tmp_path)
+    second = _refresh(first, tmp_path / "second.csv", tmp_path)
+
+    assert first.read_bytes() == second.read_bytes()
+    published = pd.read_csv(data_collection.OUTPUT_FILE, keep_default_na=False)
+    refreshed = pd.read_csv(first, keep_default_na=False)
+    assert refreshed["location"].tolist() == published["location"].tolist()
+    assert refreshed["max_price"].tolist() == published["max_price"].tolist()
+
+
+def test_incremental_refresh_from_typed_store_is_stable(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(data_collection, "stream_sources", lambda *args, **kwargs: [])
+
+    first = _refresh(data_collection.OUTPUT_FILE, tmp_path / "first.csv", tmp_path)
+    store = write_event_store(first, tmp_path / "first.parquet")
+    existing = data_collection.load_csv(first, store)
+    second = tmp_path / "second.csv"
+    with CsvSink(second, data_collection.CLEANED_COLUMNS) as sink:
+        drain(data_collection.scrape_incremental(existing, now=NOW, staging_dir=tmp_path), sink)
+
+    assert first.read_bytes() == second.read_bytes()
@@ -0,0 +1,7 @@
+from result_store import ResultStore
+
+
+def test_store_creates_missing_parent_directory(tmp_path):
+    store = ResultStore(tmp_path / "missing" / "nested" / "results.sqlite3")
+    result_id = store.put({"plans": [1, 2, 3]})
+    assert store.get(result_id) == {"plans": [1, 2, 3]}
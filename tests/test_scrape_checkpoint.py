@@ -0,0 +1,134 @@
+import requests
+
+import data_collection
+from config import PROJECT_ROOT
+from scrape_checkpoint import ScrapeCheckpoint, SourceCheckpoint
+
+FIXTURES = PROJECT_ROOT / "fixtures" / "html"
+
+PAGES = {
+    "https://venue.example/first": "<p class='price'>$12</p>",
+    "https://venue.example/second": "<p class='price'>$30</p>",
+}
+
+
+def _listing():
+    return [
+        {"event_name": "First", "price": "N/A", "url": "https://venue.example/first"},
+        {"event_name": "Second", "price": "N/A", "url": "https://venue.example/second"},
+    ]
+
+
+def _prices(journal, resume):
+    checkpoint = SourceCheckpoint(journal, resume=resume)
+    try:
+        return [record["price"] for record in data_collection.iter_pgh_event_prices(_listing(), checkpoint=checkpoint)]
+    finally:
+        checkpoint.close()
+
+
+def test_resume_refetches_a_failed_detail_page(tmp_path, monkeypatch):
+    journal = tmp_path / "pgh_events.journal.jsonl"
+    fetched = []
+    failures = [requests.ConnectionError("connection reset")]
+
+    def failing_first(url, **kwargs):
+        fetched.append(url)
+        if failures:
+            raise failures.pop()
+        return PAGES[url]
+
+    monkeypatch.setattr(data_collection, "fetch_html", failing_first)
+    assert _prices(journal, resume=False) == ["N/A", "$30"]
+
+    fetched.clear()
+    assert _prices(journal, resume=True) == ["$12", "$30"]
+    # Only the failed page is fetched again; the successful one is replayed from the journal.
+    assert fetched == ["https://venue.example/first"]
+
+
+class _PagedAdapter(data_collection.SourceAdapter):
+    """Three listing pages of two events each; raises on `fail_at_page` while it is set."""
+
+    def __init__(self, name, fail_at_page=None):
+        super().__init__(name, {"url": f"https://{name}.example/"})
+        self.fail_at_page = fail_at_page
+        self.fetched = []
+
+    def iter_listing(self, checkpoint=None):
+        for page in range(1, 4):
+            records = checkpoint.listing_page(page) if checkpoint is not None else None
+            if records is None:
+                if page == self.fail_at_page:
+                    raise requests.ConnectionError("connection reset")
+                self.fetched.append(page)
+                records = [
+                    {"event_name": f"{self.name} {page}-{slot}", "date": "2031-01-01", "url": f"https://{self.name}.example/{page}/{slot}"}
+                    for slot in range(2)
+                ]
+                if checkpoint is not None:
+                    checkpoint.record_listing_page(page, records)
+            yield from records
+
+
+def _collect(staging, adapters, resume, monkeypatch):
+    published = []
+
+    def save(staged_csv, *args, **kwargs):
+        published.append(staged_csv.read_text(encoding="utf-8-sig").splitlines()[1:])
+
+    monkeypatch.setattr(data_collection, "_save_collection_output", save)
+    checkpoint = ScrapeCheckpoint(staging, data_collection.SCRAPE_MODE_FRESH, resume=resume)
+    paths = data_collection.stream_sources(adapters, staging, now=checkpoint.started_at, checkpoint=checkpoint)
+    rows = (data_collection.clean_row(row) for row in data_collection.build_rows(data_collection.iter_staged_rows(paths)))
+    data_collection._publish_rows(rows, staging, checkpoint)
+    return checkpoint, published[0]
+
+
+def test_failed_source_resumes_from_its_journal(tmp_path, monkeypatch):
+    staging = tmp_path / "staging"
+    steady, flaky = _PagedAdapter("steady"), _PagedAdapter("flaky", fail_at_page=3)
+
+    checkpoint, published = _collect(staging, [steady, flaky], False, monkeypatch)
+    assert checkpoint.failed == ["flaky"]
+    assert len(published) == 6
+    # The failed source's journal survives the publish, so --resume has something to continue.
+    assert (staging / "flaky.journal.jsonl").exists()
+
+    flaky.fail_at_page = None
+    steady.fetched.clear()
+    flaky.fetched.clear()
+    checkpoint, published = _collect(staging, [steady, flaky], True, monkeypatch)
+    assert checkpoint.resumed and checkpoint.failed == []
+    assert steady.fetched == []
+    assert flaky.fetched == [3]
+    assert len(published) == 12
+    assert not staging.exists()
+
+
+def test_missing_listing_page_keeps_the_source_unfinished(tmp_path, monkeypatch):
+    listing = (FIXTURES / "eventbrite_listing" / "page-1.html").read_text(encoding="utf-8")
+    failures = [requests.ConnectionError("connection reset")]
+    fetched = []
+
+    def fetch(url, **kwargs):
+        fetched.append(url)
+        if "?page=2" in url and failures:
+            raise failures.pop()
+        if "/e/" in url:
+            return (FIXTURES / "eventbrite_detail" / f"{url.rsplit('/', 1)[1]}.html").read_text(encoding="utf-8")
+        return listing
+
+    monkeypatch.setattr(data_collection, "fetch_html", fetch)
+    adapters = lambda: data_collection.build_source_adapters({"eventbrite": {"url": "https://mirror.example/"}})
+
+    checkpoint, published = _collect(tmp_path / "staging", adapters(), False, monkeypatch)
+    assert checkpoint.failed == ["eventbrite"]
+    assert len(published) == 2
+
+    fetched.clear()
+    checkpoint, published = _collect(tmp_path / "staging", adapters(), True, monkeypatch)
+    assert checkpoint.failed == []
+    # Page 1 and both detail pages come from the journal; only the missing pages are fetched.
+    assert fetched == ["https://mirror.example/?page=2", "https://mirror.example/?page=3"]
+    assert len(published) == 2
@@ -0,0 +1,79 @@
+import os
+
+from scrape_http import ResponseCache, ScrapeClient
+
+NOW = 1_700_000_000.0
+
+
+def _entry(url):
+    return {"url": url, "fetched_at": NOW, "etag": None, "last_modified": None, "body": url}
+
+
+def _fill(cache, count, age_step=60.0):
+    # Entry i was last fetched i minutes before NOW.
+    for position in range(count):
+        url = f"https://example.com/{position}"
+        cache.store(url, _entry(url))
+        fetched_at = NOW - position * age_step
+        os.utime(cache._entry_path(url), (fetched_at, fetched_at))
+
+
+def _cached(cache, count):
+    return [position for position in range(count) if cache.load(f"https://example.com/{position}")]
+
+
+def test_prune_keeps_the_newest_entries(tmp_path):
+    cache = ResponseCache(tmp_path)
+    _fill(cache, 10)
+    cache.max_entries = 4
+    assert cache.prune(now=NOW) == 6
+    assert _cached(cache, 10) == [0, 1, 2, 3]
+
+
+def test_prune_drops_expired_entries(tmp_path):
+    cache = ResponseCache(tmp_path)
+    _fill(cache, 10)
+    cache.max_age_seconds = 150
+    assert cache.prune(now=NOW) == 7
+    assert _cached(cache, 10) == [0, 1, 2]
+
+
+def test_stores_prune_periodically(tmp_path, monkeypatch):
+    monkeypatch.setattr(ResponseCache, "PRUNE_EVERY_STORES", 5)
+    cache = ResponseCache(tmp_path, max_entries=3)
+    _fill(cache, 20)
+    # Bounded by max_entries plus the writes since the last prune.
+    assert len(list(tmp_path.glob("*.json"))) <= 3 + 5
+
+
+def test_unbounded_cache_is_never_pruned(tmp_path):
+    cache = ResponseCache(tmp_path)
+    _fill(cache, 150)
+    assert len(list(tmp_path.glob("*.json"))) == 150
+
+
+class _Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.headers = {}
+        self.content = b""
+
+
+class _CountingLimiter:
+    def __init__(self):
+        self.waits = []
+
+    def wait(self, url):
+        self.waits.append(url)
+        return 0.0
+
+
+def test_every_retry_waits_for_a_rate_limit_token(monkeypatch):
+    client = ScrapeClient(max_retries=3, backoff_base_seconds=0.0)
+    statuses = iter([503, 429, 200])
+    monkeypatch.setattr(client.session, "get", lambda url, **kwargs: _Response(next(statuses)))
+    limiter = _CountingLimiter()
+
+    assert client.get("https://example.com/a", limiter=limiter).status_code == 200
+    assert limiter.waits == ["https://example.com/a"] * 3
+    assert client.stats()["retries"] == 2
@@ -0,0 +1,66 @@
+import functools
+import shutil
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+import main
+from dataset_watch import DatasetWatcher
+from recommend import build_event_index
+from shared_dataset import CURRENT_FILE, load_shared_index, read_current, shared_index_is_current
+
+
+@pytest.fixture
+def published(tmp_path):
+    csv_path = tmp_path / "events.csv"
+    shutil.copyfile(main.RECOMMENDATION_SAMPLE_FILE, csv_path)
+    root = tmp_path / "shared"
+    loads = []
+
+    def load():
+        build = lambda: build_event_index(main._ensure_schema(pd.read_csv(csv_path)))
+        index = load_shared_index(root, [csv_path], build)
+        loads.append(read_current(root)["generation"])
+        return index
+
+    watcher = DatasetWatcher(
+        load,
+        [csv_path, root / CURRENT_FILE],
+        poll_seconds=0,
+        still_current=functools.partial(shared_index_is_current, root, source_paths=[csv_path]),
+    )
+    return csv_path, watcher, loads
+
+
+def _settle(watcher):
+    # A change is picked up on the second poll that sees it; poll until nothing is pending.
+    for _ in range(4):
+        watcher.poll_once()
+
+
+def test_publishing_worker_does_not_reload_its_own_generation(published):
+    csv_path, watcher, loads = published
+    watcher.current()
+    _settle(watcher)
+    assert loads == [1]
+
+    pd.read_csv(csv_path).head(10).to_csv(csv_path, index=False)
+    _settle(watcher)
+    assert loads == [1, 2]
+    assert len(watcher.current()) == 10
+
+
+def test_generation_published_elsewhere_is_attached(published, tmp_path):
+    csv_path, watcher, loads = published
+    watcher.current()
+    _settle(watcher)
+
+    # Another worker publishes a new generation for the changed CSV before this one polls.
+    pd.read_csv(csv_path).head(5).to_csv(csv_path, index=False)
+    other = build_event_index(main._ensure_schema(pd.read_csv(csv_path)))
+    load_shared_index(tmp_path / "shared", [csv_path], lambda: other)
+    _settle(watcher)
+    assert loads == [1, 2]
+    assert watcher.current().version == other.version
@@ -0,0 +1,36 @@
+import pytest
+
+import data_collection
+from config import PROJECT_ROOT
+
+FIXTURES = PROJECT_ROOT / "fixtures" / "html"
+PAGES = {
+    "pgh_events": (FIXTURES / "pgh_listing" / "page-1.html").read_text(encoding="utf-8"),
+    "eventbrite": (FIXTURES / "eventbrite_listing" / "page-1.html").read_text(encoding="utf-8"),
+}
+
+
+def test_source_adapter_requires_iter_listing():
+    with pytest.raises(TypeError):
+        data_collection.SourceAdapter("custom", {})
+
+
+@pytest.mark.parametrize("name", ["pgh_events", "eventbrite"])
+def test_listing_urls_come_from_adapter_settings(name, monkeypatch):
+    fetched = []
+
+    def fake_fetch(url, **kwargs):
+        fetched.append(url)
+        return PAGES[name]
+
+    monkeypatch.setattr(data_collection, "fetch_html", fake_fetch)
+    (adapter,) = data_collection.build_source_adapters({name: {"type": "scrape", "url": "https://mirror.example/"}})
+    records = list(adapter.iter_listing())
+
+    assert records
+    assert fetched[:2] == ["https://mirror.example/", "https://mirror.example/?page=2"]
+
+
+def test_relative_pgh_links_resolve_against_the_listing_url():
+    _, events = data_collection.parse_pgh_listing(PAGES["pgh_events"], "https://mirror.example/")
+    assert "https://mirror.example/events/strip-district-market-tour" in [event["url"] for event in events]
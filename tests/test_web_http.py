@@ -0,0 +1,34 @@
+from web_http import StaticTreeVersion
+
+
+def test_static_version_is_cached_between_checks(tmp_path, monkeypatch):
+    (tmp_path / "app.css").write_text("body {}", encoding="utf-8")
+    version = StaticTreeVersion(tmp_path, check_seconds=60)
+    first = version.current()
+    assert first
+
+    scans = []
+    monkeypatch.setattr(version, "_files", lambda: scans.append(1) or [])
+    assert version.current() == first
+    assert scans == []
+
+
+def test_static_version_follows_edits_after_the_interval(tmp_path):
+    css = tmp_path / "app.css"
+    css.write_text("body {}", encoding="utf-8")
+    version = StaticTreeVersion(tmp_path, check_seconds=60)
+    first = version.current()
+
+    css.write_text("body { color: red }", encoding="utf-8")
+    assert version.current() == first
+    version._checked_at -= 60
+    assert version.current() != first
+
+
+def test_zero_interval_scans_only_once(tmp_path):
+    css = tmp_path / "app.css"
+    css.write_text("body {}", encoding="utf-8")
+    version = StaticTreeVersion(tmp_path, check_seconds=0)
+    first = version.current()
+    css.write_text("body { color: red }", encoding="utf-8")
+    assert version.current() == first
@@ -4,8 +4,25 @@ Shared utility helpers for directory setup.
 
 from __future__ import annotations
 
-from config import DATA_DIR
+import subprocess
+
+from config import DATA_DIR, PROJECT_ROOT
 
 def ensure_project_directories() -> None:
     """Create required project directories if they do not exist."""
     DATA_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def current_git_commit() -> str | None:
+    """Short commit hash of the working tree (recorded with benchmark results), if available."""
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=PROJECT_ROOT,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip() or None
@@ -0,0 +1,110 @@
+"""
+HTTP helpers for the web app: gzip compression of HTML/JSON responses, ETag matching,
+and a content hash of the static tree used for long-lived, versioned static URLs.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import threading
+import time
+from pathlib import Path
+
+from flask import Request, Response
+
+COMPRESSIBLE_MIMETYPES = frozenset({"text/html", "application/json"})
+# Below this size gzip framing costs more than it saves.
+MIN_COMPRESS_BYTES = 500
+GZIP_LEVEL = 6
+GZIP_ETAG_SUFFIX = "-gzip"
+# Versioned static URLs change whenever any static file changes, so they can be cached "forever".
+STATIC_MAX_AGE_SECONDS = 365 * 24 * 3600
+
+
+def content_etag(*parts: object) -> str:
+    return hashlib.sha1("|".join(map(str, parts)).encode("utf-8")).hexdigest()[:20]
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    # Clients echo back the tag they were sent, which is suffixed when the body was gzipped.
+    return request.if_none_match.contains(etag) or request.if_none_match.contains(etag + GZIP_ETAG_SUFFIX)
+
+
+def not_modified(request: Request, etag: str, cache_control: str) -> Response:
+    # Echo the representation's own tag: the gzip-suffixed one if that is what the client holds.
+    if request.if_none_match.contains(etag + GZIP_ETAG_SUFFIX):
+        etag += GZIP_ETAG_SUFFIX
+    response = Response(status=304)
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = cache_control
+    return response
+
+
+def compress_response(request: Request, response: Response) -> Response:
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or response.status_code in (204, 304)
+        or response.status_code < 200
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    if not request.accept_encodings["gzip"]:
+        return response
+    body = response.get_data()
+    if len(body) < MIN_COMPRESS_BYTES:
+        return response
+
+    response.set_data(gzip.compress(body, compresslevel=GZIP_LEVEL))
+    response.headers["Content-Encoding"] = "gzip"
+    etag, weak = response.get_etag()
+    if etag:
+        # A strong ETag names exact bytes, so the gzipped representation gets its own tag.
+        response.set_etag(etag + GZIP_ETAG_SUFFIX, weak=weak)
+    return response
+
+
+class StaticTreeVersion:
+    """
+    Content hash of every file under `static_dir`, recomputed only when a file's mtime/size changes.
+    The tree is re-scanned at most once per `check_seconds`, so most renders only read the cached
+    hash; `check_seconds <= 0` scans once and never again (deployments with a fixed static tree).
+    """
+
+    def __init__(self, static_dir: Path | str, check_seconds: float = 2.0) -> None:
+        self.static_dir = Path(static_dir)
+        self.check_seconds = float(check_seconds)
+        self._signature: tuple | None = None
+        self._version = ""
+        self._checked_at: float | None = None
+        self._lock = threading.Lock()
+
+    def _files(self) -> list[Path]:
+        return sorted(
+            path
+            for path in self.static_dir.rglob("*")
+            if path.is_file() and not path.name.startswith(".")
+        )
+
+    def current(self) -> str:
+        checked_at = self._checked_at
+        if checked_at is not None and (self.check_seconds <= 0 or time.monotonic() - checked_at < self.check_seconds):
+            return self._version
+        files = self._files()
+        stats = [path.stat() for path in files]
+        signature = tuple((str(path), stat.st_mtime_ns, stat.st_size) for path, stat in zip(files, stats))
+        with self._lock:
+            if signature != self._signature:
+                digest = hashlib.sha1()
+                for path in files:
+                    digest.update(path.relative_to(self.static_dir).as_posix().encode("utf-8"))
+                    digest.update(path.read_bytes())
+                self._version = digest.hexdigest()[:12]
+                self._signature = signature
+            # Set last, so concurrent renders never see the "checked" state before the first hash.
+            self._checked_at = time.monotonic()
+            return self._version